@@ -0,0 +1,190 @@
+"""
+Offline benchmarks for the client's hot paths, run against `MockVimeoServer`.
+
+    python3 benchmarks/run.py --videos 2000 --latency 0.02 --json results.json
+
+The package has to be installed (`make pip_install_editable`).
+
+Each scenario reports its throughput and the p50/p99 latency of the HTTP
+requests it made. Save the JSON output per commit to track regressions.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import requests
+from vimeo_utils.bulk import BulkOperation
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.mock_server import MockVimeoServer
+
+
+class Recorder:
+    """Collects request latencies from every thread of a scenario."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples: list[float] = []
+
+    def add(self, seconds: float) -> None:
+        with self.lock:
+            self.samples.append(seconds)
+
+    def timed(self, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(time.perf_counter() - start)
+
+        return wrapper
+
+
+class TimedSession(requests.Session):
+    def __init__(self, recorder: Recorder):
+        super().__init__()
+        self.request = recorder.timed(self.request)
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    if len(samples) < 2:  # noqa: PLR2004
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+# ------------------------------------------------------------------------------
+# Scenarios, each returns (units of work, unit name)
+# ------------------------------------------------------------------------------
+
+
+def bench_get_all_videos(server, vclient, args, recorder):
+    videos = vclient.get_all_videos(fields=["uri", "name", "status"])
+    return len(videos), "videos"
+
+
+def bench_status_polling(server, vclient, args, recorder):
+    uris = [server.add_video(status=VideoStatus.TRANSCODING) for _ in range(args.polls)]
+    futures = vclient.wait_until_available(uris, min_interval=0.05, timeout=300)
+    for future in futures.values():
+        future.result()
+    return len(uris), "videos"
+
+
+def bench_bulk_edits(server, vclient, args, recorder):
+    uris = list(server.videos)[: args.edits]
+    operations = (
+        BulkOperation("edit_video", uri, {"name": f"Edited {i}"})
+        for i, uri in enumerate(uris)
+    )
+    results = list(vclient.bulk(operations))
+    return sum(result.ok for result in results), "edits"
+
+
+def bench_uploads(server, vclient, args, recorder):
+    from vimeo_utils.uploads import UploadManager
+
+    size = args.upload_size * 1024 * 1024
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.uploads):
+            path = Path(tmp) / f"video-{i}.mp4"
+            path.write_bytes(b"\0" * size)
+            paths.append(path)
+        manager = UploadManager(
+            vclient,
+            max_workers=3,
+            chunk_size=max(size // 4, 1),
+            session=TimedSession(recorder),
+        )
+        for future in manager.upload(paths).values():
+            future.result()
+    return args.uploads * args.upload_size, "MB"
+
+
+SCENARIOS = {
+    "get_all_videos": bench_get_all_videos,
+    "status_polling": bench_status_polling,
+    "bulk_edits": bench_bulk_edits,
+    "uploads": bench_uploads,
+}
+
+
+def run_scenario(name: str, args) -> dict:
+    recorder = Recorder()
+    with MockVimeoServer(
+        videos=args.videos,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=0,
+    ) as server:
+        vclient = VimeoAPIClient(server.client())
+        vclient.transport.request = recorder.timed(vclient.transport.request)
+        start = time.perf_counter()
+        units, unit = SCENARIOS[name](server, vclient, args, recorder)
+        elapsed = time.perf_counter() - start
+    return {
+        "scenario": name,
+        "units": units,
+        "unit": unit,
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput": round(units / elapsed, 2) if elapsed else 0,
+        "requests": len(recorder.samples),
+        "p50_ms": round(percentile(recorder.samples, 50) * 1000, 2),
+        "p99_ms": round(percentile(recorder.samples, 99) * 1000, 2),
+        "retries": vclient.retry_stats.as_dict()["retries"],
+        "connections": vclient.transport.stats()["connections"],
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        dest="scenarios",
+        help="Run only this scenario (repeatable)",
+    )
+    parser.add_argument("--videos", type=int, default=1000)
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--uploads", type=int, default=4)
+    parser.add_argument("--upload-size", type=int, default=8, help="MB per file")
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    parser.add_argument("--json", type=Path, help="Also write results here")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    results = [run_scenario(name, args) for name in args.scenarios or SCENARIOS]
+
+    header = (
+        f"{'scenario':<16}{'throughput':>18}{'requests':>10}{'p50 ms':>9}{'p99 ms':>9}"
+    )
+    sys.stdout.write(f"{header}\n{'-' * len(header)}\n")
+    for result in results:
+        throughput = f"{result['throughput']} {result['unit']}/s"
+        sys.stdout.write(
+            f"{result['scenario']:<16}{throughput:>18}{result['requests']:>10}"
+            f"{result['p50_ms']:>9}{result['p99_ms']:>9}\n"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,13 @@
-from .client import VimeoAPIClient  # noqa: F401
-
 __version__ = "0.1.0"
+
+__all__ = ["VimeoAPIClient"]
+
+
+def __getattr__(name):
+    # Imported on first use so `vimeo_utils.cli` starts without pyvimeo/requests
+    if name == "VimeoAPIClient":
+        from .client import VimeoAPIClient
+
+        return VimeoAPIClient
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1 @@
+from .client import AsyncVimeoAPIClient  # noqa: F401
@@ -0,0 +1,18 @@
+from requests import Response
+
+
+class AsyncEmbedPresetMixin:
+    """
+    Async counterpart of `vimeo_utils.mixins.embed_presets.EmbedPresetMixin`.
+    """
+
+    # --------------------------------------------------------------------------
+    # Essentials
+    # --------------------------------------------------------------------------
+
+    async def edit_embed_preset(self, vimeo_uri: str, preset_id: int) -> Response:
+        """Edit the embed preset."""
+        uri = f"{vimeo_uri}/presets/{preset_id}"
+        response = await self.transport.put(uri)
+        response.raise_for_status()
+        return response
@@ -0,0 +1,123 @@
+from typing import Optional
+
+from requests import Response
+
+from vimeo_utils.fields import Fields
+
+
+class AsyncProjectMixin:
+    """
+    Async counterpart of `vimeo_utils.mixins.projects.ProjectMixin`.
+    """
+
+    # --------------------------------------------------------------------------
+    # Essentials
+    # --------------------------------------------------------------------------
+
+    async def create_project(
+        self,
+        name: str,
+        parent_folder_uri: Optional[str] = None,  # noqa: UP007
+        fields: Fields = None,
+    ) -> Response:
+        """Create a new project."""
+        data = {"name": name, "parent_folder_uri": parent_folder_uri}
+        fields = self.resolve_fields("project", fields)
+        params = {"fields": ",".join(fields)} if fields else {}
+        response = await self.transport.post(
+            f"{self.base_uri}/projects", data=data, params=params
+        )
+        response.raise_for_status()
+        return response
+
+    async def get_project(
+        self,
+        project_id: int,
+        fields: Fields = None,
+    ) -> Response:
+        """Return a project with sane defaults."""
+        fields = self.resolve_fields("project", fields)
+        params = {"fields": ",".join(fields)} if fields else {}
+        response = await self.transport.get(
+            f"{self.base_uri}/projects/{project_id}", params=params
+        )
+        response.raise_for_status()
+        return response
+
+    async def edit_project(self, project_id: int, name: str) -> Response:
+        """Edit a project."""
+        data = {"name": name}
+        response = await self.transport.patch(
+            f"{self.base_uri}/projects/{project_id}", data=data
+        )
+        response.raise_for_status()
+        return response
+
+    async def delete_project(
+        self, project_id: int, should_delete_clips: bool = False
+    ) -> Response:
+        """Delete a project."""
+        params = {"should_delete_clips": should_delete_clips}
+        response = await self.transport.delete(
+            f"{self.base_uri}/projects/{project_id}", params=params
+        )
+        response.raise_for_status()
+        return response
+
+    async def get_projects(
+        self,
+        page: int = 1,
+        fields: Fields = None,
+        per_page: int = 100,
+        params: Optional[dict] = None,  # noqa: UP007
+    ) -> Response:
+        """Returns a single page of folders belonging to the authenticated user."""
+        fields = self.resolve_fields("project", fields)
+        params = {
+            **(params or {}),
+            "fields": ",".join(fields),
+            "page": page,
+            "per_page": per_page,
+        }
+        response = await self.transport.get(f"{self.base_uri}/projects", params=params)
+        response.raise_for_status()
+        return response
+
+    async def get_all_projects(
+        self,
+        params: Optional[dict] = None,  # noqa: UP007
+        fields: Fields = None,
+        per_page: int = 100,
+    ) -> list[dict]:
+        """Returns all folders belonging to the authenticated user."""
+        return await self.paginate(
+            f"{self.base_uri}/projects",
+            params=params,
+            fields=self.resolve_fields("project", fields),
+            per_page=per_page,
+        )
+
+    # --------------------------------------------------------------------------
+    # Videos
+    # --------------------------------------------------------------------------
+
+    async def move_to_project(self, project_id: int, video_uri: str) -> Response:
+        """Move a video to a project."""
+        response = await self.transport.put(
+            f"{self.base_uri}/projects/{project_id}{video_uri}"
+        )
+        response.raise_for_status()
+        return response
+
+    async def get_videos_from_project(
+        self,
+        project_id: int,
+        fields: Fields = None,
+        per_page: int = 100,
+    ) -> list[dict]:
+        """Returns all videos in a project."""
+        return await self.paginate(
+            f"{self.base_uri}/folders/{project_id}/videos",
+            fields=self.resolve_fields("video_list", fields),
+            per_page=per_page,
+        )
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from requests import Response
+
+from vimeo_utils.fields import Fields
+
+
+class AsyncUserMixin:
+    """
+    Async counterpart of `vimeo_utils.mixins.user.UserMixin`.
+    """
+
+    # --------------------------------------------------------------------------
+    # Essentials
+    # --------------------------------------------------------------------------
+
+    async def get_user(self, fields: Fields = None) -> Response:
+        """Get user info with sane field defaults."""
+        fields = self.resolve_fields("user", fields)
+        params = {"fields": ",".join(fields)} if fields else {}
+
+        response = await self.transport.get(f"{self.base_uri}", params=params)
+        response.raise_for_status()
+        return response
+
+    async def edit_user(self, data: Optional[dict]) -> Response:  # noqa: UP007
+        """Edit user."""
+        response = await self.transport.patch(f"{self.base_uri}", data=data)
+        response.raise_for_status()
+        return response
@@ -0,0 +1,197 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Optional
+
+from requests import Response
+
+from vimeo_utils.constants import BATCH_SIZE
+from vimeo_utils.constants import TranscodeStatus
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.exceptions import TranscodingError
+from vimeo_utils.fields import Fields
+from vimeo_utils.utils import select_download_link
+
+
+class AsyncVideoMixin:
+    """
+    Async counterpart of `vimeo_utils.mixins.videos.VideoMixin`.
+    """
+
+    # --------------------------------------------------------------------------
+    # Essentials
+    # --------------------------------------------------------------------------
+
+    async def upload_video(self, video_file: str, params: dict) -> str:
+        """Upload a video. The tus upload itself runs in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, lambda: self.client.upload(video_file, data=params)
+        )
+
+    async def get_video(
+        self,
+        vimeo_uri: str,
+        fields: Fields = None,
+    ) -> Response:
+        """Return a video info with sane defaults."""
+        fields = self.resolve_fields("video", fields)
+        params = {"fields": ",".join(fields)} if fields else {}
+        response = await self.transport.get(vimeo_uri, params=params)
+        response.raise_for_status()
+        return response
+
+    async def edit_video(self, vimeo_uri: str, params: dict) -> Response:
+        """Edit a video."""
+        response = await self.transport.patch(vimeo_uri, data=params)
+        response.raise_for_status()
+        return response
+
+    async def delete_video(self, vimeo_uri: str) -> Response:
+        """Delete a video."""
+        response = await self.transport.delete(vimeo_uri)
+        response.raise_for_status()
+        return response
+
+    async def get_videos(
+        self,
+        page: int = 1,
+        fields: Fields = None,
+        per_page: int = 100,
+    ) -> Response:
+        """Get single page of videos, 100 max."""
+        fields = self.resolve_fields("video_list", fields)
+        params = {
+            "fields": ",".join(fields),
+            "page": page,
+            "per_page": per_page,
+        }
+        response = await self.transport.get(
+            f"{self.base_uri}/videos", params=params, timeout=60
+        )
+        response.raise_for_status()
+        return response
+
+    # --------------------------------------------------------------------------
+    # Helpers
+    # --------------------------------------------------------------------------
+
+    async def get_all_videos(
+        self,
+        fields: Fields = None,
+        per_page: int = 100,
+    ) -> list[dict]:
+        """
+        Get all videos. Remaining pages are fetched concurrently, bounded by
+        the transport's `max_concurrency`.
+        """
+        return await self.paginate(
+            f"{self.base_uri}/videos",
+            fields=self.resolve_fields("video_list", fields),
+            per_page=per_page,
+        )
+
+    def iter_all_videos(
+        self,
+        fields: Fields = None,
+        per_page: int = 100,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream all videos with `async for`, a page at a time, instead of
+        collecting them into one list.
+        """
+        return self.iter_items(
+            f"{self.base_uri}/videos",
+            fields=self.resolve_fields("video_list", fields),
+            per_page=per_page,
+        )
+
+    async def get_videos_by_uris(
+        self,
+        vimeo_uris: list[str],
+        fields: Fields = None,
+    ) -> dict[str, dict]:
+        """
+        Fetch many videos with concurrent `uris`-filtered list requests, 100
+        URIs each. Returns them keyed by URI; missing videos are left out.
+        """
+        uris = list(dict.fromkeys(vimeo_uris))
+        fields = self.resolve_fields("video_list", fields)
+        if "uri" not in fields:
+            fields = ["uri", *fields]
+
+        async def fetch(chunk: list[str]) -> list[dict]:
+            params = {
+                "uris": ",".join(chunk),
+                "fields": ",".join(fields),
+                "per_page": BATCH_SIZE,
+            }
+            response = await self.transport.get("/videos", params=params)
+            response.raise_for_status()
+            return response.json()["data"]
+
+        pages = await asyncio.gather(
+            *(fetch(uris[i : i + BATCH_SIZE]) for i in range(0, len(uris), BATCH_SIZE))
+        )
+        found = {video["uri"]: video for page in pages for video in page}
+        return {uri: found[uri] for uri in uris if uri in found}
+
+    async def get_download_links(
+        self, vimeo_uris: list[str]
+    ) -> dict[str, Optional[str]]:  # noqa: UP007
+        """Get the download link of many videos at once. HD is priority."""
+        videos = await self.get_videos_by_uris(vimeo_uris, fields=["uri", "download"])
+        return {
+            uri: select_download_link(video.get("download") or [])
+            for uri, video in videos.items()
+        }
+
+    async def get_download_link(self, vimeo_uri: str) -> Optional[str]:  # noqa: UP007
+        """Get download link. HD is priority."""
+        response = await self.get_video(vimeo_uri, fields=["download"])
+        return select_download_link(response.json().get("download") or [])
+
+    async def get_status(self, vimeo_uri: str) -> str:
+        """Get video status."""
+        response = await self.get_video(vimeo_uri, fields=["status"])
+        return response.json()["status"]
+
+    async def get_transcode_status(self, vimeo_uri: str) -> str:
+        """Get video transcode status."""
+        response = await self.get_video(vimeo_uri, fields=["transcode"])
+        return response.json()["transcode"]["status"]
+
+    async def is_available(self, vimeo_uri) -> bool:
+        return await self.get_status(vimeo_uri) == VideoStatus.AVAILABLE
+
+    async def is_transcode_complete(self, vimeo_uri: str) -> bool:
+        return await self.get_transcode_status(vimeo_uri) == TranscodeStatus.COMPLETE
+
+    async def is_playable(self, vimeo_uri: str) -> bool:
+        response = await self.get_video(vimeo_uri, fields=["is_playable"])
+        return response.json()["is_playable"]
+
+    async def block_until_available(self, vimeo_uri: str, interval: int = 30) -> None:
+        """Waits until video is available without blocking the event loop."""
+        error_statuses = {
+            VideoStatus.TRANSCODING_ERROR,
+            VideoStatus.UPLOADING_ERROR,
+        }
+        while True:
+            status = await self.get_status(vimeo_uri)
+            if status == VideoStatus.AVAILABLE:
+                return
+            if status in error_statuses:
+                msg = "Transcoding/Uploading error"
+                raise TranscodingError(msg)
+            await asyncio.sleep(interval)
+
+    # --------------------------------------------------------------------------
+    # Embed privacy
+    # --------------------------------------------------------------------------
+
+    async def add_domain_to_whitelist(self, vimeo_uri: str, domain: str) -> Response:
+        """Add domain to whitelist."""
+        uri = f"{vimeo_uri}/privacy/domains/{domain}"
+        response = await self.transport.put(uri)
+        response.raise_for_status()
+        return response
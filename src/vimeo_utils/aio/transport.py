@@ -0,0 +1,109 @@
+import asyncio
+import io
+import json
+from typing import Optional
+
+import aiohttp
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+API_ROOT = "https://api.vimeo.com"
+ACCEPT_HEADER = "application/vnd.vimeo.*;version=3.4"
+USER_AGENT = "python-vimeo-utils (aiohttp)"
+
+
+class AsyncTransport:
+    """
+    Pooled aiohttp transport which speaks the same dialect as `vimeo.VimeoClient`.
+
+    A single `aiohttp.ClientSession` is shared by every call so connections are
+    kept alive and reused, and a semaphore bounds how many requests may be in
+    flight at once. Responses are returned as fully read `requests.Response`
+    objects so callers can use `raise_for_status()` and `json()` as usual.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        token: str,
+        api_root: str = API_ROOT,
+        max_connections: int = 100,
+        max_concurrency: int = 10,
+        timeout: float = 30,
+    ):
+        self.token = token
+        self.api_root = api_root.rstrip("/")
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None  # noqa: UP007
+        self._semaphore: Optional[asyncio.Semaphore] = None  # noqa: UP007
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Lazily create the session so it binds to the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Accept": ACCEPT_HEADER,
+                    "Authorization": f"Bearer {self.token}",
+                    "User-Agent": USER_AGENT,
+                },
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,  # noqa: UP007
+        data: Optional[dict] = None,  # noqa: UP007
+        timeout: Optional[float] = None,  # noqa: UP007
+    ) -> Response:
+        """Perform a request and return a fully read `requests.Response`."""
+        if not url.startswith("http"):
+            url = f"{self.api_root}{url}"
+
+        kwargs = {
+            "params": {k: str(v) for k, v in (params or {}).items()},
+            "timeout": aiohttp.ClientTimeout(total=timeout or self.timeout),
+        }
+        if isinstance(data, (dict, list)):  # noqa: UP038
+            kwargs["data"] = json.dumps(data)
+            kwargs["headers"] = {"Content-Type": "application/json"}
+
+        session = self.session
+        async with self._semaphore, session.request(method, url, **kwargs) as resp:
+            body = await resp.read()
+
+        response = Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.url = str(resp.url)
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.encoding = resp.charset or "utf-8"
+        response.raw = io.BytesIO(body)
+        return response
+
+    async def get(self, url: str, **kwargs) -> Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the underlying session and its connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,213 @@
+import concurrent.futures
+import json
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from vimeo_utils import deadline
+
+# Client methods a bulk run may call
+BULK_METHODS = frozenset(
+    {
+        "add_domain_to_whitelist",
+        "delete_video",
+        "edit_embed_preset",
+        "edit_project",
+        "edit_video",
+        "move_to_project",
+    }
+)
+
+
+class BulkOperation:
+    """
+    One call of a `VimeoAPIClient` mutation, e.g.
+    `BulkOperation("edit_video", "/videos/1", {"name": "New"})`.
+
+    `key` identifies the operation in checkpoints; it defaults to the
+    method and its arguments.
+    """
+
+    def __init__(self, method: str, *args, key: Optional[str] = None, **kwargs):  # noqa: UP007
+        if method not in BULK_METHODS:
+            msg = f"Unsupported bulk method: {method}"
+            raise ValueError(msg)
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key or json.dumps(
+            [method, args, kwargs], sort_keys=True, default=str
+        )
+
+    def __repr__(self):
+        return f"<BulkOperation {self.key}>"
+
+
+class BulkResult:
+    """The outcome of a single operation."""
+
+    def __init__(
+        self,
+        operation: BulkOperation,
+        result: Any = None,
+        error: Optional[Exception] = None,  # noqa: UP007
+        elapsed: float = 0.0,
+    ):
+        self.operation = operation
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return f"<BulkResult {self.operation.key} ok={self.ok}>"
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkExecutor:
+    """
+    Runs operations with at most `max_workers` in flight, under the client's
+    rate limit scheduler, and yields a `BulkResult` per operation as it
+    completes. Failures are reported, not raised.
+
+    Operations which succeed are appended to `checkpoint_path`; running the
+    same operations again skips them. When the run ends (or is abandoned) a
+    summary is written to `report_path` and kept on `summary`.
+    """
+
+    def __init__(
+        self,
+        vclient,
+        max_workers: Optional[int] = None,  # noqa: UP007
+        checkpoint_path: Union[str, Path, None] = None,  # noqa: UP007
+        report_path: Union[str, Path, None] = None,  # noqa: UP007
+    ):
+        self.vclient = vclient
+        self.max_workers = max_workers or vclient.scheduler.max_concurrency
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.report_path = Path(report_path) if report_path else None
+        self.summary: dict = {}
+
+    def load_checkpoint(self) -> set:
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return set()
+        with self.checkpoint_path.open() as fh:
+            return {line.rstrip("\n") for line in fh if line.strip()}
+
+    def run(self, operations: Iterable[BulkOperation]) -> Iterator[BulkResult]:
+        start = time.monotonic()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            run = _Run(
+                operations,
+                self.load_checkpoint(),
+                self.checkpoint_path,
+                lambda operation: deadline.submit(executor, self.execute, operation),
+            )
+            try:
+                # Keep the window full without reading every operation upfront
+                while len(run.pending) < self.max_workers * 2 and run.submit_next():
+                    pass
+                while run.pending:
+                    for future in self._wait_some(run.pending):
+                        run.pending.remove(future)
+                        result = future.result()
+                        run.record(result)
+                        run.submit_next()
+                        yield result
+            finally:
+                run.close()
+                self.write_summary(run.counts, run.errors, time.monotonic() - start)
+
+    @staticmethod
+    def _wait_some(pending: set) -> set:
+        """Wait for some of `pending` to finish, raising once the deadline ends."""
+        while True:
+            # Stop queueing work as soon as the caller's deadline ends
+            deadline.check()
+            finished, _ = concurrent.futures.wait(
+                pending,
+                timeout=deadline.wait_timeout(),
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            if finished:
+                return finished
+
+    def execute(self, operation: BulkOperation) -> BulkResult:
+        start = time.monotonic()
+        try:
+            method = getattr(self.vclient, operation.method)
+            result = method(*operation.args, **operation.kwargs)
+            if isinstance(result, concurrent.futures.Future):
+                # Buffered write, wait for the request it was merged into
+                result = result.result()
+        except Exception as error:  # noqa: BLE001
+            return BulkResult(operation, error=error, elapsed=time.monotonic() - start)
+        return BulkResult(operation, result=result, elapsed=time.monotonic() - start)
+
+    def write_summary(self, counts: dict, errors: dict, elapsed: float) -> None:
+        processed = counts["succeeded"] + counts["failed"]
+        self.summary = {
+            **counts,
+            "processed": processed,
+            "elapsed_seconds": round(elapsed, 3),
+            "operations_per_second": round(processed / elapsed, 3) if elapsed else 0,
+            "errors": errors,
+            "retries": self.vclient.retry_stats.as_dict(),
+        }
+        if self.report_path is not None:
+            self.report_path.write_text(json.dumps(self.summary, indent=2))
+
+
+class _Run:
+    """Progress of a single `BulkExecutor.run()`."""
+
+    def __init__(
+        self,
+        operations: Iterable[BulkOperation],
+        done: set,
+        checkpoint_path: Optional[Path],  # noqa: UP007
+        submit: Callable[[BulkOperation], concurrent.futures.Future],
+    ):
+        self.operations = iter(operations)
+        self.done = done
+        self.submit = submit
+        self.pending: set = set()
+        self.counts = {"succeeded": 0, "failed": 0, "skipped": 0}
+        self.errors: dict = {}
+        self.checkpoint = checkpoint_path.open("a") if checkpoint_path else None
+
+    def submit_next(self) -> bool:
+        """Start the next operation not done yet, `False` once there are none."""
+        for operation in self.operations:
+            if operation.key in self.done:
+                self.counts["skipped"] += 1
+                continue
+            self.pending.add(self.submit(operation))
+            return True
+        return False
+
+    def record(self, result: BulkResult) -> None:
+        if result.ok:
+            self.counts["succeeded"] += 1
+            if self.checkpoint is not None:
+                self.checkpoint.write(f"{result.operation.key}\n")
+                self.checkpoint.flush()
+        else:
+            self.counts["failed"] += 1
+            name = type(result.error).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def close(self) -> None:
+        for future in self.pending:
+            future.cancel()
+        if self.checkpoint is not None:
+            self.checkpoint.close()
@@ -0,0 +1,183 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Optional
+
+from requests import Response
+
+NOT_MODIFIED = 304
+
+DEFAULT_TTLS = {
+    "users": 600,
+    "projects": 300,
+    "videos": 60,
+}
+
+VIDEO_URI_RE = re.compile(r"/videos/\d+")
+
+
+def resource_type(uri: str) -> str:
+    """Return the kind of resource a URI points at (`videos`, `projects`...)."""
+    segments = [segment for segment in uri.split("?")[0].split("/") if segment]
+    if segments[:1] == ["me"]:
+        segments = segments[1:]
+    elif segments[:1] == ["users"]:
+        segments = segments[2:]
+    for segment in reversed(segments):
+        if not segment.isdigit():
+            return "folders" if segment == "folders" else segment
+    return "users"
+
+
+class CachedResponse(Response):
+    """A response whose parsed body is kept, so cache hits skip parsing."""
+
+    @classmethod
+    def from_response(cls, response: Response) -> "CachedResponse":
+        cached = cls()
+        response.content  # noqa: B018 - make sure the body is read
+        for attr in response.__attrs__:
+            setattr(cached, attr, getattr(response, attr))
+        return cached
+
+    def json(self, **kwargs):
+        if kwargs:
+            return super().json(**kwargs)
+        if not hasattr(self, "_parsed"):
+            self._parsed = super().json()
+        return self._parsed
+
+
+class CacheEntry:
+    def __init__(self, response: CachedResponse, ttl: float):
+        self.response = response
+        self.etag = response.headers.get("ETag")
+        self.size = len(response.content or b"")
+        self.expires_at = time.monotonic() + ttl
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """
+    TTL/LRU cache for GET responses, keyed by URI and query params
+    (including `fields`).
+
+    Expired entries with an ETag are revalidated with `If-None-Match`, so a
+    304 reuses the stored body without transferring or parsing it again.
+    Entries are evicted least recently used first once `max_entries` or
+    `max_bytes` is exceeded. Cached bodies are shared, treat them as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttls: Optional[dict] = None,  # noqa: UP007
+        default_ttl: float = 60,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(uri: str, params: Optional[dict] = None) -> tuple:  # noqa: UP007
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        return (uri, tuple(items))
+
+    def ttl(self, uri: str) -> float:
+        return self.ttls.get(resource_type(uri), self.default_ttl)
+
+    def fetch(self, uri: str, kwargs: dict, send: Callable[..., Response]) -> Response:
+        """Serve a GET from the cache, revalidating or fetching through `send`."""
+        key = self.key(uri, kwargs.get("params"))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.fresh:
+                    self.hits += 1
+                    return entry.response
+
+        if entry is not None and entry.etag:
+            headers = {**kwargs.get("headers", {}), "If-None-Match": entry.etag}
+            kwargs = {**kwargs, "headers": headers}
+
+        response = send(**kwargs)
+        if response.status_code == NOT_MODIFIED and entry is not None:
+            with self._lock:
+                self.revalidations += 1
+                entry.expires_at = time.monotonic() + self.ttl(uri)
+            return entry.response
+
+        with self._lock:
+            self.misses += 1
+        if response.ok:
+            response = CachedResponse.from_response(response)
+            self.store(key, response)
+        return response
+
+    def store(self, key: tuple, response: CachedResponse) -> None:
+        entry = CacheEntry(response, self.ttl(key[0]))
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old.size
+            self._entries[key] = entry
+            self.size += entry.size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+                self.evictions += 1
+
+    def invalidate(self, uri: str) -> None:
+        """Drop every entry a write to `uri` may have made stale."""
+        path = uri.split("?")[0].rstrip("/")
+        prefixes = {path, *VIDEO_URI_RE.findall(path)}
+        exact = set(prefixes)
+        parts = path.split("/")
+        exact.update("/".join(parts[:i]) for i in range(2, len(parts)))
+        touches_video = bool(VIDEO_URI_RE.search(path))
+        with self._lock:
+            for key in list(self._entries):
+                cached = key[0]
+                if (
+                    cached in exact
+                    or any(cached.startswith(f"{prefix}/") for prefix in prefixes)
+                    or (touches_video and cached.endswith("/videos"))
+                ):
+                    self.size -= self._entries.pop(key).size
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
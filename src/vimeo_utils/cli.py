@@ -0,0 +1,304 @@
+"""
+`vimeo-utils`: list, wait for, edit, upload, download and export videos from the shell.
+
+Results are written to stdout as NDJSON, one object per line, as soon as
+they are known. Commands taking URIs or paths read them from the arguments
+or, when there are none (or `-`), one per line from stdin. Heavy modules
+are imported by the command which needs them, so startup stays fast.
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+DEFAULT_VIDEO_FIELDS = "uri,name,created_time,status"
+DEFAULT_PROJECT_FIELDS = "uri,name"
+
+
+def emit(record: Any) -> None:
+    sys.stdout.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+    sys.stdout.flush()
+
+
+def read_inputs(values: list[str]) -> Iterator[str]:
+    """The arguments, or the non-empty lines of stdin."""
+    if values and values != ["-"]:
+        yield from values
+        return
+    for line in sys.stdin:
+        line = line.strip()  # noqa: PLW2901
+        if line:
+            yield line
+
+
+def parse_fields(value: str) -> list[str]:
+    return [field.strip() for field in value.split(",") if field.strip()]
+
+
+def build_client(args: argparse.Namespace):
+    import vimeo
+
+    from vimeo_utils.client import VimeoAPIClient
+    from vimeo_utils.ratelimit import RateLimitScheduler
+
+    if not args.token:
+        msg = "A token is required: pass --token or set VIMEO_ACCESS_TOKEN"
+        raise SystemExit(msg)
+    client = vimeo.VimeoClient(token=args.token, key=args.key, secret=args.secret)
+    if args.api_root:
+        client.API_ROOT = args.api_root.rstrip("/")
+    return VimeoAPIClient(
+        client,
+        user_id=args.user_id,
+        scheduler=RateLimitScheduler(max_concurrency=args.concurrency),
+    )
+
+
+def error_record(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+# ------------------------------------------------------------------------------
+# Commands
+# ------------------------------------------------------------------------------
+
+
+def list_videos(vclient, args: argparse.Namespace) -> int:
+    for video in vclient.iter_all_videos(
+        fields=parse_fields(args.fields), per_page=args.per_page, ordered=False
+    ):
+        emit(video)
+    return 0
+
+
+def list_projects(vclient, args: argparse.Namespace) -> int:
+    for project in vclient.iter_all_projects(
+        fields=parse_fields(args.fields), per_page=args.per_page, ordered=False
+    ):
+        emit(project)
+    return 0
+
+
+def wait(vclient, args: argparse.Namespace) -> int:
+    import concurrent.futures
+
+    futures = vclient.wait_until_available(
+        read_inputs(args.uris),
+        timeout=args.timeout,
+        min_interval=args.interval,
+    )
+    uris = {future: uri for uri, future in futures.items()}
+    failed = 0
+    for future in concurrent.futures.as_completed(uris):
+        try:
+            video = future.result()
+        except Exception as error:  # noqa: BLE001
+            failed += 1
+            emit({"uri": uris[future], "ok": False, "error": error_record(error)})
+        else:
+            emit({"uri": uris[future], "ok": True, "status": video.get("status")})
+    return 1 if failed else 0
+
+
+def bulk_edit(vclient, args: argparse.Namespace) -> int:
+    from vimeo_utils.bulk import BulkOperation
+
+    data = json.loads(args.data) if args.data else None
+
+    def operations():
+        for line in read_inputs(args.uris):
+            if line.startswith("{"):
+                # {"uri": "/videos/1", "data": {...}}, merged over --data
+                item = json.loads(line)
+                payload = {**(data or {}), **item.get("data", {})}
+                yield BulkOperation("edit_video", item["uri"], payload)
+            elif data is None:
+                msg = f"No --data to apply to {line}"
+                raise SystemExit(msg)
+            else:
+                yield BulkOperation("edit_video", line, data)
+
+    failed = 0
+    for result in vclient.bulk(
+        operations(),
+        max_workers=args.concurrency,
+        checkpoint_path=args.checkpoint,
+    ):
+        record = {"uri": result.operation.args[0], "ok": result.ok}
+        if result.ok:
+            record["status"] = result.result.status_code
+        else:
+            failed += 1
+            record["error"] = error_record(result.error)
+        emit(record)
+    return 1 if failed else 0
+
+
+def upload(vclient, args: argparse.Namespace) -> int:
+    import concurrent.futures
+
+    params = json.loads(args.data) if args.data else None
+    dedup = None
+    if args.dedup:
+        from vimeo_utils.dedup import UploadIndex
+
+        dedup = UploadIndex(args.dedup)
+    futures = vclient.upload_videos(
+        list(read_inputs(args.files)),
+        params,
+        max_workers=args.concurrency,
+        state_path=args.state,
+        dedup=dedup,
+    )
+    files = {future: path for path, future in futures.items()}
+    failed = 0
+    for future in concurrent.futures.as_completed(files):
+        try:
+            emit({"file": files[future], "ok": True, "uri": future.result()})
+        except Exception as error:  # noqa: BLE001
+            failed += 1
+            emit({"file": files[future], "ok": False, "error": error_record(error)})
+    return 1 if failed else 0
+
+
+def download(vclient, args: argparse.Namespace) -> int:
+    import concurrent.futures
+    from pathlib import Path
+
+    output = Path(args.output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    videos = {}
+    for line in read_inputs(args.uris):
+        # "/videos/1" or "/videos/1<TAB>path/to/file.mp4"
+        uri, _, path = line.partition("\t")
+        videos[uri] = path or str(output / f"{uri.rstrip('/').rsplit('/', 1)[-1]}.mp4")
+
+    futures = vclient.download_videos(
+        videos, max_workers=args.concurrency, connections=args.connections
+    )
+    uris = {future: uri for uri, future in futures.items()}
+    failed = 0
+    for future in concurrent.futures.as_completed(uris):
+        try:
+            emit({"uri": uris[future], "ok": True, "path": future.result()})
+        except Exception as error:  # noqa: BLE001
+            failed += 1
+            emit({"uri": uris[future], "ok": False, "error": error_record(error)})
+    return 1 if failed else 0
+
+
+def export(vclient, args: argparse.Namespace) -> int:
+    emit(
+        vclient.export_videos(
+            args.path,
+            parse_fields(args.fields),
+            format=args.format,
+            checkpoint_path=args.checkpoint,
+            per_page=args.per_page,
+        )
+    )
+    return 0
+
+
+# ------------------------------------------------------------------------------
+# Arguments
+# ------------------------------------------------------------------------------
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="vimeo-utils",
+        description="Bulk Vimeo operations with NDJSON output.",
+    )
+    env = os.environ.get
+    parser.add_argument("--token", default=env("VIMEO_ACCESS_TOKEN"))
+    parser.add_argument("--key", default=env("VIMEO_CLIENT_ID"))
+    parser.add_argument("--secret", default=env("VIMEO_CLIENT_SECRET"))
+    parser.add_argument("--user-id", type=int, help="defaults to the token's user")
+    parser.add_argument(
+        "--api-root", default=env("VIMEO_API_ROOT"), help="e.g. a proxy or mock server"
+    )
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=6, help="requests in flight"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("list-videos", help="stream every video")
+    command.add_argument("--fields", default=DEFAULT_VIDEO_FIELDS)
+    command.add_argument("--per-page", type=int, default=100)
+    command.set_defaults(handler=list_videos)
+
+    command = commands.add_parser("list-projects", help="stream every folder")
+    command.add_argument("--fields", default=DEFAULT_PROJECT_FIELDS)
+    command.add_argument("--per-page", type=int, default=100)
+    command.set_defaults(handler=list_projects)
+
+    command = commands.add_parser("wait", help="wait for videos to be available")
+    command.add_argument("uris", nargs="*")
+    command.add_argument("--timeout", type=float, help="seconds for the whole batch")
+    command.add_argument("--interval", type=float, default=5, help="minimum poll")
+    command.set_defaults(handler=wait)
+
+    command = commands.add_parser(
+        "bulk-edit",
+        help="edit videos",
+        description="Input lines are URIs (edited with --data) or JSON objects "
+        'like {"uri": "/videos/1", "data": {"name": "New"}}.',
+    )
+    command.add_argument("uris", nargs="*")
+    command.add_argument("--data", help="JSON payload for every video")
+    command.add_argument("--checkpoint", help="skip edits recorded here")
+    command.set_defaults(handler=bulk_edit)
+
+    command = commands.add_parser("upload", help="upload video files")
+    command.add_argument("files", nargs="*")
+    command.add_argument("--data", help="JSON metadata for every video")
+    command.add_argument("--state", help="resume state file")
+    command.add_argument("--dedup", help="index of uploaded content, skips repeats")
+    command.set_defaults(handler=upload)
+
+    command = commands.add_parser(
+        "download",
+        help="download videos",
+        description="Input lines are URIs, optionally followed by a tab and a path.",
+    )
+    command.add_argument("uris", nargs="*")
+    command.add_argument("-o", "--output-dir", default=".")
+    command.add_argument("--connections", type=int, default=4, help="per file")
+    command.set_defaults(handler=download)
+
+    command = commands.add_parser(
+        "export",
+        help="write every video to a file",
+        description="The format and gzip compression follow the file name, "
+        "e.g. videos.ndjson.gz, videos.csv or videos.parquet.",
+    )
+    command.add_argument("path")
+    command.add_argument("--fields", default=DEFAULT_VIDEO_FIELDS)
+    command.add_argument("--format", choices=["ndjson", "csv", "parquet"])
+    command.add_argument("--checkpoint", help="resume state file")
+    command.add_argument("--per-page", type=int, default=100)
+    command.set_defaults(handler=export)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    vclient = build_client(args)
+    try:
+        return args.handler(vclient, args)
+    except BrokenPipeError:
+        # Output piped into `head` and friends; don't fail flushing at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        vclient.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,307 @@
+import contextlib
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
 from typing import Optional
+from typing import Union
 
 import vimeo
+from requests import Response
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+from vimeo.exceptions import APIRateLimitExceededFailure
 
+from . import deadline
+from .bulk import BulkExecutor
+from .bulk import BulkOperation
+from .bulk import BulkResult
+from .cache import ResponseCache
+from .exceptions import CircuitOpenError
+from .fields import FieldPresets
+from .fields import Fields
+from .fields import FieldUsage
+from .instrumentation import Instrumentation
+from .instrumentation import RequestInfo
 from .mixins.embed_presets import EmbedPresetMixin
 from .mixins.projects import ProjectMixin
 from .mixins.user import UserMixin
 from .mixins.videos import VideoMixin
+from .pagination import Paginator
+from .ratelimit import RateLimitScheduler
+from .retry import CircuitBreaker
+from .retry import RetryPolicy
+from .retry import RetryStats
+from .retry import parse_retry_after
+from .singleflight import SingleFlight
+from .transport import DEFAULT_TIMEOUT
+from .transport import VimeoTransport
 from .utils import build_user_uri
+from .write_buffer import WriteBuffer
+
+TOO_MANY_REQUESTS = 429
+SERVER_ERROR = 500
 
 
 class VimeoAPIClient(UserMixin, VideoMixin, ProjectMixin, EmbedPresetMixin):
     """A wrapper around the Vimeo client."""
 
-    def __init__(self, client: vimeo.VimeoClient, user_id: Optional[int] = None):  # noqa: UP007
+    def __init__(  # noqa: PLR0913
+        self,
+        client: vimeo.VimeoClient,
+        user_id: Optional[int] = None,  # noqa: UP007
+        scheduler: Optional[RateLimitScheduler] = None,  # noqa: UP007
+        retry_policy: Optional[RetryPolicy] = None,  # noqa: UP007
+        circuit_breaker: Optional[CircuitBreaker] = None,  # noqa: UP007
+        cache: Optional[ResponseCache] = None,  # noqa: UP007
+        instrumentation: Optional[Instrumentation] = None,  # noqa: UP007
+        transport: Optional[VimeoTransport] = None,  # noqa: UP007
+        timeout: Union[float, tuple] = DEFAULT_TIMEOUT,  # noqa: UP007
+        write_buffer: Optional[WriteBuffer] = None,  # noqa: UP007
+        field_presets: Optional[FieldPresets] = None,  # noqa: UP007
+        field_usage: Optional[FieldUsage] = None,  # noqa: UP007
+    ):
         self.client = client
         self.user_id = user_id
         self.base_uri = build_user_uri(user_id)
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.retry_stats = RetryStats()
+        self.singleflight = SingleFlight()
+        self.cache = cache
+        self.instrumentation = instrumentation
+        self.timeout = timeout
+        self.field_presets = field_presets or FieldPresets()
+        # With field usage, the fields read from get_video() etc. are recorded
+        self.field_usage = field_usage
+        # Other clients (test doubles, wrappers) are called directly
+        if transport is None and isinstance(client, vimeo.VimeoClient):
+            transport = VimeoTransport(
+                client, pool_size=self.scheduler.max_concurrency, timeout=timeout
+            )
+        self.transport = transport
+        # With a write buffer, edit_video/edit_project/edit_user return futures
+        self.write_buffer = write_buffer
+        if write_buffer is not None:
+            write_buffer.start(self)
+
+    def request(
+        self,
+        method: str,
+        uri: str,
+        idempotent: Optional[bool] = None,  # noqa: UP007
+        **kwargs,
+    ) -> Response:
+        """
+        Send a request to the Vimeo API through the rate limit scheduler,
+        retrying transient failures. PATCH is only retried when `idempotent`
+        is set, since its safety depends on the payload.
+
+        With a `cache`, GETs are served from it and successful writes
+        invalidate the entries they affect; pass `cache=False` for a GET
+        which must see the current state, such as a status poll. With
+        `instrumentation`, the call is recorded and its hooks run.
+        """
+        if self.instrumentation is None:
+            return self._dispatch(method, uri, idempotent, None, **kwargs)
+        info = self.instrumentation.before_request(method, uri)
+        try:
+            response = self._dispatch(method, uri, idempotent, info, **kwargs)
+        except Exception as error:
+            self.instrumentation.after_request(info, error=error)
+            raise
+        info.rate_limit_remaining = self.scheduler.remaining()
+        self.instrumentation.after_request(info, response)
+        return response
+
+    def span(self, name: str, **attributes) -> contextlib.AbstractContextManager:
+        """Time (and trace) a block when instrumentation is enabled."""
+        if self.instrumentation is None:
+            return contextlib.nullcontext()
+        return self.instrumentation.span(name, **attributes)
+
+    def deadline(
+        self,
+        timeout: Optional[float] = None,  # noqa: UP007
+    ) -> contextlib.AbstractContextManager:
+        """
+        Give the calls made in a block (by any helper, in any of its threads)
+        `timeout` seconds in all. Requests have their timeouts capped to what
+        is left, and waits and retries stop with `DeadlineExceededError` when
+        it runs out, or `OperationCancelledError` once it is cancelled:
+
+            with vapi_client.deadline(30) as scope:
+                videos = vapi_client.get_all_videos()  # scope.cancel() from elsewhere
+        """
+        return deadline.deadline(timeout)
+
+    def flush(self) -> None:
+        """Send any buffered writes now."""
+        if self.write_buffer is not None:
+            self.write_buffer.flush()
+
+    def close(self) -> None:
+        """Flush buffered writes and close the pooled connections."""
+        if self.write_buffer is not None:
+            self.write_buffer.close()
+        if self.transport is not None:
+            self.transport.close()
+
+    def __enter__(self) -> "VimeoAPIClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def resolve_fields(self, preset: str, fields: Fields = None) -> list[str]:
+        """`fields` if given as a list, else the named (or `preset`) preset."""
+        return self.field_presets.resolve(preset, fields)[1]
+
+    def get_fields(
+        self, uri: str, preset: str, fields: Fields = None, **kwargs
+    ) -> Response:
+        """GET `uri` with a preset projection, recording field usage if enabled."""
+        name, fields = self.field_presets.resolve(preset, fields)
+        params = {**kwargs.pop("params", {}), "fields": ",".join(fields)}
+        response = self.request("get", uri, params=params, **kwargs)
+        response.raise_for_status()
+        if self.field_usage is not None:
+            self.field_usage.observe(name, fields, response)
+        return response
+
+    def paginate(self, uri: str, **kwargs) -> Paginator:
+        """Return a concurrent `Paginator` over any list endpoint."""
+        return Paginator(self, uri, **kwargs)
+
+    def bulk(
+        self, operations: Iterable[BulkOperation], **kwargs
+    ) -> Iterator[BulkResult]:
+        """
+        Run many mutations concurrently under the rate limit scheduler and
+        stream a `BulkResult` per operation. `kwargs` are passed to
+        `BulkExecutor` (`max_workers`, `checkpoint_path`, `report_path`).
+        """
+        return BulkExecutor(self, **kwargs).run(operations)
+
+    def _dispatch(
+        self,
+        method: str,
+        uri: str,
+        idempotent: Optional[bool],  # noqa: UP007
+        info: Optional[RequestInfo],  # noqa: UP007
+        **kwargs,
+    ) -> Response:
+        use_cache = kwargs.pop("cache", True)
+        if self.cache is None or (not use_cache and method.lower() == "get"):
+            return self._request(method, uri, idempotent, info, **kwargs)
+        if method.lower() == "get":
+            return self.cache.fetch(
+                uri,
+                kwargs,
+                lambda **kw: self._request(method, uri, idempotent, info, **kw),
+            )
+        response = self._request(method, uri, idempotent, info, **kwargs)
+        if response.ok:
+            self.cache.invalidate(uri)
+        return response
+
+    def _request(
+        self,
+        method: str,
+        uri: str,
+        idempotent: Optional[bool] = None,  # noqa: UP007
+        info: Optional[RequestInfo] = None,  # noqa: UP007
+        **kwargs,
+    ) -> Response:
+        retryable = self.retry_policy.can_retry(method, idempotent)
+        attempt = 0
+        while True:
+            if info is not None:
+                info.retries = attempt
+            deadline.check()
+            try:
+                self.circuit_breaker.before_request()
+            except CircuitOpenError:
+                self.retry_stats.record_rejected()
+                raise
+
+            try:
+                response = self._attempt(method, uri, **kwargs)
+            except (
+                APIRateLimitExceededFailure,
+                RequestsConnectionError,
+                Timeout,
+            ) as error:
+                if not retryable or attempt >= self.retry_policy.max_retries:
+                    raise
+                status = None
+                if isinstance(error, APIRateLimitExceededFailure):
+                    status = TOO_MANY_REQUESTS
+                retry_after = self._retry_after(getattr(error, "response", None))
+            else:
+                status = response.status_code
+                if (
+                    not retryable
+                    or not self.retry_policy.should_retry(status)
+                    or attempt >= self.retry_policy.max_retries
+                ):
+                    return response
+                retry_after = self._retry_after(response)
+
+            delay = self.retry_policy.backoff(attempt, retry_after)
+            self.retry_stats.record_retry(status, delay)
+            deadline.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _retry_after(response: Optional[Response]) -> Optional[float]:  # noqa: UP007
+        if response is None:
+            return None
+        return parse_retry_after(response.headers.get("Retry-After"))
+
+    def _attempt(self, method: str, uri: str, **kwargs) -> Response:
+        """Send once and tell the circuit breaker how it went, whatever happens."""
+        healthy = None
+        try:
+            response = self._send(method, uri, **kwargs)
+        except (RequestsConnectionError, Timeout):
+            healthy = False
+            raise
+        else:
+            healthy = response.status_code < SERVER_ERROR
+            return response
+        finally:
+            if healthy is None:
+                # A 429, a cancellation or an error of ours: no news of Vimeo
+                self.circuit_breaker.record_inconclusive()
+            elif healthy:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+
+    def _send(self, method: str, uri: str, **kwargs) -> Response:
+        kwargs["timeout"] = deadline.capped(kwargs.get("timeout", self.timeout))
+        # pyvimeo raises on 429 without keeping the response, this hook
+        # catches it so its rate limit headers are not lost
+        responses = []
+        kwargs["hooks"] = {"response": lambda r, *args, **kw: responses.append(r)}
+        with self.scheduler.slot():
+            start = time.monotonic()
+            try:
+                if self.transport is not None:
+                    response = self.transport.request(method, uri, **kwargs)
+                else:
+                    response = getattr(self.client, method)(uri, **kwargs)
+            except APIRateLimitExceededFailure as error:
+                if responses:
+                    error.response = responses[-1]
+                self._throttle(getattr(error, "response", None))
+                raise
+            self.scheduler.update(response.headers, time.monotonic() - start)
+        return response
+
+    def _throttle(self, response: Optional[Response]) -> None:  # noqa: UP007
+        """Vimeo answered 429: spend nothing until the budget it reported resets."""
+        headers = {} if response is None else response.headers
+        self.scheduler.update(headers)
+        self.scheduler.throttle(parse_retry_after(headers.get("Retry-After")))
@@ -1,3 +1,7 @@
+# Vimeo's `uris` filter and `per_page` both top out at 100
+BATCH_SIZE = 100
+
+
 class TranscodeStatus:
     COMPLETE = "complete"
     ERROR = "error"
@@ -0,0 +1,193 @@
+import contextlib
+import contextvars
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from vimeo_utils.exceptions import DeadlineExceededError
+from vimeo_utils.exceptions import OperationCancelledError
+
+# Longest a blocking wait goes without looking for a cancellation
+CANCEL_POLL = 0.05
+
+_current: contextvars.ContextVar = contextvars.ContextVar(
+    "vimeo_utils_deadline", default=None
+)
+
+
+class Deadline:
+    """
+    A time budget for a block of work, which can also be cancelled early.
+
+    A deadline nested in another ends no later than its parent and is
+    cancelled with it. While one is current (see `deadline()`), every
+    `VimeoAPIClient` request checks it, has its timeout capped to what is
+    left and sleeps (backoff, rate limiting, polling) only until it ends.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,  # noqa: UP007
+        parent: Optional["Deadline"] = None,
+    ):
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+        self.parent = parent
+        self._cancelled = threading.Event()
+        self._callbacks: list[Callable[[], None]] = []
+        self._children: weakref.WeakSet = weakref.WeakSet()
+        self._lock = threading.Lock()
+        if parent is not None:
+            parent.adopt(self)
+
+    def adopt(self, child: "Deadline") -> None:
+        """Cancel `child` along with this deadline (now, if it is cancelled)."""
+        with self._lock:
+            self._children.add(child)
+        if self.cancelled:
+            child.cancel()
+
+    def remaining(self) -> Optional[float]:  # noqa: UP007
+        """Seconds left, `None` without a time limit."""
+        left = None
+        if self.expires_at is not None:
+            left = max(0.0, self.expires_at - time.monotonic())
+        if self.parent is not None:
+            inherited = self.parent.remaining()
+            if inherited is not None:
+                left = inherited if left is None else min(left, inherited)
+        return left
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() == 0
+
+    def cancel(self) -> None:
+        """Stop the work: waits return at once and the next check raises."""
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._cancelled.set()
+            callbacks = list(self._callbacks)
+            children = list(self._children)
+        for callback in callbacks:
+            callback()
+        for child in children:
+            child.cancel()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Call `callback()` when the deadline is cancelled (now, if it is)."""
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def error(self) -> Optional[Exception]:  # noqa: UP007
+        if self.cancelled:
+            return OperationCancelledError("Operation cancelled")
+        if self.expired:
+            return DeadlineExceededError("Deadline exceeded")
+        return None
+
+    def check(self) -> None:
+        """Raise if the deadline has passed or was cancelled."""
+        error = self.error()
+        if error is not None:
+            raise error
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep up to `seconds`, raising as soon as the deadline ends."""
+        left = self.remaining()
+        self._cancelled.wait(seconds if left is None else min(seconds, left))
+        self.check()
+
+    def timeout(self, timeout: Union[float, tuple, None]) -> Union[float, tuple, None]:  # noqa: UP007
+        """A request `timeout` (seconds or `(connect, read)`) capped to what is left."""
+        self.check()
+        left = self.remaining()
+        if left is None:
+            return timeout
+        if timeout is None:
+            return left
+        if isinstance(timeout, tuple):
+            return tuple(left if t is None else min(t, left) for t in timeout)
+        return min(timeout, left)
+
+
+def current() -> Optional[Deadline]:  # noqa: UP007
+    """The deadline of the running code, if any."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def deadline(timeout: Optional[float] = None) -> Iterator[Deadline]:  # noqa: UP007
+    """Run a block under a new deadline (nested in the current one)."""
+    scope = Deadline(timeout, parent=current())
+    token = _current.set(scope)
+    try:
+        yield scope
+    finally:
+        _current.reset(token)
+
+
+def check() -> None:
+    """Raise if the current deadline has passed or was cancelled."""
+    scope = current()
+    if scope is not None:
+        scope.check()
+
+
+def sleep(seconds: float) -> None:
+    """`time.sleep()` which ends (raising) with the current deadline."""
+    scope = current()
+    if scope is None:
+        time.sleep(seconds)
+    else:
+        scope.sleep(seconds)
+
+
+def capped(timeout: Union[float, tuple, None]) -> Union[float, tuple, None]:  # noqa: UP007
+    """A request `timeout` capped to what is left of the current deadline."""
+    scope = current()
+    return timeout if scope is None else scope.timeout(timeout)
+
+
+def wait_timeout(timeout: Optional[float] = None) -> Optional[float]:  # noqa: UP007
+    """
+    How long a blocking wait may last under the current deadline: `timeout`
+    capped to what is left, and short enough to notice a cancellation.
+    """
+    scope = current()
+    if scope is None:
+        return timeout
+    left = scope.remaining()
+    limits = [t for t in (timeout, left, CANCEL_POLL) if t is not None]
+    return min(limits)
+
+
+def bind(
+    fn: Callable[..., Any],
+    scope: Optional[Deadline] = None,  # noqa: UP007
+) -> Callable[..., Any]:
+    """
+    `fn` running in a copy of the current context, so the deadline (or
+    `scope`) follows it into another thread. Call the result once.
+    """
+    context = contextvars.copy_context()
+    if scope is not None:
+        context.run(_current.set, scope)
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
+
+
+def submit(executor, fn: Callable[..., Any], *args, **kwargs):
+    """`executor.submit()` carrying the current deadline into the worker."""
+    return executor.submit(bind(fn), *args, **kwargs)
@@ -0,0 +1,164 @@
+import hashlib
+import mmap
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+from requests import HTTPError
+
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.singleflight import SingleFlight
+
+HASH_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+NOT_FOUND = 404
+# A video in one of these states won't become playable, upload it again
+DEAD_STATUSES = {VideoStatus.UPLOADING_ERROR, VideoStatus.TRANSCODING_ERROR}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    hash TEXT PRIMARY KEY,
+    uri TEXT NOT NULL,
+    path TEXT,
+    size INTEGER,
+    created REAL
+);
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+"""
+
+
+def hash_file(path: Union[str, Path], chunk_size: int = HASH_CHUNK_SIZE) -> str:  # noqa: UP007
+    """SHA-256 of a file, read through a memory map (or in chunks if it can't be mapped)."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as fh:
+        try:
+            # Parenthesized context managers need 3.10
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:  # noqa: SIM117
+                with memoryview(mm) as view:
+                    for start in range(0, len(view), chunk_size):
+                        digest.update(view[start : start + chunk_size])
+        except ValueError:
+            # Empty files can't be mapped
+            for block in iter(lambda: fh.read(chunk_size), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+class UploadIndex:
+    """
+    A local SQLite index from file content (SHA-256) to the Vimeo URI it
+    was uploaded as, used to skip uploading the same file twice.
+
+    `get_or_upload()` returns the URI of an earlier upload of the same
+    content when that video still exists (and hasn't failed), otherwise it
+    uploads and records the new URI. Threads of this process holding the
+    same content share one upload. The database runs in WAL mode with a
+    connection per thread, so several processes can share the index too,
+    but they don't wait for each other: two of them uploading the same
+    content at once both upload it, and the last one recorded wins.
+    Hashes are remembered per path, size and mtime so unchanged files aren't
+    read again.
+    """
+
+    def __init__(self, path: Union[str, Path], verify: bool = True):  # noqa: UP007
+        self.path = str(path)
+        self.verify = verify
+        self.hits = 0
+        self.singleflight = SingleFlight()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.db.executescript(SCHEMA)
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def file_hash(self, path: Union[str, Path]) -> str:  # noqa: UP007
+        key = str(Path(path).resolve())
+        stat = Path(key).stat()
+        row = self.db.execute(
+            "SELECT hash FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (key, stat.st_size, stat.st_mtime_ns),
+        ).fetchone()
+        if row is not None:
+            return row[0]
+        digest = hash_file(key)
+        self.db.execute(
+            "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)",
+            (key, stat.st_size, stat.st_mtime_ns, digest),
+        )
+        return digest
+
+    def lookup(self, digest: str) -> Optional[str]:  # noqa: UP007
+        row = self.db.execute(
+            "SELECT uri FROM uploads WHERE hash = ?", (digest,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def record(
+        self,
+        digest: str,
+        uri: str,
+        path: Union[str, Path, None] = None,  # noqa: UP007
+    ) -> None:
+        size = Path(path).stat().st_size if path else None
+        self.db.execute(
+            "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?, ?)",
+            (digest, uri, str(path) if path else None, size, time.time()),
+        )
+
+    def forget(self, digest: str) -> None:
+        self.db.execute("DELETE FROM uploads WHERE hash = ?", (digest,))
+
+    def is_live(self, vclient, uri: str) -> bool:
+        """Whether `uri` still exists and hasn't failed to upload or transcode."""
+        try:
+            video = vclient.get_video(uri, fields=["uri", "status"], cache=False).json()
+        except HTTPError as error:
+            if getattr(error.response, "status_code", None) == NOT_FOUND:
+                return False
+            raise
+        return video.get("status") not in DEAD_STATUSES
+
+    def get_or_upload(
+        self,
+        vclient,
+        path: Union[str, Path],  # noqa: UP007
+        upload: Callable[[], str],
+    ) -> str:
+        """Return the URI of this file's content, calling `upload()` if it has none."""
+        digest = self.file_hash(path)
+
+        def run() -> str:
+            uri = self.lookup(digest)
+            if uri is not None:
+                if not self.verify or self.is_live(vclient, uri):
+                    with self._lock:
+                        self.hits += 1
+                    return uri
+                self.forget(digest)
+            uri = upload()
+            self.record(digest, uri, path)
+            return uri
+
+        return self.singleflight.do(digest, run)
+
+    def close(self) -> None:
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
@@ -0,0 +1,387 @@
+import concurrent.futures
+import hashlib
+import json
+import mmap
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from vimeo_utils import deadline
+from vimeo_utils.exceptions import DownloadError
+from vimeo_utils.exceptions import VideoNotFoundError
+from vimeo_utils.utils import select_download
+
+DEFAULT_PART_SIZE = 16 * 1024 * 1024  # 16 MB
+STREAM_CHUNK_SIZE = 256 * 1024
+PARTIAL_CONTENT = 206
+# Download links are signed and expire, these mean "fetch a new one"
+EXPIRED_STATUSES = {403, 410}
+
+
+class DownloadProgress:
+    """A progress event for a single file."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str,
+        uri: Optional[str],  # noqa: UP007
+        received: int,
+        size: int,
+        bytes_per_second: float,
+        done: bool = False,
+    ):
+        self.path = path
+        self.uri = uri
+        self.received = received
+        self.size = size
+        self.bytes_per_second = bytes_per_second
+        self.done = done
+
+    def __repr__(self):
+        return f"<DownloadProgress {self.path} {self.percent:.1f}%>"
+
+    @property
+    def percent(self) -> float:
+        return 100.0 if not self.size else self.received * 100.0 / self.size
+
+
+class BandwidthLimiter:
+    """
+    Token bucket shared by every connection, capping the aggregate rate at
+    `bytes_per_second` (with up to a second's worth of burst).
+    """
+
+    def __init__(self, bytes_per_second: float):
+        self.rate = bytes_per_second
+        self._tokens = bytes_per_second
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int) -> None:
+        """Take `amount` bytes from the bucket, sleeping off any debt."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            deadline.sleep(wait)
+
+
+class _PartState:
+    """Which parts of a partial download are on disk, saved next to it."""
+
+    def __init__(self, path: Path, size: int, part_size: int):
+        self.path = path
+        self.key = {"size": size, "part_size": part_size}
+        self.done: set = set()
+        self._lock = threading.Lock()
+        if path.exists():
+            state = json.loads(path.read_text())
+            if {k: state.get(k) for k in self.key} == self.key:
+                self.done = set(state["done"])
+
+    def add(self, start: int) -> None:
+        with self._lock:
+            self.done.add(start)
+            tmp = self.path.with_suffix(f"{self.path.suffix}.tmp")
+            tmp.write_text(json.dumps({**self.key, "done": sorted(self.done)}))
+            tmp.replace(self.path)
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+class DownloadManager:
+    """
+    Downloads videos (or any file) with concurrent HTTP range requests.
+
+    Each file is split into `part_size` ranges, fetched over `connections`
+    connections and written straight into a preallocated, memory-mapped
+    `<name>.part` file. Finished ranges are recorded in `<name>.part.json`,
+    so an interrupted download resumes with the ranges it is missing. Once
+    complete the size (and MD5, when Vimeo provides one) is verified before
+    the file is moved into place.
+
+    `max_workers` files are downloaded at a time. `bandwidth` caps the
+    aggregate rate in bytes per second. A failed range is retried `retries`
+    times from where it stopped. `callback` receives a `DownloadProgress`
+    after every completed range.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        vclient,
+        max_workers: int = 3,
+        connections: int = 4,
+        part_size: int = DEFAULT_PART_SIZE,
+        bandwidth: Optional[float] = None,  # noqa: UP007
+        callback: Optional[Callable[[DownloadProgress], None]] = None,  # noqa: UP007
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        session: Optional[requests.Session] = None,  # noqa: UP007
+    ):
+        self.vclient = vclient
+        self.max_workers = max_workers
+        self.connections = connections
+        self.part_size = part_size
+        self.limiter = BandwidthLimiter(bandwidth) if bandwidth else None
+        self.callback = callback
+        self.retries = retries
+        self.retry_delay = retry_delay
+        if session is None:
+            # Downloads come from the CDN, not the API, so they get their own pool
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=max_workers * connections)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def download(
+        self,
+        videos: dict[str, Union[str, Path]],  # noqa: UP007
+    ) -> dict[str, concurrent.futures.Future]:
+        """
+        Queue `videos` (URI -> output path) for download, return a future of
+        the path per URI. The best rendition of every video is looked up
+        with a few batched requests.
+        """
+        found = self.vclient.get_videos_by_uris(
+            list(videos), fields=["uri", "download"]
+        )
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {
+            uri: deadline.submit(
+                executor, self.download_video, uri, path, found.get(uri)
+            )
+            for uri, path in videos.items()
+        }
+        executor.shutdown(wait=False)
+        return futures
+
+    def download_video(
+        self,
+        uri: str,
+        path: Union[str, Path],  # noqa: UP007
+        video: Optional[dict] = None,  # noqa: UP007
+    ) -> str:
+        """
+        Download the best rendition of a single video to `path`. `video` is
+        its `download` listing if already fetched; should that link have
+        expired while queued, a fresh one is fetched.
+        """
+        prefetched = video is not None
+        if video is None:
+            video = self.vclient.get_video(uri, fields=["uri", "download"]).json()
+        download = select_download(video.get("download") or [])
+        if download is None:
+            msg = f"No download link: {uri}"
+            raise VideoNotFoundError(msg)
+        try:
+            return self.download_file(
+                download["link"], path, download.get("size"), download.get("md5"), uri
+            )
+        except requests.HTTPError as error:
+            status = getattr(error.response, "status_code", None)
+            if not prefetched or status not in EXPIRED_STATUSES:
+                raise
+        return self.download_video(uri, path)
+
+    def download_file(  # noqa: PLR0913
+        self,
+        url: str,
+        path: Union[str, Path],  # noqa: UP007
+        size: Optional[int] = None,  # noqa: UP007
+        md5: Optional[str] = None,  # noqa: UP007
+        uri: Optional[str] = None,  # noqa: UP007
+    ) -> str:
+        """Download `url` to `path`, resuming a previous partial download."""
+        path = Path(path)
+        partial = path.with_name(f"{path.name}.part")
+        state = None
+
+        # Follow the redirect to the CDN once instead of on every range
+        probe = self.session.head(
+            url, allow_redirects=True, timeout=deadline.capped((10, 60))
+        )
+        probe.raise_for_status()
+        url = probe.url
+        length = probe.headers.get("Content-Length")
+        if size is None:
+            # Unknown when the server doesn't say either; then only md5 is checked
+            size = int(length) if length is not None else None
+        elif length is not None and int(length) != size:
+            msg = f"Size mismatch for {url}: expected {size}, server has {length}"
+            raise DownloadError(msg)
+        ranged = probe.headers.get("Accept-Ranges") == "bytes" and bool(size)
+
+        progress = _Progress(self, str(path), uri, size or 0)
+        if ranged:
+            state = _PartState(
+                path.with_name(f"{path.name}.part.json"), size, self.part_size
+            )
+            if not partial.exists() or partial.stat().st_size != size:
+                state.done.clear()
+                with partial.open("wb") as fh:
+                    fh.truncate(size)
+            self._download_parts(url, partial, size, state, progress)
+        else:
+            self._download_stream(url, partial, progress)
+
+        try:
+            self._verify(partial, size, md5)
+        except DownloadError:
+            partial.unlink(missing_ok=True)
+            if state is not None:
+                state.remove()
+            raise
+        partial.replace(path)
+        if state is not None:
+            state.remove()
+        progress.finish()
+        return str(path)
+
+    def _download_parts(  # noqa: PLR0913
+        self, url: str, partial: Path, size: int, state: _PartState, progress
+    ) -> None:
+        starts = range(0, size, self.part_size)
+        progress.resume(
+            sum(min(self.part_size, size - s) for s in starts if s in state.done)
+        )
+        missing = [start for start in starts if start not in state.done]
+        with partial.open("r+b") as fh, mmap.mmap(fh.fileno(), size) as mm:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.connections
+            ) as executor:
+                futures = {
+                    deadline.submit(
+                        executor,
+                        self._fetch_range,
+                        url,
+                        mm,
+                        start,
+                        min(start + self.part_size, size) - 1,
+                        progress,
+                    ): start
+                    for start in missing
+                }
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        future.result()
+                        state.add(futures[future])
+                        progress.notify()
+                finally:
+                    for future in futures:
+                        future.cancel()
+            mm.flush()
+
+    def _fetch_range(  # noqa: PLR0913
+        self, url: str, mm: mmap.mmap, start: int, end: int, progress
+    ) -> None:
+        offset = start
+        attempt = 0
+        while True:
+            try:
+                response = self.session.get(
+                    url,
+                    headers={"Range": f"bytes={offset}-{end}"},
+                    stream=True,
+                    timeout=deadline.capped((10, 60)),
+                )
+                response.raise_for_status()
+                if response.status_code != PARTIAL_CONTENT:
+                    msg = f"Range request not honoured: {url}"
+                    raise DownloadError(msg)
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    if offset + len(chunk) > end + 1:
+                        msg = f"Server sent more than the requested range: {url}"
+                        raise DownloadError(msg)
+                    if self.limiter is not None:
+                        self.limiter.consume(len(chunk))
+                    mm[offset : offset + len(chunk)] = chunk
+                    offset += len(chunk)
+                    progress.add(len(chunk))
+                if offset <= end:
+                    msg = "Connection closed mid-range"
+                    raise requests.ConnectionError(msg)
+                return
+            except requests.RequestException as error:
+                status = getattr(error.response, "status_code", None)
+                if status in EXPIRED_STATUSES or attempt >= self.retries:
+                    raise
+                deadline.sleep(min(30, self.retry_delay * 2**attempt))
+                attempt += 1
+
+    def _download_stream(self, url: str, partial: Path, progress) -> None:
+        """Fallback for servers without range support; not resumable."""
+        with self.session.get(
+            url, stream=True, timeout=deadline.capped((10, 60))
+        ) as response:
+            response.raise_for_status()
+            with partial.open("wb") as fh:
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    if self.limiter is not None:
+                        self.limiter.consume(len(chunk))
+                    fh.write(chunk)
+                    progress.add(len(chunk))
+        progress.size = partial.stat().st_size
+
+    @staticmethod
+    def _verify(
+        partial: Path,
+        size: Optional[int],  # noqa: UP007
+        md5: Optional[str],  # noqa: UP007
+    ) -> None:
+        actual = partial.stat().st_size
+        if size is not None and actual != size:
+            msg = f"Size mismatch for {partial}: expected {size}, got {actual}"
+            raise DownloadError(msg)
+        if md5:
+            digest = hashlib.md5()  # noqa: S324
+            with partial.open("rb") as fh:
+                for block in iter(lambda: fh.read(1024 * 1024), b""):
+                    digest.update(block)
+            if digest.hexdigest() != md5:
+                msg = f"Checksum mismatch for {partial}"
+                raise DownloadError(msg)
+
+
+class _Progress:
+    """Bytes received for one file, reported through the manager's callback."""
+
+    def __init__(self, manager: DownloadManager, path: str, uri, size: int):
+        self.manager = manager
+        self.path = path
+        self.uri = uri
+        self.size = size
+        self.received = 0
+        self.resumed = 0
+        self.start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def resume(self, amount: int) -> None:
+        """Count bytes already on disk from an earlier run."""
+        self.received = self.resumed = amount
+
+    def add(self, amount: int) -> None:
+        with self._lock:
+            self.received += amount
+
+    def notify(self, done: bool = False) -> None:
+        if self.manager.callback is None:
+            return
+        elapsed = max(time.monotonic() - self.start, 1e-9)
+        rate = (self.received - self.resumed) / elapsed
+        self.manager.callback(
+            DownloadProgress(self.path, self.uri, self.received, self.size, rate, done)
+        )
+
+    def finish(self) -> None:
+        self.notify(done=True)
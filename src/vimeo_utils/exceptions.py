@@ -1,2 +1,26 @@
 class TranscodingError(Exception):
     """Exception raised for transcoding errors."""
+
+
+class CircuitOpenError(Exception):
+    """Exception raised when the circuit breaker is failing fast."""
+
+
+class VideoNotFoundError(Exception):
+    """Exception raised when a video we're waiting on no longer exists."""
+
+
+class DownloadError(Exception):
+    """Exception raised when a downloaded file fails verification."""
+
+
+class NoClientError(Exception):
+    """Exception raised when no client in a pool may act on a resource."""
+
+
+class DeadlineExceededError(TimeoutError):
+    """Exception raised when the current deadline has passed."""
+
+
+class OperationCancelledError(Exception):
+    """Exception raised when the current deadline was cancelled."""
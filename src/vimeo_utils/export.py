@@ -0,0 +1,256 @@
+import csv
+import gzip
+import io
+import json
+import os
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+from vimeo_utils.utils import get_field
+
+FORMATS = ("ndjson", "csv", "parquet")
+SUFFIXES = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+    ".parquet": "parquet",
+}
+# What `compression` may be per format: gzip for the whole text file, a
+# column codec inside a Parquet file
+COMPRESSIONS = {
+    "ndjson": (None, "gzip"),
+    "csv": (None, "gzip"),
+    "parquet": (None, "snappy", "gzip", "zstd"),
+}
+# Pages buffered into each Parquet row group
+PARQUET_ROW_GROUP_PAGES = 50
+
+
+def flatten(item: dict, fields: list[str]) -> dict:
+    """One column per (dotted) field; nested objects and lists become JSON."""
+    row = {}
+    for field in fields:
+        value = get_field(item, field)
+        if isinstance(value, (dict, list)):  # noqa: UP038
+            value = json.dumps(value, separators=(",", ":"))
+        row[field] = value
+    return row
+
+
+class _Checkpoint:
+    """The last page written, and where the output file ended after it."""
+
+    def __init__(self, path: Union[str, Path, None], key: dict):  # noqa: UP007
+        self.path = Path(path) if path else None
+        self.key = key
+        self.page = 0
+        self.offset = 0
+        self.rows = 0
+        if self.path is not None and self.path.exists():
+            state = json.loads(self.path.read_text())
+            if state.get("key") == key:
+                self.page, self.offset, self.rows = (
+                    state["page"],
+                    state["offset"],
+                    state["rows"],
+                )
+
+    def save(self, page: int, offset: int, rows: int) -> None:
+        self.page, self.offset, self.rows = page, offset, rows
+        if self.path is None:
+            return
+        tmp = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        tmp.write_text(
+            json.dumps({"key": self.key, "page": page, "offset": offset, "rows": rows})
+        )
+        tmp.replace(self.path)
+
+    def remove(self) -> None:
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+class Exporter:
+    """
+    Streams a list endpoint (by default the user's videos) to an NDJSON, CSV
+    or Parquet file, writing each page as it arrives so memory use doesn't
+    grow with the library.
+
+    The format and gzip compression are taken from the file name
+    (`videos.ndjson.gz`) unless given. Items are listed oldest first. With
+    `checkpoint_path`, the page reached and the file size after it are
+    saved after every page. A rerun truncates whatever was written after
+    that point and carries on with the next page. Compressed output is
+    written as one gzip member per page for the same reason. Parquet (which
+    needs `pyarrow`) has its footer written at the end and can't be resumed;
+    its `compression` is the codec of its columns (snappy by default), and
+    a `.gz` name is refused since the file itself isn't gzipped.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        vclient,
+        path: Union[str, Path],  # noqa: UP007
+        fields: list[str],
+        format: Optional[str] = None,  # noqa: UP007, A002
+        compression: Optional[str] = None,  # noqa: UP007
+        checkpoint_path: Union[str, Path, None] = None,  # noqa: UP007
+        uri: Optional[str] = None,  # noqa: UP007
+        per_page: int = 100,
+    ):
+        self.vclient = vclient
+        self.path = Path(path)
+        self.fields = list(fields)
+        suffixes = [s.lower() for s in self.path.suffixes]
+        gzipped = suffixes[-1:] == [".gz"]
+        if gzipped:
+            suffixes = suffixes[:-1]
+        self.format = format or SUFFIXES.get(suffixes[-1] if suffixes else "", "ndjson")
+        if self.format not in FORMATS:
+            msg = f"Unsupported export format: {self.format}"
+            raise ValueError(msg)
+        if self.format == "parquet" and gzipped:
+            msg = "Parquet files aren't gzipped, pass compression= for their columns"
+            raise ValueError(msg)
+        if compression is None and gzipped:
+            compression = "gzip"
+        if compression not in COMPRESSIONS[self.format]:
+            msg = f"Unsupported compression for {self.format}: {compression}"
+            raise ValueError(msg)
+        self.compression = compression
+        if self.format == "parquet" and checkpoint_path is not None:
+            msg = "Parquet exports can't be resumed, drop checkpoint_path"
+            raise ValueError(msg)
+        self.uri = uri or f"{vclient.base_uri}/videos"
+        self.per_page = per_page
+        self.checkpoint = _Checkpoint(
+            checkpoint_path,
+            {
+                "uri": self.uri,
+                "path": str(self.path),
+                "fields": self.fields,
+                "format": self.format,
+                "compression": self.compression,
+                "per_page": per_page,
+            },
+        )
+
+    def run(self) -> dict:
+        """Export everything (or the rest of it), return a summary."""
+        resumed_from = self.checkpoint.page
+        if resumed_from and (
+            not self.path.exists() or self.path.stat().st_size < self.checkpoint.offset
+        ):
+            resumed_from = 0
+            self.checkpoint.save(0, 0, 0)
+        paginator = self.vclient.paginate(
+            self.uri,
+            params={"sort": "date", "direction": "asc"},
+            fields=self.fields,
+            per_page=self.per_page,
+            start_page=resumed_from + 1,
+        )
+        with self.vclient.span("export", format=self.format):
+            if self.format == "parquet":
+                rows = self._write_parquet(paginator)
+            else:
+                rows = self._write_text(paginator, resumed_from)
+        self.checkpoint.remove()
+        return {
+            "path": str(self.path),
+            "format": self.format,
+            "rows": rows,
+            "pages": paginator.pages,
+            "total": paginator.total,
+            "resumed_from_page": resumed_from,
+        }
+
+    def _encode(self, items: list[dict], header: bool) -> bytes:
+        if self.format == "ndjson":
+            text = "".join(
+                json.dumps(item, separators=(",", ":"), default=str) + "\n"
+                for item in items
+            )
+        else:
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=self.fields)
+            if header:
+                writer.writeheader()
+            writer.writerows(flatten(item, self.fields) for item in items)
+            text = buffer.getvalue()
+        data = text.encode()
+        if self.compression == "gzip":
+            # A member per page, so the file can be cut back to any page
+            data = gzip.compress(data, compresslevel=6)
+        return data
+
+    def _write_text(self, paginator, resumed_from: int) -> int:
+        page = resumed_from
+        rows = self.checkpoint.rows
+        mode = "r+b" if resumed_from else "wb"
+        with self.path.open(mode) as fh:
+            # Drop anything written after the last checkpoint
+            fh.truncate(self.checkpoint.offset)
+            fh.seek(self.checkpoint.offset)
+            for items in paginator.iter_pages():
+                page += 1
+                fh.write(self._encode(items, header=page == 1))
+                fh.flush()
+                os.fsync(fh.fileno())
+                rows += len(items)
+                self.checkpoint.save(page, fh.tell(), rows)
+        return rows
+
+    def _write_parquet(self, paginator) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            msg = (
+                "Parquet export needs pyarrow: pip install python-vimeo-utils[parquet]"
+            )
+            raise ImportError(msg) from error
+
+        writer = None
+        schema = None
+        rows = 0
+        batch: list[dict] = []
+
+        def open_writer(fields: list) -> None:
+            nonlocal writer, schema
+            schema = pa.schema(fields)
+            writer = pq.ParquetWriter(
+                str(self.path), schema, compression=self.compression or "snappy"
+            )
+
+        def flush() -> None:
+            if not batch:
+                return
+            if schema is None:
+                open_writer(
+                    [
+                        pa.field(
+                            field.name,
+                            pa.string() if pa.types.is_null(field.type) else field.type,
+                        )
+                        for field in pa.Table.from_pylist(batch).schema
+                    ]
+                )
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            batch.clear()
+
+        try:
+            for page, items in enumerate(paginator.iter_pages(), start=1):
+                batch.extend(flatten(item, self.fields) for item in items)
+                rows += len(items)
+                if page % PARQUET_ROW_GROUP_PAGES == 0:
+                    flush()
+            flush()
+            if writer is None:
+                # Nothing to infer types from: an empty file of string columns
+                open_writer([pa.field(field, pa.string()) for field in self.fields])
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
@@ -0,0 +1,222 @@
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from requests import Response
+
+VIDEO_FIELDS = [
+    "uri",
+    "name",
+    "description",
+    "link",
+    "created_time",
+    "privacy",
+    "download",
+    "status",
+    "upload",
+    "transcode",
+    "is_playable",
+]
+VIDEO_LIST_FIELDS = ["uri", "name", "created_time", "status"]
+USER_FIELDS = [
+    "uri",
+    "name",
+    "link",
+    "location",
+    "bio",
+    "short_bio",
+    "created_time",
+]
+PROJECT_FIELDS = ["uri", "name"]
+
+DEFAULT_PRESETS = {
+    "video": VIDEO_FIELDS,
+    "video_list": VIDEO_LIST_FIELDS,
+    "user": USER_FIELDS,
+    "project": PROJECT_FIELDS,
+}
+
+# What a `fields` argument may be: a list, a preset name, or None for the default
+Fields = Union[list[str], str, None]  # noqa: UP007
+
+
+class FieldPresets:
+    """
+    Named `fields` projections. Methods such as `get_video()` use their
+    preset (`video`, `video_list`, `user`, `project`) unless given fields,
+    and also accept the name of any registered preset:
+
+        vapi_client.field_presets.register("thumbnail", ["uri", "pictures.base_link"])
+        vapi_client.get_video(uri, fields="thumbnail")
+    """
+
+    def __init__(self, presets: Optional[dict[str, list[str]]] = None):  # noqa: UP007
+        self._presets = {name: list(fields) for name, fields in DEFAULT_PRESETS.items()}
+        for name, fields in (presets or {}).items():
+            self.register(name, fields)
+
+    def register(self, name: str, fields: Iterable[str]) -> None:
+        """Add a preset or replace one, including the defaults."""
+        self._presets[name] = list(fields)
+
+    def get(self, name: str) -> list[str]:
+        try:
+            return list(self._presets[name])
+        except KeyError:
+            msg = f"Unknown field preset {name!r}, known: {', '.join(self.names())}"
+            raise ValueError(msg) from None
+
+    def names(self) -> list[str]:
+        return sorted(self._presets)
+
+    def resolve(self, default: str, fields: Fields = None) -> tuple[str, list[str]]:
+        """The preset name and field list a call should use."""
+        if not fields:
+            return default, self.get(default)
+        if isinstance(fields, str):
+            return fields, self.get(fields)
+        return default, list(fields)
+
+
+class FieldUsage:
+    """
+    Learning mode: records which fields callers actually read from
+    `get_video()`, `get_user()` and `get_project()` responses, and how many
+    bytes (and seconds of JSON parsing) each projection costs.
+
+    Reads are seen through `[]`, `get()`, `in` and iteration of the decoded
+    JSON; iterating an object counts as reading all of it. `suggest()` returns
+    the smallest projection covering what was read, e.g. `upload.status`
+    rather than all of `upload`.
+
+        usage = FieldUsage()
+        vapi_client = VimeoAPIClient(vclient, field_usage=usage)
+        ...  # run the workload
+        vapi_client.field_presets.register("video", usage.suggest("video"))
+    """
+
+    def __init__(self):
+        self._read: dict[str, set[str]] = {}
+        self._touched: dict[str, set[str]] = {}
+        self._calls: dict[tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, preset: str, fields: list[str], response: Response) -> Response:
+        """Account for `response` and make its `json()` record the fields read."""
+        size = len(response.content or b"")
+        key = (preset, ",".join(fields))
+        with self._lock:
+            calls = self._calls.setdefault(
+                key, {"calls": 0, "bytes": 0, "parse_seconds": 0.0}
+            )
+            calls["calls"] += 1
+            calls["bytes"] += size
+
+        def json(**kwargs) -> Any:
+            start = time.perf_counter()
+            data = Response.json(response, **kwargs)
+            with self._lock:
+                calls["parse_seconds"] += time.perf_counter() - start
+            if isinstance(data, dict):
+                return TrackedDict(data, self, preset)
+            return data
+
+        response.json = json
+        return response
+
+    def read(self, preset: str, path: str) -> None:
+        with self._lock:
+            self._read.setdefault(preset, set()).add(path)
+
+    def touch(self, preset: str, path: str) -> None:
+        with self._lock:
+            self._touched.setdefault(preset, set()).add(path)
+
+    def suggest(self, preset: str) -> list[str]:
+        """The minimal `fields` covering everything read under `preset`."""
+        with self._lock:
+            paths = set(self._read.get(preset, ()))
+            touched = set(self._touched.get(preset, ()))
+        # An object passed on whole, none of its members read, is needed whole
+        for path in touched:
+            if not any(p.startswith(f"{path}.") for p in paths):
+                paths.add(path)
+        return sorted(
+            path
+            for path in paths
+            if not any(path.startswith(f"{other}.") for other in paths)
+        )
+
+    def stats(self) -> list[dict]:
+        """Calls, bytes and parse time per preset and projection."""
+        with self._lock:
+            return [
+                {
+                    "preset": preset,
+                    "fields": fields,
+                    **calls,
+                    "bytes_per_call": calls["bytes"] // calls["calls"],
+                }
+                for (preset, fields), calls in self._calls.items()
+            ]
+
+
+class TrackedDict(dict):
+    """A decoded JSON object reporting reads to a `FieldUsage`."""
+
+    def __init__(self, data: dict, usage: FieldUsage, preset: str, prefix: str = ""):
+        super().__init__(data)
+        self._usage = usage
+        self._preset = preset
+        self._prefix = prefix
+
+    def _path(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    def _value(self, key: str, value: Any) -> Any:
+        path = self._path(key)
+        if isinstance(value, dict):
+            self._usage.touch(self._preset, path)
+            if not isinstance(value, TrackedDict):
+                value = TrackedDict(value, self._usage, self._preset, f"{path}.")
+                dict.__setitem__(self, key, value)
+            return value
+        self._usage.read(self._preset, path)
+        return value
+
+    def _read_all(self) -> None:
+        for key in dict.keys(self):
+            self._usage.read(self._preset, self._path(key))
+
+    def __getitem__(self, key: str) -> Any:
+        return self._value(key, dict.__getitem__(self, key))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if dict.__contains__(self, key):
+            return self[key]
+        self._usage.read(self._preset, self._path(key))
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str):
+            self._usage.touch(self._preset, self._path(key))
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._read_all()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._read_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._read_all()
+        return dict.values(self)
+
+    def items(self):
+        self._read_all()
+        return dict.items(self)
@@ -0,0 +1,288 @@
+import bisect
+import contextlib
+import re
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import Any
+from typing import Optional
+from urllib.parse import urlparse
+
+from requests import Response
+
+# Seconds, roughly Prometheus' defaults stretched to cover slow uploads
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+ID_SEGMENT_RE = re.compile(r"/\d+(?=/|$)")
+
+# Prometheus counters: metric name, `Instrumentation` attribute, the labels
+# its keys hold and the help text
+COUNTERS = (
+    (
+        "requests_total",
+        "requests",
+        ("method", "endpoint", "status"),
+        "API requests by endpoint and status.",
+    ),
+    (
+        "response_bytes_total",
+        "bytes",
+        ("method", "endpoint"),
+        "Response body bytes received.",
+    ),
+    ("retries_total", "retries", ("method", "endpoint"), "Retried attempts."),
+    (
+        "errors_total",
+        "errors",
+        ("method", "endpoint", "error"),
+        "Requests which raised.",
+    ),
+)
+
+
+def endpoint_template(uri: str) -> str:
+    """Collapse IDs so metrics group by endpoint: `/videos/1` -> `/videos/{id}`."""
+    return ID_SEGMENT_RE.sub("/{id}", urlparse(uri).path)
+
+
+class RequestInfo:
+    """What a hook sees of a single `VimeoAPIClient.request()` call."""
+
+    def __init__(self, method: str, uri: str):
+        self.method = method.upper()
+        self.uri = uri
+        self.endpoint = endpoint_template(uri)
+        self.status: Optional[int] = None  # noqa: UP007
+        self.bytes = 0
+        self.latency = 0.0
+        self.retries = 0
+        self.rate_limit_remaining: Optional[int] = None  # noqa: UP007
+        self.error: Optional[Exception] = None  # noqa: UP007
+        self.start = time.monotonic()
+
+    def __repr__(self):
+        return f"<RequestInfo {self.method} {self.endpoint} {self.status}>"
+
+
+class Histogram:
+    """Cumulative bucket histogram, as Prometheus expects it."""
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        total = 0
+        result = []
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):  # noqa: B905
+            total += count
+            result.append((str(bound), total))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:  # noqa: UP007
+        """Upper bound of the bucket holding the `q` quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.buckets, self.counts[:-1]):  # noqa: B905
+            total += count
+            if total >= rank:
+                return bound
+        return float("inf")
+
+
+class Instrumentation:
+    """
+    Records every `VimeoAPIClient.request()` call: request counts by
+    endpoint and status, bytes received, retries, errors, latency histograms
+    and the remaining rate limit budget, plus the duration of spans around
+    higher level helpers (`get_all_videos`, `block_until_available`...).
+
+    `add_pre_hook(fn)` and `add_post_hook(fn)` register callables which
+    receive the `RequestInfo` before and after each call. `tracer` may be an
+    OpenTelemetry tracer; spans are then also opened on it.
+    `export_prometheus()` renders everything in the Prometheus text format.
+
+    A client without instrumentation skips all of this.
+    """
+
+    def __init__(
+        self,
+        buckets: tuple = DEFAULT_BUCKETS,
+        tracer: Any = None,
+        prefix: str = "vimeo",
+    ):
+        self.buckets = buckets
+        self.tracer = tracer
+        self.prefix = prefix
+        self.pre_hooks: list[Callable[[RequestInfo], None]] = []
+        self.post_hooks: list[Callable[[RequestInfo], None]] = []
+        self.requests: dict = {}
+        self.bytes: dict = {}
+        self.retries: dict = {}
+        self.errors: dict = {}
+        self.latency: dict = {}
+        self.spans: dict = {}
+        self.rate_limit_remaining: Optional[int] = None  # noqa: UP007
+        self._lock = threading.Lock()
+
+    def add_pre_hook(self, hook: Callable[[RequestInfo], None]) -> None:
+        self.pre_hooks.append(hook)
+
+    def add_post_hook(self, hook: Callable[[RequestInfo], None]) -> None:
+        self.post_hooks.append(hook)
+
+    # --------------------------------------------------------------------------
+    # Recording
+    # --------------------------------------------------------------------------
+
+    def before_request(self, method: str, uri: str) -> RequestInfo:
+        info = RequestInfo(method, uri)
+        for hook in self.pre_hooks:
+            hook(info)
+        return info
+
+    def after_request(
+        self,
+        info: RequestInfo,
+        response: Optional[Response] = None,  # noqa: UP007
+        error: Optional[Exception] = None,  # noqa: UP007
+    ) -> None:
+        info.latency = time.monotonic() - info.start
+        if response is not None:
+            info.status = response.status_code
+            info.bytes = len(response.content or b"")
+        else:
+            info.error = error
+            info.status = getattr(error, "status_code", None)
+
+        status = str(info.status) if info.status is not None else "error"
+        key = (info.method, info.endpoint)
+        with self._lock:
+            counter = (*key, status)
+            self.requests[counter] = self.requests.get(counter, 0) + 1
+            self.bytes[key] = self.bytes.get(key, 0) + info.bytes
+            if info.retries:
+                self.retries[key] = self.retries.get(key, 0) + info.retries
+            if error is not None:
+                name = (*key, type(error).__name__)
+                self.errors[name] = self.errors.get(name, 0) + 1
+            if key not in self.latency:
+                self.latency[key] = Histogram(self.buckets)
+            self.latency[key].observe(info.latency)
+            if info.rate_limit_remaining is not None:
+                self.rate_limit_remaining = info.rate_limit_remaining
+
+        for hook in self.post_hooks:
+            hook(info)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes) -> Iterator[None]:
+        """Time a block (and trace it, with a `tracer`)."""
+        trace = (
+            self.tracer.start_as_current_span(name, attributes=attributes)
+            if self.tracer is not None
+            else contextlib.nullcontext()
+        )
+        start = time.monotonic()
+        try:
+            with trace:
+                yield
+        finally:
+            elapsed = time.monotonic() - start
+            with self._lock:
+                if name not in self.spans:
+                    self.spans[name] = Histogram(self.buckets)
+                self.spans[name].observe(elapsed)
+
+    # --------------------------------------------------------------------------
+    # Export
+    # --------------------------------------------------------------------------
+
+    def stats(self) -> dict:
+        """A summary per endpoint, slowest (by total time) first."""
+        with self._lock:
+            endpoints = []
+            for (method, endpoint), histogram in self.latency.items():
+                requests = sum(
+                    count
+                    for (m, e, _), count in self.requests.items()
+                    if (m, e) == (method, endpoint)
+                )
+                endpoints.append(
+                    {
+                        "method": method,
+                        "endpoint": endpoint,
+                        "requests": requests,
+                        "seconds": round(histogram.sum, 6),
+                        "p50": histogram.quantile(0.5),
+                        "p99": histogram.quantile(0.99),
+                        "bytes": self.bytes.get((method, endpoint), 0),
+                        "retries": self.retries.get((method, endpoint), 0),
+                    }
+                )
+            return {
+                "endpoints": sorted(endpoints, key=lambda e: -e["seconds"]),
+                "spans": {
+                    name: {"count": h.count, "seconds": round(h.sum, 6)}
+                    for name, h in self.spans.items()
+                },
+                "rate_limit_remaining": self.rate_limit_remaining,
+            }
+
+    def export_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        p = self.prefix
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+
+        def labels(**values) -> str:
+            pairs = ",".join(f'{k}="{_escape(v)}"' for k, v in values.items())
+            return f"{{{pairs}}}"
+
+        def histogram(name: str, histogram: Histogram, **values) -> None:
+            for bound, count in histogram.cumulative():
+                lines.append(f"{p}_{name}_bucket{labels(**values, le=bound)} {count}")
+            lines.append(f"{p}_{name}_sum{labels(**values)} {histogram.sum}")
+            lines.append(f"{p}_{name}_count{labels(**values)} {histogram.count}")
+
+        with self._lock:
+            for name, attr, label_names, help_text in COUNTERS:
+                family(name, "counter", help_text)
+                for key, count in sorted(getattr(self, attr).items()):
+                    values = dict(zip(label_names, key))  # noqa: B905
+                    lines.append(f"{p}_{name}{labels(**values)} {count}")
+            family(
+                "request_duration_seconds",
+                "histogram",
+                "Request latency, including retries.",
+            )
+            for (method, endpoint), h in sorted(self.latency.items()):
+                histogram(
+                    "request_duration_seconds", h, method=method, endpoint=endpoint
+                )
+            family("span_duration_seconds", "histogram", "Duration of helper calls.")
+            for name, h in sorted(self.spans.items()):
+                histogram("span_duration_seconds", h, span=name)
+            if self.rate_limit_remaining is not None:
+                family(
+                    "rate_limit_remaining", "gauge", "Last reported rate limit budget."
+                )
+                lines.append(f"{p}_rate_limit_remaining {self.rate_limit_remaining}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
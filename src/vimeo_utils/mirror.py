@@ -0,0 +1,244 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+MIRROR_VIDEO_FIELDS = [
+    "uri",
+    "name",
+    "status",
+    "created_time",
+    "modified_time",
+    "parent_folder.uri",
+]
+MIRROR_PROJECT_FIELDS = ["uri", "name", "created_time", "modified_time"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    uri TEXT PRIMARY KEY,
+    name TEXT,
+    status TEXT,
+    created_time TEXT,
+    modified_time TEXT,
+    project_uri TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS videos_status ON videos (status);
+CREATE INDEX IF NOT EXISTS videos_name ON videos (name);
+CREATE INDEX IF NOT EXISTS videos_project_uri ON videos (project_uri);
+CREATE INDEX IF NOT EXISTS videos_modified_time ON videos (modified_time);
+
+CREATE TABLE IF NOT EXISTS projects (
+    uri TEXT PRIMARY KEY,
+    name TEXT,
+    created_time TEXT,
+    modified_time TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS projects_name ON projects (name);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+VIDEOS_CHECKPOINT = "videos_modified_time"
+
+
+class LibraryMirror:
+    """
+    A local SQLite mirror of the account's videos and projects.
+
+    `sync()` does a full load the first time. After that it only fetches
+    videos sorted by `modified_time` until it reaches the last checkpoint,
+    then reconciles deletions when the remote total no longer matches. The
+    query helpers read from the mirror and never hit the API.
+    """
+
+    def __init__(self, vclient, path: Union[str, Path] = ":memory:"):  # noqa: UP007
+        self.vclient = vclient
+        self.db = sqlite3.connect(str(path))
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    # --------------------------------------------------------------------------
+    # Sync
+    # --------------------------------------------------------------------------
+
+    def sync(self) -> dict:
+        """Bring the mirror up to date, return what changed."""
+        if self.get_state(VIDEOS_CHECKPOINT) is None:
+            stats = self.full_sync()
+        else:
+            stats = self.sync_videos()
+        stats["projects"] = self.sync_projects()
+        return stats
+
+    def full_sync(self) -> dict:
+        """Load every video, dropping local rows which no longer exist."""
+        seen = set()
+        checkpoint = ""
+        paginator = self.vclient.paginate(
+            f"{self.vclient.base_uri}/videos", fields=MIRROR_VIDEO_FIELDS
+        )
+        for page in paginator.iter_pages():
+            with self.db:
+                self._upsert_videos(page)
+            for video in page:
+                seen.add(video["uri"])
+                checkpoint = max(checkpoint, video.get("modified_time") or "")
+        deleted = self._delete_missing("videos", seen)
+        self.set_state(VIDEOS_CHECKPOINT, checkpoint)
+        return {"updated": len(seen), "deleted": deleted}
+
+    def sync_videos(self) -> dict:
+        """Fetch videos modified since the checkpoint, then reconcile deletions."""
+        since = self.get_state(VIDEOS_CHECKPOINT) or ""
+        checkpoint = since
+        updated = 0
+        paginator = self.vclient.paginate(
+            f"{self.vclient.base_uri}/videos",
+            params={"sort": "modified_time", "direction": "desc"},
+            fields=MIRROR_VIDEO_FIELDS,
+            prefetch=2,
+        )
+        pages = paginator.iter_pages()
+        try:
+            for page in pages:
+                # Times are to the second, so the checkpoint's second is read
+                # again: a video edited in it after the last sync isn't missed
+                changed = [
+                    video
+                    for video in page
+                    if video["modified_time"] > since
+                    or (video["modified_time"] == since and not self._is_stored(video))
+                ]
+                with self.db:
+                    self._upsert_videos(changed)
+                updated += len(changed)
+                for video in changed:
+                    checkpoint = max(checkpoint, video["modified_time"])
+                if any(video["modified_time"] < since for video in page):
+                    break
+        finally:
+            pages.close()
+        self.set_state(VIDEOS_CHECKPOINT, checkpoint)
+
+        deleted = 0
+        if paginator.total is not None and paginator.total != self.count_videos():
+            remote = {
+                video["uri"]
+                for video in self.vclient.paginate(
+                    f"{self.vclient.base_uri}/videos", fields=["uri"]
+                )
+            }
+            deleted = self._delete_missing("videos", remote)
+        return {"updated": updated, "deleted": deleted}
+
+    def sync_projects(self) -> int:
+        """Folders are few, refresh them all."""
+        projects = self.vclient.get_all_projects(fields=MIRROR_PROJECT_FIELDS)
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        project["uri"],
+                        project.get("name"),
+                        project.get("created_time"),
+                        project.get("modified_time"),
+                        json.dumps(project),
+                    )
+                    for project in projects
+                ],
+            )
+        self._delete_missing("projects", {project["uri"] for project in projects})
+        return len(projects)
+
+    def _upsert_videos(self, videos: list[dict]) -> None:
+        self.db.executemany(
+            "INSERT OR REPLACE INTO videos VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    video["uri"],
+                    video.get("name"),
+                    video.get("status"),
+                    video.get("created_time"),
+                    video.get("modified_time"),
+                    (video.get("parent_folder") or {}).get("uri"),
+                    json.dumps(video),
+                )
+                for video in videos
+            ],
+        )
+
+    def _is_stored(self, video: dict) -> bool:
+        """Whether the mirror already holds this exact version of `video`."""
+        row = self.db.execute(
+            "SELECT data FROM videos WHERE uri = ?", (video["uri"],)
+        ).fetchone()
+        return row is not None and row[0] == json.dumps(video)
+
+    def _delete_missing(self, table: str, keep: set) -> int:
+        local = {row[0] for row in self.db.execute(f"SELECT uri FROM {table}")}  # noqa: S608
+        missing = local - keep
+        with self.db:
+            self.db.executemany(
+                f"DELETE FROM {table} WHERE uri = ?",  # noqa: S608
+                [(uri,) for uri in missing],
+            )
+        return len(missing)
+
+    def get_state(self, key: str) -> Optional[str]:  # noqa: UP007
+        row = self.db.execute(
+            "SELECT value FROM sync_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: str) -> None:
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (key, value)
+            )
+
+    # --------------------------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------------------------
+
+    def _videos(self, where: str = "", args: tuple = ()) -> list[dict]:
+        rows = self.db.execute(f"SELECT data FROM videos {where} ORDER BY uri", args)  # noqa: S608
+        return [json.loads(row[0]) for row in rows]
+
+    def count_videos(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+
+    def get_video(self, uri: str) -> Optional[dict]:  # noqa: UP007
+        videos = self._videos("WHERE uri = ?", (uri,))
+        return videos[0] if videos else None
+
+    def videos_by_status(self, status: str) -> list[dict]:
+        return self._videos("WHERE status = ?", (status,))
+
+    def search_videos(self, name: str) -> list[dict]:
+        """Videos whose name contains `name` (case insensitive)."""
+        return self._videos("WHERE name LIKE ?", (f"%{name}%",))
+
+    def videos_in_project(self, project_uri: str) -> list[dict]:
+        return self._videos("WHERE project_uri = ?", (project_uri,))
+
+    def get_project(self, uri: str) -> Optional[dict]:  # noqa: UP007
+        row = self.db.execute(
+            "SELECT data FROM projects WHERE uri = ?", (uri,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_projects(self, name: str) -> list[dict]:
+        rows = self.db.execute(
+            "SELECT data FROM projects WHERE name LIKE ? ORDER BY name", (f"%{name}%",)
+        )
+        return [json.loads(row[0]) for row in rows]
@@ -1,5 +1,3 @@
-from typing import Optional
-
 from requests import Response
 
 
@@ -21,6 +19,6 @@ class EmbedPresetMixin:
     def edit_embed_preset(self, vimeo_uri: str, preset_id: int) -> Response:
         """Edit the embed preset."""
         uri = f"{vimeo_uri}/presets/{preset_id}"
-        response = self.client.put(uri)
+        response = self.request("put", uri)
         response.raise_for_status()
         return response
@@ -1,7 +1,16 @@
+import time
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Optional
+from typing import Union
 
 from requests import Response
 
+from vimeo_utils.fields import Fields
+from vimeo_utils.tree import ProjectNode
+from vimeo_utils.tree import ProjectTree
+from vimeo_utils.tree import ProjectWalker
+
 
 class ProjectMixin:
     """
@@ -15,6 +24,9 @@ class ProjectMixin:
     - Get all projects
 
     - Move a video to a project
+    - Get all videos in a project
+
+    - Walk the folder tree
     """
 
     # --------------------------------------------------------------------------
@@ -22,36 +34,34 @@ class ProjectMixin:
     # --------------------------------------------------------------------------
 
     def create_project(
-        self, name: str, parent_folder_uri=None, fields=None
+        self,
+        name: str,
+        parent_folder_uri: Optional[str] = None,  # noqa: UP007
+        fields: Fields = None,
     ) -> Response:
-        """Create a new project."""
+        """Create a new project, returned with the `project` preset (or `fields`)."""
         data = {"name": name, "parent_folder_uri": parent_folder_uri}
-        fields = fields or ["uri", "name"]
+        fields = self.resolve_fields("project", fields)
         params = {"fields": ",".join(fields)} if fields else {}
-        response = self.client.post(
-            f"{self.base_uri}/projects", data=data, params=params
+        response = self.request(
+            "post", f"{self.base_uri}/projects", data=data, params=params
         )
         response.raise_for_status()
         return response
 
-    def get_project(
-        self, project_id: int, fields: Optional[list[str]] = None
-    ) -> Response:  # noqa: UP007
-        """Return a project with sane defaults."""
-        fields = fields or ["uri", "name"]
-        params = {"fields": ",".join(fields)} if fields else {}
-        response = self.client.get(
-            f"{self.base_uri}/projects/{project_id}", params=params
+    def get_project(self, project_id: int, fields: Fields = None) -> Response:
+        """Return a project with the `project` field preset (or `fields`)."""
+        return self.get_fields(
+            f"{self.base_uri}/projects/{project_id}", "project", fields
         )
-        response.raise_for_status()
-        return response
 
     def edit_project(self, project_id: int, name: str) -> Response:
-        """Edit a project."""
+        """Edit a project. With a write buffer, returns a future of the response."""
+        uri = f"{self.base_uri}/projects/{project_id}"
         data = {"name": name}
-        response = self.client.patch(
-            f"{self.base_uri}/projects/{project_id}", data=data
-        )
+        if self.write_buffer is not None:
+            return self.write_buffer.submit(uri, data)
+        response = self.request("patch", uri, data=data, idempotent=True)
         response.raise_for_status()
         return response
 
@@ -60,28 +70,151 @@ class ProjectMixin:
     ) -> Response:
         """Delete a project."""
         params = {"should_delete_clips": should_delete_clips}
-        response = self.client.delete(
-            f"{self.base_uri}/projects/{project_id}", params=params
+        response = self.request(
+            "delete", f"{self.base_uri}/projects/{project_id}", params=params
         )
         response.raise_for_status()
         return response
 
-    def get_all_projects(self, params: Optional[dict] = None) -> Response:  # noqa: UP007
-        """Returns paginated folders belonging to the authenticated user."""
-        params = params or {}
-        response = self.client.get(f"{self.base_uri}/projects", params=params)
+    def get_projects(
+        self,
+        page: int = 1,
+        fields: Fields = None,
+        per_page: int = 100,
+        params: Optional[dict] = None,  # noqa: UP007
+    ) -> Response:
+        """Returns a single page of folders belonging to the authenticated user."""
+        fields = self.resolve_fields("project", fields)
+        params = {
+            **(params or {}),
+            "fields": ",".join(fields),
+            "page": page,
+            "per_page": per_page,
+        }
+        response = self.request("get", f"{self.base_uri}/projects", params=params)
         response.raise_for_status()
         return response
 
+    def iter_all_projects(  # noqa: PLR0913
+        self,
+        params: Optional[dict] = None,  # noqa: UP007
+        fields: Fields = None,
+        per_page: int = 100,
+        ordered: bool = True,
+        model: Optional[type] = None,  # noqa: UP007
+    ) -> Iterator[dict]:
+        """Yield all folders belonging to the authenticated user as pages arrive."""
+        return iter(
+            self.paginate(
+                f"{self.base_uri}/projects",
+                params=params,
+                fields=self.resolve_fields("project", fields),
+                per_page=per_page,
+                ordered=ordered,
+                model=model,
+            )
+        )
+
+    def get_all_projects(
+        self,
+        params: Optional[dict] = None,  # noqa: UP007
+        fields: Fields = None,
+        per_page: int = 100,
+        model: Optional[type] = None,  # noqa: UP007
+    ) -> list[dict]:
+        """
+        Returns all folders belonging to the authenticated user, as dicts or
+        as `model` records (e.g. `Project`).
+        """
+        with self.span("get_all_projects"):
+            return list(
+                self.iter_all_projects(
+                    params, fields, per_page=per_page, ordered=False, model=model
+                )
+            )
+
     # --------------------------------------------------------------------------
     # Videos
     # --------------------------------------------------------------------------
 
     def move_to_project(self, project_id: int, video_uri: str) -> Response:
         """Move a video to a project."""
-        response = self.client.put(f"{self.base_uri}/projects/{project_id}{video_uri}")
+        response = self.request(
+            "put", f"{self.base_uri}/projects/{project_id}{video_uri}"
+        )
         response.raise_for_status()
         return response
 
-    def get_videos_from_project(self, project_id: int) -> list[dict]:
-        return self.client.get(f"{self.base_uri}/folders/{project_id}/videos")
+    def iter_videos_from_project(
+        self,
+        project_id: int,
+        fields: Fields = None,
+        per_page: int = 100,
+        ordered: bool = True,
+    ) -> Iterator[dict]:
+        """Yield all videos in a project as pages arrive."""
+        return iter(
+            self.paginate(
+                f"{self.base_uri}/folders/{project_id}/videos",
+                fields=self.resolve_fields("video_list", fields),
+                per_page=per_page,
+                ordered=ordered,
+            )
+        )
+
+    def get_videos_from_project(
+        self,
+        project_id: int,
+        fields: Fields = None,
+        per_page: int = 100,
+    ) -> list[dict]:
+        """Returns all videos in a project."""
+        with self.span("get_videos_from_project", project_id=project_id):
+            return list(
+                self.iter_videos_from_project(
+                    project_id, fields, per_page=per_page, ordered=False
+                )
+            )
+
+    # --------------------------------------------------------------------------
+    # Tree
+    # --------------------------------------------------------------------------
+
+    def iter_walk_projects(
+        self,
+        root_uri: Optional[str] = None,  # noqa: UP007
+        max_depth: Optional[int] = None,  # noqa: UP007
+        max_workers: Optional[int] = None,  # noqa: UP007
+        video_fields: Optional[list[str]] = None,  # noqa: UP007
+    ) -> Iterator[tuple[ProjectNode, list[dict]]]:
+        """
+        Explore the folder tree breadth first and yield `(folder, videos)` as
+        each folder is listed, `videos` carrying `video_fields`.
+        """
+        walker = ProjectWalker(self, max_depth, max_workers, video_fields)
+        return walker.iter_walk(root_uri)
+
+    def walk_projects(  # noqa: PLR0913
+        self,
+        root_uri: Optional[str] = None,  # noqa: UP007
+        max_depth: Optional[int] = None,  # noqa: UP007
+        max_workers: Optional[int] = None,  # noqa: UP007
+        snapshot_path: Union[str, Path, None] = None,  # noqa: UP007
+        max_age: float = 3600,
+    ) -> ProjectTree:
+        """
+        Build the folder tree (below `root_uri`, or all of it) with video
+        counts and sizes per folder. With `snapshot_path`, a snapshot younger
+        than `max_age` seconds of the same crawl (`root_uri` and `max_depth`)
+        is returned instead of crawling again, and a fresh crawl is saved there.
+        """
+        if snapshot_path is not None and Path(snapshot_path).exists():
+            tree = ProjectTree.load(snapshot_path)
+            key = {"root_uri": root_uri, "max_depth": max_depth}
+            if tree.key == key and time.time() - tree.created < max_age:
+                return tree
+        with self.span("walk_projects"):
+            tree = ProjectWalker(self, max_depth, max_workers).walk(root_uri)
+        if snapshot_path is not None:
+            tree.save(snapshot_path)
+        return tree
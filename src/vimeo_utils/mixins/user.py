@@ -2,6 +2,8 @@ from typing import Optional
 
 from requests import Response
 
+from vimeo_utils.fields import Fields
+
 
 class UserMixin:
     """
@@ -16,25 +18,14 @@ class UserMixin:
     # Essentials
     # --------------------------------------------------------------------------
 
-    def get_user(self, fields: Optional[list[str]] = None) -> Response:  # noqa: UP007
-        """Get user info with sane field defaults."""
-        fields = fields or [
-            "uri",
-            "name",
-            "link",
-            "location",
-            "bio",
-            "short_bio",
-            "created_time",
-        ]
-        params = {"fields": ",".join(fields)} if fields else {}
-
-        response = self.client.get(f"{self.base_uri}", params=params)
-        response.raise_for_status()
-        return response
+    def get_user(self, fields: Fields = None) -> Response:
+        """Get user info with the `user` field preset (or `fields`)."""
+        return self.get_fields(f"{self.base_uri}", "user", fields)
 
     def edit_user(self, data: Optional[dict]) -> Response:  # noqa: UP007
-        """Edit user."""
-        response = self.client.patch(f"{self.base_uri}", data=data)
+        """Edit user. With a write buffer, returns a future of the response."""
+        if self.write_buffer is not None:
+            return self.write_buffer.submit(self.base_uri, data or {})
+        response = self.request("patch", f"{self.base_uri}", data=data, idempotent=True)
         response.raise_for_status()
         return response
@@ -1,13 +1,23 @@
 import concurrent.futures
-import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from typing import Optional
 
 from requests import Response
 
-from vimeo_utils.constants import TranscodeStatus
-from vimeo_utils.constants import VideoStatus
-from vimeo_utils.exceptions import TranscodingError
-from vimeo_utils.utils import extract_page_number
+from vimeo_utils.constants import BATCH_SIZE
+from vimeo_utils.dedup import UploadIndex
+from vimeo_utils.downloads import DownloadManager
+from vimeo_utils.export import Exporter
+from vimeo_utils.fields import Fields
+from vimeo_utils.models import Columns
+from vimeo_utils.models import Video
+from vimeo_utils.snapshot import SNAPSHOT_FIELDS
+from vimeo_utils.snapshot import VideoSnapshot
+from vimeo_utils.uploads import UploadManager
+from vimeo_utils.utils import select_download_link
+from vimeo_utils.waiter import AvailabilityWaiter
 
 
 class VideoMixin:
@@ -16,9 +26,13 @@ class VideoMixin:
     https://developer.vimeo.com/api/reference/videos
 
     - Upload a video
+    - Upload many videos (resumable)
     - Get a video
     - Edit a video
     - Delete a video
+    - Get many videos by URI
+    - Export all videos to a file
+    - Download videos
 
     - Add domain to whitelist
     """
@@ -27,50 +41,94 @@ class VideoMixin:
     # Essentials
     # --------------------------------------------------------------------------
 
-    def upload_video(self, video_file: str, params: dict) -> str:
-        """Upload a video."""
-        return self.client.upload(video_file, data=params)
-
-    def get_video(self, vimeo_uri: str, fields: Optional[list[str]] = None) -> Response:  # noqa: UP007
-        """Return a video info with sane defaults."""
-        fields = fields or [
-            "uri",
-            "name",
-            "description",
-            "link",
-            "created_time",
-            "privacy",
-            "download",
-            "status",
-            "upload",
-            "transcode",
-            "is_playable",
-        ]
-        params = {"fields": ",".join(fields)} if fields else {}
-        response = self.client.get(vimeo_uri, params=params)
-        response.raise_for_status()
-        return response
+    def upload_video(
+        self,
+        video_file: str,
+        params: dict,
+        dedup: Optional[UploadIndex] = None,  # noqa: UP007
+    ) -> str:
+        """
+        Upload a video. With a `dedup` index, a file whose content was
+        already uploaded (and is still live) returns that video's URI.
+        """
+        with self.span("upload_video"):
+            if dedup is not None:
+                return dedup.get_or_upload(
+                    self,
+                    video_file,
+                    lambda: self.client.upload(video_file, data=params),
+                )
+            return self.client.upload(video_file, data=params)
+
+    def upload_videos(
+        self,
+        video_files: Iterable[str],
+        params: Optional[dict] = None,  # noqa: UP007
+        **kwargs,
+    ) -> dict[str, concurrent.futures.Future]:
+        """
+        Upload many videos concurrently with resumable tus uploads. `kwargs`
+        are passed to `UploadManager` (`max_workers`, `state_path`,
+        `callback`, `dedup`...). Returns a future of the video URI per file.
+        """
+        return UploadManager(self, **kwargs).upload(video_files, params)
+
+    def download_video(self, vimeo_uri: str, path: str, **kwargs) -> str:
+        """
+        Download the best rendition of a video to `path` with parallel range
+        requests. `kwargs` are passed to `DownloadManager`.
+        """
+        return DownloadManager(self, **kwargs).download_video(vimeo_uri, path)
+
+    def download_videos(
+        self, videos: dict[str, str], **kwargs
+    ) -> dict[str, concurrent.futures.Future]:
+        """
+        Download many videos (URI -> output path) concurrently. `kwargs` are
+        passed to `DownloadManager` (`max_workers`, `connections`,
+        `bandwidth`...). Returns a future of the path per URI.
+        """
+        return DownloadManager(self, **kwargs).download(videos)
+
+    def get_video(
+        self, vimeo_uri: str, fields: Fields = None, *, cache: bool = True
+    ) -> Response:
+        """
+        Return a video info with the `video` field preset (or `fields`).
+        `cache=False` skips the response cache.
+        """
+        return self.get_fields(vimeo_uri, "video", fields, cache=cache)
 
     def edit_video(self, vimeo_uri: str, params: dict) -> Response:
-        """Edit a video."""
-        response = self.client.patch(vimeo_uri, data=params)
+        """Edit a video. With a write buffer, returns a future of the response."""
+        if self.write_buffer is not None:
+            return self.write_buffer.submit(vimeo_uri, params)
+        response = self.request("patch", vimeo_uri, data=params, idempotent=True)
         response.raise_for_status()
         return response
 
     def delete_video(self, vimeo_uri: str) -> Response:
         """Delete a video."""
-        response = self.client.delete(vimeo_uri)
+        response = self.request("delete", vimeo_uri)
         response.raise_for_status()
         return response
 
-    def get_videos(self, page: int = 1) -> Response:
+    def get_videos(
+        self,
+        page: int = 1,
+        fields: Fields = None,
+        per_page: int = 100,
+    ) -> Response:
         """Get single page of videos, 100 max."""
+        fields = self.resolve_fields("video_list", fields)
         params = {
-            "fields": "uri,name,created_time,status",
+            "fields": ",".join(fields),
             "page": page,
-            "per_page": 100,
+            "per_page": per_page,
         }
-        response = self.client.get(f"{self.base_uri}/videos", params=params, timeout=60)
+        response = self.request(
+            "get", f"{self.base_uri}/videos", params=params, timeout=60
+        )
         response.raise_for_status()
         return response
 
@@ -78,92 +136,200 @@ class VideoMixin:
     # Helpers
     # --------------------------------------------------------------------------
 
-    def get_all_videos(self) -> list[dict]:
-        """Get all videos."""
-        videos = []
-
-        response = self.get_videos()
-        videos.extend(x for x in response.json()["data"])
-
-        # Extracting next and last page numbers
-        paging = response.json().get("paging", {})
-        next_url = paging.get("next") or ""
-        last_url = paging.get("last") or ""
-        next_page = extract_page_number(next_url)
-        last_page = extract_page_number(last_url) or next_page
-        if last_page > 1:
-            last_page += 1
-
-            # Get all the rest of the pages
-            with concurrent.futures.ThreadPoolExecutor(max_workers=6) as executor:
-                future_to_page = {
-                    executor.submit(self.get_videos, page): page
-                    for page in range(next_page, last_page)
-                }
-                for future in concurrent.futures.as_completed(future_to_page):
-                    response = future.result()
-                    videos.extend(x for x in response.json()["data"])
-        return videos
+    def iter_all_videos(  # noqa: PLR0913
+        self,
+        fields: Fields = None,
+        per_page: int = 100,
+        prefetch: Optional[int] = None,  # noqa: UP007
+        ordered: bool = True,
+        model: Optional[type] = None,  # noqa: UP007
+    ) -> Iterator[dict]:
+        """
+        Yield all videos as soon as each page arrives.
 
-    def get_download_link(self, vimeo_uri: str) -> Optional[str]:  # noqa: UP007
-        """Get download link. HD is priority."""
-        video_info = self.get_video(vimeo_uri, fields=["download"]).json()
-        if "download" in video_info:
-            hd_downloads = (
-                video for video in video_info["download"] if video["quality"] == "hd"
+        At most `prefetch` pages (defaults to the scheduler's
+        `max_concurrency`) are in flight or buffered at any time, so peak
+        memory is bounded by the window rather than the library. With
+        `ordered=True` pages are yielded in page order, otherwise in the order
+        they complete. Pass `model=Video` to get compact `Video` records of
+        just the `fields` instead of dicts.
+        """
+        return iter(
+            self.paginate(
+                f"{self.base_uri}/videos",
+                fields=self.resolve_fields("video_list", fields),
+                per_page=per_page,
+                prefetch=prefetch,
+                ordered=ordered,
+                model=model,
             )
-            sd_downloads = (
-                video for video in video_info["download"] if video["quality"] == "sd"
+        )
+
+    def get_all_videos(
+        self,
+        fields: Fields = None,
+        per_page: int = 100,
+        model: Optional[type] = None,  # noqa: UP007
+        columnar: bool = False,
+    ):
+        """
+        Get all videos, as dicts, as `model` records (e.g. `Video`) or, with
+        `columnar=True`, as `Columns` holding one array per field.
+        """
+        fields = self.resolve_fields("video_list", fields)
+        with self.span("get_all_videos"):
+            videos = self.iter_all_videos(
+                fields=fields,
+                per_page=per_page,
+                ordered=False,
+                model=Video if columnar else model,
             )
+            if columnar:
+                return Columns(fields).extend(videos).freeze()
+            return list(videos)
 
-            # Prefer HD downloads
-            try:
-                return max(hd_downloads, key=lambda x: x.get("height", 0))["link"]
-            except ValueError:
-                pass
+    def export_videos(
+        self,
+        path: str,
+        fields: Fields = None,
+        **kwargs,
+    ) -> dict:
+        """
+        Stream every video to an NDJSON, CSV or Parquet file as pages arrive
+        and return a summary. `kwargs` are passed to `Exporter` (`format`,
+        `compression`, `checkpoint_path`, `per_page`).
+        """
+        fields = self.resolve_fields("video_list", fields)
+        return Exporter(self, path, fields, **kwargs).run()
+
+    def get_videos_by_uris(
+        self,
+        vimeo_uris: Iterable[str],
+        fields: Fields = None,
+        *,
+        cache: bool = True,
+    ) -> dict[str, dict]:
+        """
+        Fetch many videos with `uris`-filtered list requests, 100 URIs per
+        request, running the requests concurrently. Returns the videos keyed
+        by URI in the order given; videos which don't exist are left out.
+        `cache=False` skips the response cache.
+        """
+        uris = list(dict.fromkeys(vimeo_uris))
+        fields = self.resolve_fields("video_list", fields)
+        if "uri" not in fields:
+            fields = ["uri", *fields]
+        params = {"fields": ",".join(fields), "per_page": BATCH_SIZE}
+
+        def fetch(chunk: list[str]) -> list[dict]:
+            response = self.request(
+                "get",
+                "/videos",
+                params={**params, "uris": ",".join(chunk)},
+                cache=cache,
+            )
+            response.raise_for_status()
+            return response.json()["data"]
 
-            # If no HD downloads, get the highest quality SD download
-            try:
-                return max(sd_downloads, key=lambda x: x.get("height", 0))["link"]
-            except ValueError:
-                pass
+        chunks = [uris[i : i + BATCH_SIZE] for i in range(0, len(uris), BATCH_SIZE)]
+        if len(chunks) <= 1:
+            pages = [fetch(chunk) for chunk in chunks]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(chunks), self.scheduler.max_concurrency)
+            ) as executor:
+                pages = list(executor.map(fetch, chunks))
 
-        return None
+        found = {video["uri"]: video for page in pages for video in page}
+        return {uri: found[uri] for uri in uris if uri in found}
+
+    def get_download_links(self, vimeo_uris: Iterable[str]) -> dict[str, Optional[str]]:  # noqa: UP007
+        """Get the download link of many videos at once. HD is priority."""
+        videos = self.get_videos_by_uris(vimeo_uris, fields=["uri", "download"])
+        return {
+            uri: select_download_link(video.get("download") or [])
+            for uri, video in videos.items()
+        }
+
+    def get_video_snapshot(self, vimeo_uri: str) -> VideoSnapshot:
+        """
+        Fetch everything the status predicates need in one request, past
+        the response cache since callers poll it. Concurrent callers asking
+        about the same video share the request.
+        """
+        return self.singleflight.do(
+            ("snapshot", vimeo_uri),
+            lambda: VideoSnapshot(
+                self.get_video(vimeo_uri, fields=SNAPSHOT_FIELDS, cache=False).json()
+            ),
+        )
+
+    def get_download_link(self, vimeo_uri: str) -> Optional[str]:  # noqa: UP007
+        """Get download link. HD is priority."""
+        return self.get_video_snapshot(vimeo_uri).download_link
 
     def get_status(self, vimeo_uri: str) -> str:
         """Get video status."""
-        video_info = self.get_video(vimeo_uri, fields=["status"]).json()
-        return video_info["status"]
+        return self.get_video_snapshot(vimeo_uri).status
 
     def get_transcode_status(self, vimeo_uri: str) -> str:
         """Get video transcode status."""
-        video_info = self.get_video(vimeo_uri, fields=["transcode"]).json()
-        return video_info["transcode"]["status"]
+        return self.get_video_snapshot(vimeo_uri).transcode_status
 
     def is_available(self, vimeo_uri) -> bool:
-        return self.get_status(vimeo_uri) == VideoStatus.AVAILABLE
+        return self.get_video_snapshot(vimeo_uri).is_available
 
     def is_transcode_complete(self, vimeo_uri: str) -> bool:
-        return self.get_transcode_status(vimeo_uri) == TranscodeStatus.COMPLETE
+        return self.get_video_snapshot(vimeo_uri).is_transcode_complete
 
     def is_playable(self, vimeo_uri: str) -> bool:
-        video_info = self.get_video(vimeo_uri, fields=["is_playable"]).json()
-        return video_info["is_playable"]
-
-    def block_until_available(self, vimeo_uri: str, interval: int = 30) -> None:
-        """Blocks until video is available. Be careful with this."""
-        error_statuses = {
-            VideoStatus.TRANSCODING_ERROR,
-            VideoStatus.UPLOADING_ERROR,
-        }
-        while True:
-            status = self.get_status(vimeo_uri)
-            if status == VideoStatus.AVAILABLE:
-                return
-            if status in error_statuses:
-                msg = "Transcoding/Uploading error"
-                raise TranscodingError(msg)
-            time.sleep(interval)
+        return self.get_video_snapshot(vimeo_uri).is_playable
+
+    def block_until_available(
+        self,
+        vimeo_uri: str,
+        interval: int = 30,
+        timeout: Optional[float] = None,  # noqa: UP007
+    ) -> None:
+        """
+        Blocks until video is available. Be careful with this: without a
+        `timeout` or a `deadline()` it can wait forever.
+        """
+        with self.span("block_until_available", uri=vimeo_uri):
+            futures = self.wait_until_available(
+                [vimeo_uri],
+                timeout=timeout,
+                min_interval=interval,
+                max_interval=interval,
+            )
+            futures[vimeo_uri].result()
+
+    def wait_until_available(  # noqa: PLR0913
+        self,
+        vimeo_uris: Iterable[str],
+        callback: Optional[Callable[[str, dict], None]] = None,  # noqa: UP007
+        timeout: Optional[float] = None,  # noqa: UP007
+        min_interval: float = 5,
+        max_interval: float = 60,
+    ) -> dict[str, concurrent.futures.Future]:
+        """
+        Wait for many videos at once, polling with a few list requests.
+
+        Returns immediately with a future per URI which resolves to the video
+        once it is available, or raises `TranscodingError` (upload/transcode
+        failed), `VideoNotFoundError` or `TimeoutError` (`timeout` seconds
+        passed for the whole batch). `callback(uri, video)` is called from
+        the polling thread as each video becomes ready.
+        """
+        waiter = AvailabilityWaiter(
+            self,
+            vimeo_uris,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            timeout=timeout,
+            callback=callback,
+        )
+        return waiter.start()
 
     # --------------------------------------------------------------------------
     # Embed privacy
@@ -172,6 +338,6 @@ class VideoMixin:
     def add_domain_to_whitelist(self, vimeo_uri: str, domain: str) -> Response:
         """Add domain to whitelist."""
         uri = f"{vimeo_uri}/privacy/domains/{domain}"
-        response = self.client.put(uri)
+        response = self.request("put", uri)
         response.raise_for_status()
         return response
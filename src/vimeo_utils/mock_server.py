@@ -0,0 +1,595 @@
+import collections
+import json
+import math
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import vimeo
+
+from vimeo_utils.constants import TranscodeStatus
+from vimeo_utils.constants import VideoStatus
+
+# datetime.UTC is 3.11+
+UTC = timezone.utc  # noqa: UP017
+EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
+
+# Vimeo's `sort` values and the field each one orders by
+SORT_FIELDS = {
+    "alphabetical": "name",
+    "date": "created_time",
+    "default": "created_time",
+    "modified_time": "modified_time",
+    "name": "name",
+}
+
+USER_RE = r"/(?:me|users/\d+)"
+FOLDER_RE = f"{USER_RE}/(?:projects|folders)"
+
+# API paths and the `MockVimeoServer` method answering them, first match
+# wins. A method returning None passes the request on to the next route.
+ROUTES = [
+    (re.compile(pattern), name)
+    for pattern, name in (
+        (USER_RE, "_user"),
+        (f"{USER_RE}/videos", "_user_videos"),
+        (r"/videos", "_videos_by_uris"),
+        (r"/videos/\d+", "_video"),
+        (r"(/videos/\d+)/(?:privacy/domains/[^/]+|presets/\d+)", "_video_setting"),
+        (FOLDER_RE, "_projects"),
+        (f"{FOLDER_RE}/(\\d+)", "_project"),
+        (f"{FOLDER_RE}/(\\d+)/items", "_project_items"),
+        (f"{FOLDER_RE}/(\\d+)/videos(/\\d+)?", "_project_videos"),
+    )
+]
+
+
+def _timestamp(seconds: float) -> str:
+    return (EPOCH + timedelta(seconds=seconds)).isoformat()
+
+
+def project_fields(item: dict, fields: Optional[str]) -> dict:  # noqa: UP007
+    """Apply a `fields` projection, dotted names select nested keys."""
+    if not fields:
+        return item
+    result: dict = {}
+    for field in fields.split(","):
+        source, target = item, result
+        parts = field.split(".")
+        for part in parts[:-1]:
+            if not isinstance(source.get(part), dict):
+                source = None
+                break
+            source = source[part]
+            target = target.setdefault(part, {})
+        if source is not None and parts[-1] in source:
+            target[parts[-1]] = source[parts[-1]]
+    return result
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, don't let Nagle hold the body
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802
+        self.server.mock.dispatch(self)
+
+    do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_GET  # noqa: N815
+
+    def log_message(self, *args):
+        pass
+
+
+class MockVimeoServer:
+    """
+    A local stand-in for the Vimeo API, for offline benchmarks and tests.
+
+    It serves a generated library of `videos` and `projects` with real
+    pagination, `fields` projections and `uris` filters, accepts tus uploads,
+    and moves uploaded videos through transcoding over `transcode_polls`
+    reads. `latency` (plus up to `jitter`) is added to every API request,
+    `error_rate` of them fail with a 503, and with `rate_limit` set the
+    `X-RateLimit-*` headers count down and a 429 is returned once the window
+    is used up.
+
+    The library belongs to `user_id`; ids are offset per user, so one server
+    per user can stand in for several accounts.
+
+        with MockVimeoServer(videos=1000, latency=0.02) as server:
+            vapi_client = VimeoAPIClient(server.client())
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        videos: int = 100,
+        projects: int = 5,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[int] = None,  # noqa: UP007
+        rate_limit_window: float = 60.0,
+        transcode_polls: int = 2,
+        download_size: int = 1024 * 1024,
+        seed: Optional[int] = None,  # noqa: UP007
+        user_id: int = 1,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.transcode_polls = transcode_polls
+        self.download_size = download_size
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.error_count = 0
+        self.throttled_count = 0
+        # (method, path, headers) of the most recent API requests
+        self.log: collections.deque = collections.deque(maxlen=1000)
+        self.remaining = rate_limit
+        self.reset_at = time.time() + rate_limit_window
+        self.user = {"uri": f"/users/{user_id}", "name": "Mock User", "link": ""}
+        self.videos: dict = {}
+        self.projects: dict = {}
+        self.uploads: dict = {}
+        self.transcoding: dict = {}
+        first_id = (user_id - 1) * 1_000_000 + 1
+        self._next_ids = {"videos": first_id, "projects": first_id}
+        # Bind now so the URL (and the links it appears in) is known upfront
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None  # noqa: UP007
+        for i in range(1, projects + 1):
+            self.add_project(f"Project {i}")
+        project_uris = list(self.projects)
+        for i in range(videos):
+            project = project_uris[i % len(project_uris)] if project_uris else None
+            self.add_video(project_uri=project)
+
+    # --------------------------------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockVimeoServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockVimeoServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def client(
+        self,
+        token: str = "mock-token",  # noqa: S107 - the server accepts any token
+    ) -> vimeo.VimeoClient:
+        """A `vimeo.VimeoClient` talking to this server."""
+        client = vimeo.VimeoClient(token=token)
+        client.API_ROOT = self.url
+        return client
+
+    # --------------------------------------------------------------------------
+    # Library
+    # --------------------------------------------------------------------------
+
+    def _new_id(self, kind: str) -> int:
+        with self.lock:
+            new_id = self._next_ids[kind]
+            self._next_ids[kind] += 1
+        return new_id
+
+    def add_project(self, name: str, parent_uri: Optional[str] = None) -> str:  # noqa: UP007
+        project_id = self._new_id("projects")
+        uri = f"{self.user['uri']}/projects/{project_id}"
+        parent = self.projects.get(parent_uri)
+        self.projects[uri] = {
+            "uri": uri,
+            "name": name,
+            "created_time": _timestamp(project_id),
+            "modified_time": _timestamp(project_id),
+            "parent_folder": {"uri": parent["uri"], "name": parent["name"]}
+            if parent
+            else None,
+        }
+        return uri
+
+    def add_video(
+        self,
+        status: str = VideoStatus.AVAILABLE,
+        project_uri: Optional[str] = None,  # noqa: UP007
+        **extra,
+    ) -> str:
+        """Add a video; one added as `transcoding` finishes after a few reads."""
+        video_id = self._new_id("videos")
+        uri = f"/videos/{video_id}"
+        available = status == VideoStatus.AVAILABLE
+        project = self.projects.get(project_uri)
+        self.videos[uri] = {
+            "uri": uri,
+            "name": f"Video {video_id}",
+            "description": "",
+            "status": status,
+            "user": {"uri": self.user["uri"]},
+            "duration": 30 + video_id % 600,
+            "is_playable": available,
+            "created_time": _timestamp(video_id),
+            "modified_time": _timestamp(video_id),
+            "upload": {"status": "complete", "size": self.download_size},
+            "transcode": {
+                "status": TranscodeStatus.COMPLETE
+                if available
+                else TranscodeStatus.IN_PROGRESS
+            },
+            "parent_folder": {"uri": project["uri"], "name": project["name"]}
+            if project
+            else None,
+            "privacy": {"view": "anybody"},
+            "download": [],
+            **extra,
+        }
+        if status == VideoStatus.TRANSCODING:
+            self.transcoding[uri] = self.transcode_polls
+        elif available:
+            self._finish_transcode(uri)
+        return uri
+
+    def _finish_transcode(self, uri: str) -> None:
+        video = self.videos[uri]
+        video_id = uri.rsplit("/", 1)[-1]
+        video.update(status=VideoStatus.AVAILABLE, is_playable=True)
+        video["transcode"] = {"status": TranscodeStatus.COMPLETE}
+        video["download"] = [
+            {
+                "quality": quality,
+                "rendition": f"{height}p",
+                "height": height,
+                "size": self.download_size,
+                "link": f"{self.url}/download/{video_id}/{height}p",
+            }
+            for quality, height in (("hd", 1080), ("sd", 540))
+        ]
+
+    def _read_video(self, uri: str) -> dict:
+        """Return a video, moving it one step along if it is transcoding."""
+        with self.lock:
+            if uri in self.transcoding:
+                self.transcoding[uri] -= 1
+                if self.transcoding[uri] <= 0:
+                    del self.transcoding[uri]
+                    self._finish_transcode(uri)
+            return self.videos[uri]
+
+    def _touch(self, item: dict) -> None:
+        item["modified_time"] = datetime.now(UTC).isoformat()
+
+    # --------------------------------------------------------------------------
+    # HTTP
+    # --------------------------------------------------------------------------
+
+    def dispatch(self, handler: BaseHTTPRequestHandler) -> None:
+        parsed = urlparse(handler.path)
+        params = {key: value[-1] for key, value in parse_qs(parsed.query).items()}
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+        path = parsed.path.rstrip("/") or "/"
+        method = handler.command
+
+        if path.startswith("/tus/"):
+            self._handle_tus(handler, method, path, body)
+            return
+        if path.startswith("/download/"):
+            self._handle_download(handler, path)
+            return
+
+        with self.lock:
+            self.request_count += 1
+            self.log.append((method, path, dict(handler.headers)))
+        delay = self.latency + (
+            self.random.uniform(0, self.jitter) if self.jitter else 0
+        )
+        if delay:
+            time.sleep(delay)
+
+        headers, exhausted = self._count_rate_limit()
+        if exhausted:
+            self._send_json(handler, 429, {"error": "Too many requests"}, headers)
+            return
+        if self.error_rate and self.random.random() < self.error_rate:
+            with self.lock:
+                self.error_count += 1
+            self._send_json(handler, 503, {"error": "Injected failure"}, headers)
+            return
+
+        data = json.loads(body) if body else {}
+        try:
+            status, payload = self.route(method, path, params, data)
+        except KeyError:
+            status, payload = 404, {"error": "Not found"}
+        if status < 300 and payload and "paging" not in payload:  # noqa: PLR2004
+            # Lists are projected per item in `_paginate`
+            payload = project_fields(payload, params.get("fields"))
+        self._send_json(handler, status, payload, headers)
+
+    def _count_rate_limit(self) -> tuple[dict, bool]:
+        """Spend a request of the budget: its headers and whether it ran out."""
+        if self.rate_limit is None:
+            return {}, False
+        with self.lock:
+            now = time.time()
+            if now >= self.reset_at:
+                self.remaining = self.rate_limit
+                self.reset_at = now + self.rate_limit_window
+            exhausted = self.remaining <= 0
+            if not exhausted:
+                self.remaining -= 1
+            headers = {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(self.remaining),
+                # Whole seconds, rounded up so the reset is never early
+                "X-RateLimit-Reset": datetime.fromtimestamp(
+                    math.ceil(self.reset_at), UTC
+                ).strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+            }
+            if exhausted:
+                self.throttled_count += 1
+                headers["Retry-After"] = str(max(1, int(self.reset_at - now)))
+        return headers, exhausted
+
+    # --------------------------------------------------------------------------
+    # Routes
+    # --------------------------------------------------------------------------
+
+    def route(self, method: str, path: str, params: dict, data: dict) -> tuple:
+        """Answer an API request with `(status, payload)`, see `ROUTES`."""
+        for pattern, name in ROUTES:
+            match = pattern.fullmatch(path)
+            if match:
+                response = getattr(self, name)(method, match, params, data)
+                if response is not None:
+                    return response
+        return 404, {"error": "Not found"}
+
+    def _user(self, method: str, match: re.Match, params: dict, data: dict) -> tuple:
+        if method == "PATCH":
+            self.user.update(data)
+        return 200, dict(self.user)
+
+    def _user_videos(
+        self, method: str, match: re.Match, params: dict, data: dict
+    ) -> tuple:
+        if method == "POST":
+            if (data.get("upload") or {}).get("approach") == "pull":
+                return 201, self._create_pulled(data)
+            # A tus upload attempt is a 200, pyvimeo's upload() insists on it
+            return 200, self._create_upload(data)
+        return 200, self._paginate(match.group(0), list(self.videos.values()), params)
+
+    def _videos_by_uris(
+        self, method: str, match: re.Match, params: dict, data: dict
+    ) -> Optional[tuple]:  # noqa: UP007
+        if method != "GET":
+            return None
+        uris = [uri for uri in params.get("uris", "").split(",") if uri]
+        items = [self._read_video(uri) for uri in uris if uri in self.videos]
+        return 200, self._paginate(match.group(0), items, params)
+
+    def _video(
+        self, method: str, match: re.Match, params: dict, data: dict
+    ) -> Optional[tuple]:  # noqa: UP007
+        uri = match.group(0)
+        if method == "GET":
+            return 200, dict(self._read_video(uri))
+        video = self.videos[uri]
+        if method == "PATCH":
+            video.update(data)
+            self._touch(video)
+            return 200, dict(video)
+        if method == "DELETE":
+            del self.videos[uri]
+            return 204, None
+        return None
+
+    def _video_setting(
+        self, method: str, match: re.Match, params: dict, data: dict
+    ) -> tuple:
+        self.videos[match.group(1)]  # 404 for unknown videos
+        return 204, None
+
+    def _projects(
+        self, method: str, match: re.Match, params: dict, data: dict
+    ) -> tuple:
+        if method == "POST":
+            uri = self.add_project(data.get("name", ""), data.get("parent_folder_uri"))
+            return 201, self.projects[uri]
+        projects = list(self.projects.values())
+        return 200, self._paginate(match.group(0), projects, params)
+
+    def _project(self, method: str, match: re.Match, params: dict, data: dict) -> tuple:
+        uri = f"{self.user['uri']}/projects/{match.group(1)}"
+        project = self.projects[uri]
+        if method == "PATCH":
+            project.update(data)
+            self._touch(project)
+        elif method == "DELETE":
+            del self.projects[uri]
+            return 204, None
+        return 200, dict(project)
+
+    def _project_items(
+        self, method: str, match: re.Match, params: dict, data: dict
+    ) -> tuple:
+        uri = f"{self.user['uri']}/projects/{match.group(1)}"
+        self.projects[uri]  # 404 for unknown folders
+        kinds = {"folder": self.projects, "video": self.videos}
+        if params.get("type") in kinds:
+            kinds = {params["type"]: kinds[params["type"]]}
+        items = [
+            {"type": kind, kind: item}
+            for kind, collection in kinds.items()
+            for item in collection.values()
+            if (item.get("parent_folder") or {}).get("uri") == uri
+        ]
+        return 200, self._paginate(match.group(0), items, params)
+
+    def _project_videos(
+        self, method: str, match: re.Match, params: dict, data: dict
+    ) -> tuple:
+        uri = f"{self.user['uri']}/projects/{match.group(1)}"
+        project = self.projects[uri]
+        if match.group(2) and method == "PUT":
+            video = self.videos[f"/videos{match.group(2)}"]
+            video["parent_folder"] = {"uri": uri, "name": project["name"]}
+            self._touch(video)
+            return 204, None
+        items = [
+            video
+            for video in self.videos.values()
+            if (video.get("parent_folder") or {}).get("uri") == uri
+        ]
+        return 200, self._paginate(match.group(0), items, params)
+
+    def _paginate(self, path: str, items: list, params: dict) -> dict:
+        sort = SORT_FIELDS.get(params.get("sort", "default"), "created_time")
+        items = sorted(
+            items,
+            key=lambda item: item.get(sort) or "",
+            reverse=params.get("direction", "desc") == "desc",
+        )
+        page = int(params.get("page", 1))
+        per_page = min(int(params.get("per_page", 25)), 100)
+        last = max(1, -(-len(items) // per_page))
+        start = (page - 1) * per_page
+        return {
+            "total": len(items),
+            "page": page,
+            "per_page": per_page,
+            "paging": {
+                "next": f"{path}?page={page + 1}" if page < last else None,
+                "previous": f"{path}?page={page - 1}" if page > 1 else None,
+                "first": f"{path}?page=1",
+                "last": f"{path}?page={last}",
+            },
+            "data": [
+                project_fields(item, params.get("fields"))
+                for item in items[start : start + per_page]
+            ],
+        }
+
+    def _send_json(
+        self,
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        payload: Optional[dict],  # noqa: UP007
+        headers: Optional[dict] = None,  # noqa: UP007
+    ) -> None:
+        content = b"" if payload is None else json.dumps(payload).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/vnd.vimeo.*+json")
+        handler.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        if handler.command != "HEAD":
+            handler.wfile.write(content)
+
+    # --------------------------------------------------------------------------
+    # Uploads and downloads
+    # --------------------------------------------------------------------------
+
+    def _create_upload(self, data: dict) -> dict:
+        size = int(data["upload"]["size"])
+        uri = self.add_video(
+            status=VideoStatus.UPLOADING,
+            name=data.get("name", "Untitled"),
+            upload={"status": "in_progress", "approach": "tus", "size": size},
+        )
+        video_id = uri.rsplit("/", 1)[-1]
+        self.uploads[video_id] = {"uri": uri, "size": size, "offset": 0}
+        self.videos[uri]["upload"]["upload_link"] = f"{self.url}/tus/{video_id}"
+        return dict(self.videos[uri])
+
+    def _create_pulled(self, data: dict) -> dict:
+        """A video fetched by Vimeo from a link: created, and transcoding."""
+        uri = self.add_video(
+            status=VideoStatus.TRANSCODING,
+            name=data.get("name", "Untitled"),
+            upload={
+                "status": "complete",
+                "approach": "pull",
+                "link": data["upload"]["link"],
+            },
+        )
+        return dict(self.videos[uri])
+
+    def _handle_tus(
+        self, handler: BaseHTTPRequestHandler, method: str, path: str, body: bytes
+    ) -> None:
+        upload = self.uploads.get(path.rsplit("/", 1)[-1])
+        headers = {"Tus-Resumable": "1.0.0"}
+        if upload is None:
+            self._send_json(handler, 404, None, headers)
+            return
+        if method == "PATCH":
+            if int(handler.headers.get("Upload-Offset", -1)) != upload["offset"]:
+                self._send_json(handler, 409, None, headers)
+                return
+            upload["offset"] += len(body)
+            if upload["offset"] >= upload["size"]:
+                with self.lock:
+                    video = self.videos[upload["uri"]]
+                    video["upload"]["status"] = "complete"
+                    video["status"] = VideoStatus.TRANSCODING
+                    self.transcoding[upload["uri"]] = self.transcode_polls
+        headers["Upload-Offset"] = str(upload["offset"])
+        headers["Upload-Length"] = str(upload["size"])
+        self._send_json(handler, 204 if method == "PATCH" else 200, None, headers)
+
+    def _handle_download(self, handler: BaseHTTPRequestHandler, path: str) -> None:
+        """Serve deterministic bytes, honouring single `Range` requests."""
+        size = self.download_size
+        start, end = 0, size - 1
+        status = 200
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", handler.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2) or size - 1), size - 1)
+            status = 206
+        seed = path.encode()
+        block = (seed * (4096 // len(seed) + 1))[:4096]
+        content = (block * (size // len(block) + 1))[start : end + 1]
+        handler.send_response(status)
+        handler.send_header("Content-Type", "video/mp4")
+        handler.send_header("Content-Length", str(len(content)))
+        handler.send_header("Accept-Ranges", "bytes")
+        if status == 206:  # noqa: PLR2004
+            handler.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        handler.end_headers()
+        if handler.command != "HEAD":
+            handler.wfile.write(content)
@@ -0,0 +1,195 @@
+import array
+import contextlib
+import json
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from requests import Response
+
+from vimeo_utils.utils import get_field
+
+# A string column shares repeated values (statuses, privacy settings...)
+# until it has seen this many distinct ones, then it is left alone
+MAX_SHARED_STRINGS = 1024
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def loads(content: Union[bytes, str]) -> Any:  # noqa: UP007
+    """Decode JSON with orjson when it is installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _attribute(field: str) -> str:
+    return field.replace(".", "_")
+
+
+class Model:
+    """
+    A compact, read-only record holding only the requested `fields`.
+
+    `Video.for_fields(["uri", "upload.status"])` returns a subclass whose
+    `__slots__` are exactly those fields (dotted names become `upload_status`),
+    so instances carry no per-object dict. Classes are cached per field list.
+    """
+
+    __slots__ = ()
+    fields: tuple = ()
+    _classes: dict = {}
+
+    @classmethod
+    def for_fields(cls, fields: Iterable[str]) -> type:
+        fields = tuple(dict.fromkeys(fields))
+        key = (cls, fields)
+        model = Model._classes.get(key)
+        if model is None:
+            model = type(
+                cls.__name__,
+                (cls,),
+                {
+                    "__slots__": tuple(_attribute(field) for field in fields),
+                    "__module__": cls.__module__,
+                    "__qualname__": cls.__qualname__,
+                    "fields": fields,
+                },
+            )
+            Model._classes[key] = model
+        return model
+
+    @classmethod
+    def from_dict(cls, data: dict, fields: Optional[Iterable[str]] = None) -> "Model":  # noqa: UP007
+        """Build a record from an API object; `fields` default to its keys."""
+        model = cls if cls.fields and fields is None else cls.for_fields(fields or data)
+        instance = object.__new__(model)
+        for field in model.fields:
+            object.__setattr__(instance, _attribute(field), get_field(data, field))
+        return instance
+
+    @classmethod
+    def from_response(
+        cls,
+        response: Response,
+        fields: Optional[Iterable[str]] = None,  # noqa: UP007
+    ) -> "Model":
+        return cls.from_dict(loads(response.content), fields)
+
+    def __setattr__(self, name, value):
+        msg = f"{type(self).__name__} is read-only"
+        raise AttributeError(msg)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {getattr(self, 'uri', '')}>"
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((type(self), *self.to_dict().values()))
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, _attribute(field)) for field in self.fields}
+
+
+class Video(Model):
+    __slots__ = ()
+
+    @property
+    def id(self) -> int:
+        return int(self.uri.rsplit("/", 1)[-1])
+
+
+class Project(Model):
+    __slots__ = ()
+
+    @property
+    def id(self) -> int:
+        return int(self.uri.rsplit("/", 1)[-1])
+
+
+class User(Model):
+    __slots__ = ()
+
+    @property
+    def id(self) -> int:
+        return int(self.uri.rsplit("/", 1)[-1])
+
+
+class Columns:
+    """
+    A listing stored column by column: one list per field instead of one
+    dict per item. Low-cardinality string columns keep a single copy of each
+    value, and `freeze()` packs integer and float columns into `array.array`s.
+
+        columns = vapi_client.get_all_videos(fields=["uri", "duration"], columnar=True)
+        sum(columns["duration"])
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        self.fields = tuple(dict.fromkeys(fields))
+        self.columns: dict = {field: [] for field in self.fields}
+        self._shared: dict = {field: {} for field in self.fields}
+        self._length = 0
+
+    def append(self, item: Union[dict, Model]) -> None:  # noqa: UP007
+        for field, column in self.columns.items():
+            if isinstance(item, Model):
+                value = getattr(item, _attribute(field))
+            else:
+                value = get_field(item, field)
+            if isinstance(value, str):
+                value = self._share(field, value)
+            column.append(value)
+        self._length += 1
+
+    def _share(self, field: str, value: str) -> str:
+        shared = self._shared.get(field)
+        if shared is None:
+            return value
+        value = shared.setdefault(value, value)
+        if len(shared) > MAX_SHARED_STRINGS:
+            # Mostly distinct (names, URIs), the table would only cost memory
+            del self._shared[field]
+        return value
+
+    def extend(self, items: Iterable[Union[dict, Model]]) -> "Columns":  # noqa: UP007
+        for item in items:
+            self.append(item)
+        return self
+
+    def freeze(self) -> "Columns":
+        """Pack numeric columns into typed arrays."""
+        for field, column in self.columns.items():
+            if not isinstance(column, list) or not column:
+                continue
+            if all(_is_int(value) for value in column):
+                with contextlib.suppress(OverflowError):
+                    self.columns[field] = array.array("q", column)
+            elif all(_is_int(value) or isinstance(value, float) for value in column):
+                self.columns[field] = array.array("d", column)
+        return self
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: Union[str, int]) -> Any:  # noqa: UP007
+        """`columns["name"]` is a column, `columns[3]` is a row (as a dict)."""
+        if isinstance(key, str):
+            return self.columns[key]
+        return {field: column[key] for field, column in self.columns.items()}
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(self._length):
+            yield self[i]
+
+
+def _is_int(value: Any) -> bool:
+    # bool is an int subclass, but a column of flags isn't numeric
+    return isinstance(value, int) and not isinstance(value, bool)
@@ -0,0 +1,412 @@
+import concurrent.futures
+import queue
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+from typing import Optional
+
+from requests import Response
+
+from vimeo_utils import deadline
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.exceptions import NoClientError
+from vimeo_utils.fields import PROJECT_FIELDS
+from vimeo_utils.fields import VIDEO_LIST_FIELDS
+from vimeo_utils.utils import get_project_id_from_uri
+from vimeo_utils.waiter import AvailabilityWaiter
+
+USER_URI_RE = re.compile(r"^(/users/\d+)(?:/|$)")
+# Items buffered between the crawls and the merged stream
+MERGE_BUFFER = 1000
+# Owners remembered for URIs which don't name their user, least recently used dropped
+MAX_OWNERS = 100_000
+
+_DONE = object()
+
+
+class VimeoClientPool:
+    """
+    Several authenticated clients, possibly for several accounts, used as one.
+
+    Each call goes to a client of the account which owns the resource; among
+    that account's clients (several tokens for one account are fine) the
+    one with the most rate limit budget left is picked. Owners are learned
+    from the `/users/{id}` prefix of a URI, from crawls, or by asking each
+    account for unknown videos; at most `max_owners` of those learned are
+    remembered. Crawls such as `iter_all_videos()` run on every account at
+    once and are merged into one stream.
+
+    Folder methods take the folder's URI (`/users/{id}/projects/{id}`, as
+    crawls return it) rather than an id, since the URI names the owner.
+    Uploads and user edits aren't routed: use the client of the account
+    meant, e.g. `pool.reader(account)`.
+
+        pool = VimeoClientPool.from_tokens([token_a, token_b])
+        for video in pool.iter_all_videos():
+            ...
+        pool.edit_video(uri, {"name": "New"})  # sent with the owner's token
+    """
+
+    def __init__(self, clients: Iterable[VimeoAPIClient], max_owners: int = MAX_OWNERS):
+        self.clients = list(clients)
+        if not self.clients:
+            msg = "A pool needs at least one client"
+            raise ValueError(msg)
+        self.max_owners = max_owners
+        self._accounts: dict[int, str] = {}
+        self._owners: OrderedDict = OrderedDict()
+        self._grouped: Optional[dict[str, list[VimeoAPIClient]]] = None  # noqa: UP007
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[str], **kwargs) -> "VimeoClientPool":
+        """A pool with a client per access token, `kwargs` go to each client."""
+        import vimeo
+
+        return cls(
+            VimeoAPIClient(vimeo.VimeoClient(token=token), **kwargs) for token in tokens
+        )
+
+    # --------------------------------------------------------------------------
+    # Routing
+    # --------------------------------------------------------------------------
+
+    def account(self, client: VimeoAPIClient) -> str:
+        """The URI of the user `client` acts as, e.g. `/users/123`."""
+        with self._lock:
+            account = self._accounts.get(id(client))
+        if account is None:
+            if client.user_id is not None:
+                account = f"/users/{client.user_id}"
+            else:
+                account = client.get_user(fields=["uri"]).json()["uri"]
+            with self._lock:
+                self._accounts[id(client)] = account
+        return account
+
+    def accounts(self) -> dict[str, list[VimeoAPIClient]]:
+        """The pool's clients grouped by account."""
+        with self._lock:
+            if self._grouped is not None:
+                return self._grouped
+        # Looking an account up may be a request, don't hold the lock for it
+        owners = [(self.account(client), client) for client in self.clients]
+        with self._lock:
+            if self._grouped is None:
+                grouped: dict[str, list[VimeoAPIClient]] = {}
+                for account, client in owners:
+                    grouped.setdefault(account, []).append(client)
+                self._grouped = grouped
+            return self._grouped
+
+    @staticmethod
+    def budget(client: VimeoAPIClient) -> float:
+        """Requests `client` may still make; unknown until it has made one."""
+        remaining = client.scheduler.remaining()
+        return float("inf") if remaining is None else remaining
+
+    def reader(self, account: Optional[str] = None) -> VimeoAPIClient:  # noqa: UP007
+        """The client of `account` (or of any account) with the most budget."""
+        clients = self.clients if account is None else self.accounts().get(account)
+        if not clients:
+            msg = f"No client for {account}"
+            raise NoClientError(msg)
+        return max(clients, key=self.budget)
+
+    def register(self, uri: str, account: str) -> None:
+        """Record that `account` owns the resource at `uri`."""
+        if self._owner_from_uri(uri) == account:
+            return
+        with self._lock:
+            self._owners[uri] = account
+            self._owners.move_to_end(uri)
+            while len(self._owners) > self.max_owners:
+                self._owners.popitem(last=False)
+
+    def owner(self, uri: str) -> str:
+        """The account owning `uri`, asking the accounts if it isn't known yet."""
+        account = self._known_owner(uri)
+        if account is None:
+            self._resolve([uri], ["uri"])
+            account = self._known_owner(uri)
+        if account is None:
+            msg = f"No client in the pool can see {uri}"
+            raise NoClientError(msg)
+        return account
+
+    def client_for(self, uri: str) -> VimeoAPIClient:
+        """The owning account's client with the most budget."""
+        return self.reader(self.owner(uri))
+
+    def project_client(self, project_uri: str) -> VimeoAPIClient:
+        """The client of the account owning the folder at `project_uri`."""
+        account = self._owner_from_uri(project_uri)
+        if account is None:
+            msg = f"No client in the pool owns {project_uri}"
+            raise NoClientError(msg)
+        return self.reader(account)
+
+    def _known_owner(self, uri: str) -> Optional[str]:  # noqa: UP007
+        account = self._owner_from_uri(uri)
+        if account is not None:
+            return account
+        with self._lock:
+            account = self._owners.get(uri)
+            if account is not None:
+                self._owners.move_to_end(uri)
+            return account
+
+    def _owner_from_uri(self, uri: str) -> Optional[str]:  # noqa: UP007
+        """The pool's account named by the `/users/{id}` prefix of `uri`."""
+        match = USER_URI_RE.match(uri)
+        if match and match.group(1) in self.accounts():
+            return match.group(1)
+        return None
+
+    def _resolve(
+        self, uris: list[str], fields: list[str], *, cache: bool = True
+    ) -> dict[str, dict]:
+        """Ask each account in turn for `uris`, recording who owns what."""
+        accounts = self.accounts()
+        fields = list(dict.fromkeys([*fields, "uri", "user.uri"]))
+        found: dict[str, dict] = {}
+        missing = list(uris)
+        for account in accounts:
+            if not missing:
+                break
+            videos = self.reader(account).get_videos_by_uris(
+                missing, fields=fields, cache=cache
+            )
+            for uri, video in videos.items():
+                owner = (video.get("user") or {}).get("uri")
+                self.register(uri, owner if owner in accounts else account)
+            found.update(videos)
+            missing = [uri for uri in missing if uri not in videos]
+        return found
+
+    # --------------------------------------------------------------------------
+    # Calls
+    # --------------------------------------------------------------------------
+
+    def get_video(self, vimeo_uri: str, **kwargs) -> Response:
+        return self.client_for(vimeo_uri).get_video(vimeo_uri, **kwargs)
+
+    def edit_video(self, vimeo_uri: str, params: dict) -> Response:
+        return self.client_for(vimeo_uri).edit_video(vimeo_uri, params)
+
+    def delete_video(self, vimeo_uri: str) -> Response:
+        return self.client_for(vimeo_uri).delete_video(vimeo_uri)
+
+    def add_domain_to_whitelist(self, vimeo_uri: str, domain: str) -> Response:
+        return self.client_for(vimeo_uri).add_domain_to_whitelist(vimeo_uri, domain)
+
+    def edit_embed_preset(self, vimeo_uri: str, preset_id: int) -> Response:
+        return self.client_for(vimeo_uri).edit_embed_preset(vimeo_uri, preset_id)
+
+    def create_project(
+        self,
+        name: str,
+        parent_folder_uri: Optional[str] = None,  # noqa: UP007
+        account: Optional[str] = None,  # noqa: UP007
+        **kwargs,
+    ) -> Response:
+        """
+        Create a folder in `parent_folder_uri`, or at the top level of
+        `account` (which may be left out when the pool has only one).
+        """
+        if parent_folder_uri is not None:
+            client = self.project_client(parent_folder_uri)
+        elif account is not None or len(self.accounts()) == 1:
+            client = self.reader(account)
+        else:
+            msg = "Several accounts in the pool, say which one the folder is for"
+            raise NoClientError(msg)
+        return client.create_project(name, parent_folder_uri, **kwargs)
+
+    def get_project(self, project_uri: str, **kwargs) -> Response:
+        return self.project_client(project_uri).get_project(
+            get_project_id_from_uri(project_uri), **kwargs
+        )
+
+    def edit_project(self, project_uri: str, name: str) -> Response:
+        return self.project_client(project_uri).edit_project(
+            get_project_id_from_uri(project_uri), name
+        )
+
+    def delete_project(
+        self, project_uri: str, should_delete_clips: bool = False
+    ) -> Response:
+        return self.project_client(project_uri).delete_project(
+            get_project_id_from_uri(project_uri), should_delete_clips
+        )
+
+    def move_to_project(self, project_uri: str, video_uri: str) -> Response:
+        return self.project_client(project_uri).move_to_project(
+            get_project_id_from_uri(project_uri), video_uri
+        )
+
+    def get_videos_by_uris(
+        self,
+        vimeo_uris: Iterable[str],
+        fields: Optional[list[str]] = None,  # noqa: UP007
+        *,
+        cache: bool = True,
+    ) -> dict[str, dict]:
+        """
+        `VideoMixin.get_videos_by_uris()` across accounts: each owner's URIs
+        are fetched concurrently with its least used client.
+        """
+        uris = list(dict.fromkeys(vimeo_uris))
+        fields = fields or VIDEO_LIST_FIELDS
+        groups: dict[str, list[str]] = {}
+        unknown = []
+        for uri in uris:
+            account = self._known_owner(uri)
+            if account is None:
+                unknown.append(uri)
+            else:
+                groups.setdefault(account, []).append(uri)
+
+        found: dict[str, dict] = {}
+        if groups:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(groups)
+            ) as executor:
+                futures = [
+                    deadline.submit(
+                        executor,
+                        self.reader(account).get_videos_by_uris,
+                        group,
+                        fields,
+                        cache=cache,
+                    )
+                    for account, group in groups.items()
+                ]
+                for future in futures:
+                    found.update(future.result())
+        if unknown:
+            found.update(self._resolve(unknown, fields, cache=cache))
+        return {uri: found[uri] for uri in uris if uri in found}
+
+    def wait_until_available(
+        self, vimeo_uris: Iterable[str], **kwargs
+    ) -> dict[str, concurrent.futures.Future]:
+        """`VideoMixin.wait_until_available()` for videos of any account."""
+        return AvailabilityWaiter(self, vimeo_uris, **kwargs).start()
+
+    # --------------------------------------------------------------------------
+    # Crawls
+    # --------------------------------------------------------------------------
+
+    def fan_out(
+        self, crawl: Callable[[VimeoAPIClient], Iterable[Any]]
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Run `crawl(client)` for every account at once and yield
+        `(account, item)` as items arrive from any of them.
+        """
+        merge = _Merge(crawl)
+        for account in self.accounts():
+            threading.Thread(
+                target=deadline.bind(merge.produce),
+                args=(account, self.reader(account)),
+                daemon=True,
+            ).start()
+        yield from merge.consume(len(self.accounts()))
+
+    def iter_all_videos(
+        self,
+        fields: Optional[list[str]] = None,  # noqa: UP007
+        per_page: int = 100,
+    ) -> Iterator[dict]:
+        """Every video of every account, as one stream."""
+        fields = list(dict.fromkeys(["uri", *(fields or VIDEO_LIST_FIELDS)]))
+        for account, video in self.fan_out(
+            lambda client: client.iter_all_videos(
+                fields=fields, per_page=per_page, ordered=False
+            )
+        ):
+            self.register(video["uri"], account)
+            yield video
+
+    def get_all_videos(
+        self,
+        fields: Optional[list[str]] = None,  # noqa: UP007
+        per_page: int = 100,
+    ) -> list[dict]:
+        return list(self.iter_all_videos(fields, per_page))
+
+    def iter_all_projects(
+        self,
+        fields: Optional[list[str]] = None,  # noqa: UP007
+        per_page: int = 100,
+    ) -> Iterator[dict]:
+        """Every folder of every account, as one stream."""
+        fields = list(dict.fromkeys(["uri", *(fields or PROJECT_FIELDS)]))
+        for _, project in self.fan_out(
+            lambda client: client.iter_all_projects(
+                fields=fields, per_page=per_page, ordered=False
+            )
+        ):
+            yield project
+
+    def close(self) -> None:
+        for client in self.clients:
+            client.close()
+
+    def __enter__(self) -> "VimeoClientPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _Merge:
+    """The queue the crawls of `fan_out()` feed, read as one stream."""
+
+    def __init__(self, crawl: Callable[[VimeoAPIClient], Iterable[Any]]):
+        self.crawl = crawl
+        self.items: queue.Queue = queue.Queue(maxsize=MERGE_BUFFER)
+        self.stop = threading.Event()
+
+    def put(self, entry: tuple) -> bool:
+        """Queue `entry`, unless the stream was closed first."""
+        while not self.stop.is_set():
+            try:
+                self.items.put(entry, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def produce(self, account: str, client: VimeoAPIClient) -> None:
+        try:
+            for item in self.crawl(client):
+                if not self.put((account, item)):
+                    return
+        except Exception as error:  # noqa: BLE001 - raised by the consumer
+            self.put((_DONE, error))
+            return
+        self.put((_DONE, None))
+
+    def consume(self, running: int) -> Iterator[tuple[str, Any]]:
+        """Items until `running` crawls have finished, re-raising their errors."""
+        try:
+            while running:
+                try:
+                    account, item = self.items.get(timeout=deadline.wait_timeout())
+                except queue.Empty:
+                    deadline.check()
+                    continue
+                if account is _DONE:
+                    running -= 1
+                    if item is not None:
+                        raise item
+                    continue
+                yield account, item
+        finally:
+            self.stop.set()
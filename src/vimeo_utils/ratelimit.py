@@ -0,0 +1,244 @@
+import contextlib
+import json
+import math
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+from requests.structures import CaseInsensitiveDict
+
+from vimeo_utils import deadline
+
+# How long to hold off when Vimeo answers 429 without telling us when the
+# budget resets.
+DEFAULT_COOLDOWN = 60.0
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:  # noqa: UP007
+    """Parse `X-RateLimit-Reset` (ISO 8601 or epoch seconds) to epoch seconds."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class MemoryBackend:
+    """Keeps scheduler state in process memory, shared between threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: dict = {}
+
+    @contextlib.contextmanager
+    def transaction(self, write: bool = True) -> Iterator[dict]:
+        with self._lock:
+            yield self._state
+
+
+class FileBackend:
+    """
+    Keeps scheduler state in a JSON file guarded by an exclusive `flock`, so
+    every worker process on the host draws from the same budget (POSIX only).
+    Read-only transactions (`write=False`) take a shared lock and leave the
+    file alone.
+    """
+
+    def __init__(self, path: Union[str, Path]):  # noqa: UP007
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def transaction(self, write: bool = True) -> Iterator[dict]:
+        import fcntl
+
+        with self._lock, self.path.open("a+") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+            try:
+                fh.seek(0)
+                raw = fh.read()
+                state = json.loads(raw) if raw else {}
+                yield state
+                if not write:
+                    return
+                fh.seek(0)
+                fh.truncate()
+                json.dump(state, fh)
+                fh.flush()
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+class RateLimitScheduler:
+    """
+    Token bucket scheduler driven by Vimeo's `X-RateLimit-*` headers.
+
+    Every request takes a token and a concurrency slot. Tokens refill at
+    `rate` per second, or at the rate that spreads the remaining budget
+    (minus `reserve`) over the time left until the reset, whichever is
+    lower. Concurrency follows Little's law (refill rate x average latency),
+    clamped to `[min_concurrency, max_concurrency]`.
+
+    The bucket state lives in a backend: `MemoryBackend` shares it between
+    threads, `FileBackend` between processes. One scheduler may be shared by
+    several clients using the same token.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        rate: Optional[float] = None,  # noqa: UP007
+        burst: int = 10,
+        max_concurrency: int = 6,
+        min_concurrency: int = 1,
+        reserve: int = 0,
+        backend: Union[MemoryBackend, FileBackend, None] = None,  # noqa: UP007
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.reserve = reserve
+        self.backend = backend or MemoryBackend()
+        self.concurrency = max_concurrency
+        self.latency: Optional[float] = None  # noqa: UP007
+        self._active = 0
+        self._condition = threading.Condition()
+
+    # --------------------------------------------------------------------------
+    # Budget
+    # --------------------------------------------------------------------------
+
+    def refill_rate(self, state: dict, now: float) -> float:
+        """Tokens per second we may spend right now."""
+        rate = math.inf if self.rate is None else self.rate
+        remaining = state.get("remaining")
+        reset_at = state.get("reset_at")
+        if remaining is not None and reset_at is not None and reset_at > now:
+            budget = max(0, remaining - self.reserve)
+            rate = min(rate, budget / (reset_at - now))
+        return rate
+
+    def _take_token(self, state: dict, now: float) -> float:
+        """Take a token if one is available, otherwise return the wait time."""
+        reset_at = state.get("reset_at")
+        if reset_at is not None and reset_at <= now:
+            # The window rolled over, the previous budget no longer applies
+            state.pop("remaining", None)
+            state.pop("reset_at", None)
+            reset_at = None
+
+        rate = self.refill_rate(state, now)
+        if math.isinf(rate):
+            tokens = self.burst
+        else:
+            tokens = state.get("tokens", self.burst)
+            elapsed = max(0.0, now - state.get("updated", now))
+            tokens = min(self.burst, tokens + elapsed * rate)
+        # Never spend more than Vimeo says is left, burst or not
+        remaining = state.get("remaining")
+        exhausted = remaining is not None and remaining - self.reserve < 1
+        if remaining is not None:
+            tokens = min(tokens, max(0, remaining - self.reserve))
+        state["updated"] = now
+        if tokens >= 1:
+            state["tokens"] = tokens - 1
+            if remaining is not None:
+                state["remaining"] = remaining - 1
+            return 0.0
+
+        state["tokens"] = tokens
+        if exhausted or rate <= 0:
+            return max(0.0, (reset_at or now + DEFAULT_COOLDOWN) - now)
+        return (1 - tokens) / rate
+
+    def _adjust_concurrency(self, state: dict, now: float) -> None:
+        rate = self.refill_rate(state, now)
+        if math.isinf(rate) or self.latency is None:
+            concurrency = self.max_concurrency
+        else:
+            concurrency = math.ceil(rate * self.latency)
+        self.concurrency = max(
+            self.min_concurrency, min(self.max_concurrency, concurrency)
+        )
+
+    def remaining(self) -> Optional[int]:  # noqa: UP007
+        """Last known remaining budget, or `None` if Vimeo hasn't told us yet."""
+        with self.backend.transaction(write=False) as state:
+            return state.get("remaining")
+
+    # --------------------------------------------------------------------------
+    # Scheduling
+    # --------------------------------------------------------------------------
+
+    def acquire(self) -> None:
+        """
+        Block until a concurrency slot and a token are available, or the
+        current deadline ends.
+        """
+        with self._condition:
+            while self._active >= self.concurrency:
+                deadline.check()
+                self._condition.wait(deadline.wait_timeout())
+            self._active += 1
+        try:
+            while True:
+                with self.backend.transaction() as state:
+                    wait = self._take_token(state, time.time())
+                if wait <= 0:
+                    return
+                deadline.sleep(wait)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def update(self, headers: CaseInsensitiveDict, latency: Optional[float] = None):  # noqa: UP007
+        """Record the budget reported by a response and the observed latency."""
+        if latency is not None:
+            self.latency = (
+                latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            )
+        now = time.time()
+        with self.backend.transaction() as state:
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset_at = parse_reset(headers.get("X-RateLimit-Reset"))
+            if remaining is not None:
+                state["remaining"] = int(remaining)
+            if reset_at is not None:
+                state["reset_at"] = reset_at
+            self._adjust_concurrency(state, now)
+        with self._condition:
+            self._condition.notify_all()
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:  # noqa: UP007
+        """Vimeo answered 429, spend nothing until the budget resets."""
+        now = time.time()
+        with self.backend.transaction() as state:
+            state["remaining"] = 0
+            if retry_after is not None:
+                state["reset_at"] = now + retry_after
+            elif state.get("reset_at", 0) <= now:
+                state["reset_at"] = now + DEFAULT_COOLDOWN
+            state["tokens"] = 0
+            self._adjust_concurrency(state, now)
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,154 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from vimeo_utils.exceptions import CircuitOpenError
+
+# Methods which are safe to repeat. PATCH is only retried when the caller
+# says the payload is idempotent (i.e. it sets absolute values).
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:  # noqa: UP007
+    """Parse a `Retry-After` header (delta seconds or HTTP date) to seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a request.
+
+    Backoff is exponential (`backoff_factor * 2 ** attempt`, capped at
+    `max_backoff`) with full jitter. A `Retry-After` header, when present,
+    is used as the lower bound.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        statuses: frozenset = RETRY_STATUSES,
+        methods: frozenset = IDEMPOTENT_METHODS,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = statuses
+        self.methods = methods
+
+    def can_retry(self, method: str, idempotent: Optional[bool] = None) -> bool:  # noqa: UP007
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.methods
+
+    def should_retry(self, status_code: int) -> bool:
+        return status_code in self.statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:  # noqa: UP007
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Fail fast while Vimeo is degraded.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests raise `CircuitOpenError` without touching the network. Once
+    `reset_timeout` seconds have passed a single trial request is let
+    through; its success closes the circuit, its failure opens it again.
+    A trial which proves nothing either way (a 429, a cancellation) hands
+    its turn to the next request.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if (
+                self.state == self.OPEN
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            ):
+                self.state = self.HALF_OPEN
+                return
+            msg = "Circuit open, Vimeo looks degraded"
+            raise CircuitOpenError(msg)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_inconclusive(self) -> None:
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class RetryStats:
+    """Counters showing what retrying is costing us."""
+
+    def __init__(self):
+        self.retries = 0
+        self.backoff_seconds = 0.0
+        self.retries_by_status: dict = {}
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def record_retry(self, status: Optional[int], delay: float) -> None:  # noqa: UP007
+        key = status or "connection"
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+            self.retries_by_status[key] = self.retries_by_status.get(key, 0) + 1
+
+    def record_rejected(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "backoff_seconds": self.backoff_seconds,
+                "retries_by_status": dict(self.retries_by_status),
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,37 @@
+import threading
+from collections.abc import Callable
+from collections.abc import Hashable
+from concurrent.futures import Future
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls: while a call for `key` is in flight, other
+    callers asking for the same key wait for, and share, its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -0,0 +1,67 @@
+from typing import Optional
+
+from vimeo_utils.constants import TranscodeStatus
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.utils import select_download_link
+
+# The union of the fields every status predicate needs
+SNAPSHOT_FIELDS = [
+    "uri",
+    "status",
+    "is_playable",
+    "upload.status",
+    "transcode.status",
+    "download",
+]
+
+
+class VideoSnapshot:
+    """
+    The state of a video at one point in time, fetched with a single request
+    so several predicates can be checked without further round trips.
+    """
+
+    def __init__(self, data: dict):
+        self.data = data
+
+    def __repr__(self):
+        return f"<VideoSnapshot {self.uri} {self.status}>"
+
+    @property
+    def uri(self) -> str:
+        return self.data["uri"]
+
+    @property
+    def status(self) -> str:
+        return self.data["status"]
+
+    @property
+    def upload_status(self) -> Optional[str]:  # noqa: UP007
+        return (self.data.get("upload") or {}).get("status")
+
+    @property
+    def transcode_status(self) -> Optional[str]:  # noqa: UP007
+        return (self.data.get("transcode") or {}).get("status")
+
+    @property
+    def is_available(self) -> bool:
+        return self.status == VideoStatus.AVAILABLE
+
+    @property
+    def is_transcode_complete(self) -> bool:
+        return self.transcode_status == TranscodeStatus.COMPLETE
+
+    @property
+    def is_playable(self) -> bool:
+        return bool(self.data.get("is_playable"))
+
+    @property
+    def is_error(self) -> bool:
+        return self.status in {
+            VideoStatus.TRANSCODING_ERROR,
+            VideoStatus.UPLOADING_ERROR,
+        }
+
+    @property
+    def download_link(self) -> Optional[str]:  # noqa: UP007
+        return select_download_link(self.data.get("download") or [])
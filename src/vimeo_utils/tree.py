@@ -0,0 +1,251 @@
+import concurrent.futures
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+from vimeo_utils import deadline
+from vimeo_utils.utils import get_project_id_from_uri
+
+TREE_FOLDER_FIELDS = ["uri", "name", "parent_folder"]
+# What a folder's videos are counted and sized from
+TREE_VIDEO_FIELDS = ["uri", "upload.size"]
+
+
+class ProjectNode:
+    """A folder in the tree, with the videos directly inside it."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        uri: str,
+        name: str,
+        depth: int = 0,
+        parent: Optional[str] = None,  # noqa: UP007
+        video_count: int = 0,
+        size: int = 0,
+    ):
+        self.uri = uri
+        self.name = name
+        self.depth = depth
+        self.parent = parent
+        self.video_count = video_count
+        self.size = size
+        self.children: list[ProjectNode] = []
+
+    def __repr__(self):
+        return f"<ProjectNode {self.uri} {self.name!r}>"
+
+    @property
+    def id(self) -> str:
+        return get_project_id_from_uri(self.uri)
+
+    @property
+    def total_video_count(self) -> int:
+        """Videos in this folder and every folder below it."""
+        return self.video_count + sum(c.total_video_count for c in self.children)
+
+    @property
+    def total_size(self) -> int:
+        """Bytes of video in this folder and every folder below it."""
+        return self.size + sum(c.total_size for c in self.children)
+
+    def walk(self) -> Iterator["ProjectNode"]:
+        """This folder and every folder below it, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> dict:
+        return {
+            "uri": self.uri,
+            "name": self.name,
+            "depth": self.depth,
+            "parent": self.parent,
+            "video_count": self.video_count,
+            "size": self.size,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProjectNode":
+        node = cls(
+            data["uri"],
+            data["name"],
+            data["depth"],
+            data["parent"],
+            data["video_count"],
+            data["size"],
+        )
+        node.children = [cls.from_dict(child) for child in data["children"]]
+        return node
+
+
+class ProjectTree:
+    """
+    The folder hierarchy: top level `roots`, every folder in `nodes`. `key`
+    records what was crawled (root and depth), so a saved snapshot is only
+    reused for the same crawl.
+    """
+
+    def __init__(
+        self,
+        roots: Optional[list[ProjectNode]] = None,  # noqa: UP007
+        key: Optional[dict] = None,  # noqa: UP007
+    ):
+        self.roots = roots or []
+        self.key = key or {}
+        self.created = time.time()
+
+    @property
+    def nodes(self) -> dict[str, ProjectNode]:
+        return {node.uri: node for root in self.roots for node in root.walk()}
+
+    def get(self, uri: str) -> Optional[ProjectNode]:  # noqa: UP007
+        return self.nodes.get(uri)
+
+    @property
+    def total_video_count(self) -> int:
+        return sum(root.total_video_count for root in self.roots)
+
+    @property
+    def total_size(self) -> int:
+        return sum(root.total_size for root in self.roots)
+
+    def save(self, path: Union[str, Path]) -> None:  # noqa: UP007
+        path = Path(path)
+        tmp = path.with_suffix(f"{path.suffix}.tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "key": self.key,
+                    "created": self.created,
+                    "roots": [root.to_dict() for root in self.roots],
+                }
+            )
+        )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ProjectTree":  # noqa: UP007
+        data = json.loads(Path(path).read_text())
+        tree = cls(
+            [ProjectNode.from_dict(root) for root in data["roots"]],
+            data.get("key"),
+        )
+        tree.created = data["created"]
+        return tree
+
+
+class ProjectWalker:
+    """
+    Explores the folder hierarchy breadth first. Every folder of a level is
+    listed (its subfolders and its videos) concurrently, at most
+    `max_workers` at a time, before moving on to the next level.
+
+    Folders already visited are skipped, so a cycle can't loop forever, and
+    nothing below `max_depth` (the top level being 0) is explored.
+    """
+
+    def __init__(
+        self,
+        vclient,
+        max_depth: Optional[int] = None,  # noqa: UP007
+        max_workers: Optional[int] = None,  # noqa: UP007
+        video_fields: Optional[list[str]] = None,  # noqa: UP007
+    ):
+        self.vclient = vclient
+        self.max_depth = max_depth
+        self.max_workers = max_workers or vclient.scheduler.max_concurrency
+        self.video_fields = list(
+            dict.fromkeys([*TREE_VIDEO_FIELDS, *(video_fields or [])])
+        )
+        self.tree: Optional[ProjectTree] = None  # noqa: UP007
+
+    def iter_walk(
+        self,
+        root_uri: Optional[str] = None,  # noqa: UP007
+    ) -> Iterator[tuple[ProjectNode, list[dict]]]:
+        """
+        Yield `(folder, videos)` as each folder is explored, starting from the
+        folder at `root_uri` or, by default, the top level folders.
+        """
+        self.tree = ProjectTree(
+            self._roots(root_uri), {"root_uri": root_uri, "max_depth": self.max_depth}
+        )
+        seen = set()
+        level = []
+        for root in self.tree.roots:
+            seen.add(root.uri)
+            level.append(root)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            while level:
+                futures = {
+                    deadline.submit(executor, self._explore, node): node
+                    for node in level
+                }
+                next_level = []
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        node = futures[future]
+                        children, videos = future.result()
+                        for child in children:
+                            if child.uri in seen:
+                                continue
+                            seen.add(child.uri)
+                            node.children.append(child)
+                            next_level.append(child)
+                        yield node, videos
+                finally:
+                    for future in futures:
+                        future.cancel()
+                level = next_level
+
+    def walk(self, root_uri: Optional[str] = None) -> ProjectTree:  # noqa: UP007
+        for _ in self.iter_walk(root_uri):
+            pass
+        return self.tree
+
+    def _roots(self, root_uri: Optional[str]) -> list[ProjectNode]:  # noqa: UP007
+        if root_uri is not None:
+            project = self.vclient.get_project(
+                get_project_id_from_uri(root_uri), fields=["uri", "name"]
+            ).json()
+            return [ProjectNode(project["uri"], project["name"])]
+        return [
+            ProjectNode(project["uri"], project["name"])
+            for project in self.vclient.get_all_projects(fields=TREE_FOLDER_FIELDS)
+            if not project.get("parent_folder")
+        ]
+
+    def _explore(self, node: ProjectNode) -> tuple[list[ProjectNode], list[dict]]:
+        videos = list(
+            self.vclient.iter_videos_from_project(
+                node.id, fields=self.video_fields, ordered=False
+            )
+        )
+        node.video_count = len(videos)
+        node.size = sum(
+            (video.get("upload") or {}).get("size") or 0 for video in videos
+        )
+
+        children = []
+        if self.max_depth is None or node.depth < self.max_depth:
+            children = [
+                ProjectNode(
+                    item["folder"]["uri"],
+                    item["folder"]["name"],
+                    node.depth + 1,
+                    node.uri,
+                )
+                for item in self.vclient.paginate(
+                    f"{self.vclient.base_uri}/projects/{node.id}/items",
+                    params={"type": "folder"},
+                    fields=["folder.uri", "folder.name"],
+                )
+            ]
+        return children, videos
@@ -0,0 +1,238 @@
+import concurrent.futures
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+import requests
+
+from vimeo_utils import deadline
+from vimeo_utils.dedup import UploadIndex
+
+TUS_VERSION = "1.0.0"
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024  # 64 MB
+GONE_STATUSES = {404, 410}
+
+
+class UploadProgress:
+    """A progress event for a single file."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str,
+        uri: str,
+        offset: int,
+        size: int,
+        bytes_per_second: float,
+        done: bool = False,
+    ):
+        self.path = path
+        self.uri = uri
+        self.offset = offset
+        self.size = size
+        self.bytes_per_second = bytes_per_second
+        self.done = done
+
+    def __repr__(self):
+        return f"<UploadProgress {self.path} {self.percent:.1f}%>"
+
+    @property
+    def percent(self) -> float:
+        return 100.0 if not self.size else self.offset * 100.0 / self.size
+
+
+class UploadStateFile:
+    """
+    Resume offsets of in-progress uploads, persisted as JSON so a restarted
+    process picks up where it stopped. Writes are atomic.
+    """
+
+    def __init__(self, path: Union[str, Path]):  # noqa: UP007
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._state = json.loads(self.path.read_text()) if self.path.exists() else {}
+
+    def get(self, key: str) -> Optional[dict]:  # noqa: UP007
+        with self._lock:
+            entry = self._state.get(key)
+            return dict(entry) if entry else None
+
+    def set(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self._state[key] = entry
+            self._save()
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            if self._state.pop(key, None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        tmp = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        tmp.write_text(json.dumps(self._state))
+        tmp.replace(self.path)
+
+
+class UploadManager:
+    """
+    Uploads many files to Vimeo, `max_workers` at a time, with tus.
+
+    Each file is sent in `chunk_size` PATCHes. After every chunk the offset
+    is saved to `state_path` (if given), so a file which was interrupted is
+    resumed from the offset the tus server reports instead of from scratch.
+    A failed chunk is retried `retries` times (with exponential backoff from
+    `retry_delay`) after resyncing the offset.
+    `callback` receives an `UploadProgress` after every chunk. Chunks go
+    over the client's pooled transport unless another `session` is given.
+    With a `dedup` `UploadIndex`, files whose content was already uploaded
+    return the existing video's URI instead.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        vclient,
+        max_workers: int = 3,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        state_path: Union[str, Path, None] = None,  # noqa: UP007
+        callback: Optional[Callable[[UploadProgress], None]] = None,  # noqa: UP007
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        session: Optional[requests.Session] = None,  # noqa: UP007
+        dedup: Optional[UploadIndex] = None,  # noqa: UP007
+    ):
+        self.vclient = vclient
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.state = UploadStateFile(state_path) if state_path else None
+        self.callback = callback
+        self.retries = retries
+        self.retry_delay = retry_delay
+        if session is None and getattr(vclient, "transport", None) is not None:
+            session = vclient.transport.session
+        self.session = session or requests.Session()
+        self.dedup = dedup
+
+    def upload(
+        self,
+        files: Iterable[str],
+        params: Optional[dict] = None,  # noqa: UP007
+    ) -> dict[str, concurrent.futures.Future]:
+        """Queue `files` for upload, return a future (of the video URI) per file."""
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {
+            str(path): deadline.submit(executor, self.upload_file, str(path), params)
+            for path in files
+        }
+        executor.shutdown(wait=False)
+        return futures
+
+    def upload_file(self, path: str, params: Optional[dict] = None) -> str:  # noqa: UP007
+        """Upload (or resume) a single file and return its video URI."""
+        if self.dedup is not None:
+            return self.dedup.get_or_upload(
+                self.vclient, path, lambda: self._upload_file(path, params)
+            )
+        return self._upload_file(path, params)
+
+    def _upload_file(self, path: str, params: Optional[dict]) -> str:  # noqa: UP007
+        key = str(Path(path).resolve())
+        stat = Path(path).stat()
+        entry = self.state.get(key) if self.state else None
+        offset = None
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+            offset = self._get_offset(entry["upload_link"])
+        if offset is None:
+            entry = self._create(path, stat, params)
+            offset = 0
+
+        start = time.monotonic()
+        resumed_at = offset
+        with Path(path).open("rb") as fh:
+            while offset < entry["size"]:
+                offset = self._send_chunk(fh, entry["upload_link"], offset)
+                if self.state:
+                    self.state.set(key, {**entry, "offset": offset})
+                elapsed = max(time.monotonic() - start, 1e-9)
+                self._notify(
+                    path, entry, offset, (offset - resumed_at) / elapsed, done=False
+                )
+
+        if self.state:
+            self.state.remove(key)
+        elapsed = max(time.monotonic() - start, 1e-9)
+        self._notify(path, entry, offset, (offset - resumed_at) / elapsed, done=True)
+        return entry["uri"]
+
+    def _create(self, path: str, stat: os.stat_result, params: Optional[dict]) -> dict:  # noqa: UP007
+        data = {**(params or {}), "upload": {"approach": "tus", "size": stat.st_size}}
+        response = self.vclient.request(
+            "post",
+            f"{self.vclient.base_uri}/videos",
+            data=data,
+            params={"fields": "uri,upload"},
+        )
+        response.raise_for_status()
+        body = response.json()
+        entry = {
+            "uri": body["uri"],
+            "upload_link": body["upload"]["upload_link"],
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "offset": 0,
+        }
+        if self.state:
+            self.state.set(str(Path(path).resolve()), entry)
+        return entry
+
+    def _get_offset(self, upload_link: str) -> Optional[int]:  # noqa: UP007
+        """Ask the tus server how much it has, `None` if the upload is gone."""
+        response = self.session.head(
+            upload_link,
+            headers={"Tus-Resumable": TUS_VERSION},
+            timeout=deadline.capped(30),
+        )
+        if response.status_code in GONE_STATUSES:
+            return None
+        response.raise_for_status()
+        return int(response.headers["Upload-Offset"])
+
+    def _send_chunk(self, fh, upload_link: str, offset: int) -> int:
+        attempt = 0
+        while True:
+            fh.seek(offset)
+            chunk = fh.read(self.chunk_size)
+            try:
+                response = self.session.patch(
+                    upload_link,
+                    data=chunk,
+                    headers={
+                        "Tus-Resumable": TUS_VERSION,
+                        "Upload-Offset": str(offset),
+                        "Content-Type": "application/offset+octet-stream",
+                    },
+                    timeout=deadline.capped((10, 300)),
+                )
+                response.raise_for_status()
+                return int(response.headers["Upload-Offset"])
+            except requests.RequestException:
+                if attempt >= self.retries:
+                    raise
+                deadline.sleep(min(30, self.retry_delay * 2**attempt))
+                attempt += 1
+                # Part of the chunk may have landed, carry on from there
+                server_offset = self._get_offset(upload_link)
+                if server_offset is not None:
+                    offset = server_offset
+
+    def _notify(  # noqa: PLR0913
+        self, path: str, entry: dict, offset: int, rate: float, done: bool
+    ) -> None:
+        if self.callback is not None:
+            self.callback(
+                UploadProgress(path, entry["uri"], offset, entry["size"], rate, done)
+            )
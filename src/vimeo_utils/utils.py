@@ -1,4 +1,7 @@
-import re
+from typing import Any
+from typing import Optional
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
 
 
 def build_user_uri(user_id: None) -> str:
@@ -20,5 +23,40 @@ def get_video_id_from_uri(uri: str) -> str:
 
 def extract_page_number(url: str) -> int:
     """Function to extract page number from a given URL."""
-    match = re.search(r"page=(\d+)", url)
-    return int(match.group(1)) if match else 1
+    page = parse_qs(urlparse(url).query).get("page")
+    return int(page[0]) if page else 1
+
+
+def get_page_count(body: dict) -> int:
+    """Return the number of pages of a paginated response body."""
+    total = body.get("total")
+    per_page = body.get("per_page")
+    if total is not None and per_page:
+        return max(1, -(-total // per_page))
+    paging = body.get("paging") or {}
+    return extract_page_number(paging.get("last") or "")
+
+
+def select_download(downloads: list[dict]) -> Optional[dict]:  # noqa: UP007
+    """Pick the best rendition. HD is priority, then the tallest SD."""
+    for quality in ("hd", "sd"):
+        candidates = [video for video in downloads if video["quality"] == quality]
+        if candidates:
+            return max(candidates, key=lambda x: x.get("height", 0))
+    return None
+
+
+def select_download_link(downloads: list[dict]) -> Optional[str]:  # noqa: UP007
+    """Pick the best download link. HD is priority, then the tallest SD."""
+    download = select_download(downloads)
+    return download["link"] if download else None
+
+
+def get_field(data: dict, field: str) -> Any:
+    """Read a (possibly dotted) `fields` name, e.g. `upload.status`."""
+    value: Any = data
+    for part in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
@@ -0,0 +1,214 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import Future
+from typing import Optional
+
+from requests import HTTPError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+from vimeo.exceptions import APIRateLimitExceededFailure
+
+from vimeo_utils import deadline
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.exceptions import CircuitOpenError
+from vimeo_utils.exceptions import TranscodingError
+from vimeo_utils.exceptions import VideoNotFoundError
+from vimeo_utils.retry import RETRY_STATUSES
+
+WAIT_FIELDS = ["uri", "status", "upload.status", "transcode.status"]
+ERROR_STATUSES = {VideoStatus.TRANSCODING_ERROR, VideoStatus.UPLOADING_ERROR}
+
+# A video missing from this many consecutive responses is considered gone
+MAX_MISSES = 3
+# Poll errors which only cost the videos polled a tick
+TRANSIENT_ERRORS = (
+    APIRateLimitExceededFailure,
+    RequestsConnectionError,
+    Timeout,
+    CircuitOpenError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _Pending:
+    """Polling state of a single video."""
+
+    def __init__(self, interval: float):
+        self.future: Future = Future()
+        self.interval = interval
+        self.next_poll = 0.0
+        self.stage = None
+        self.misses = 0
+
+
+class AvailabilityWaiter:
+    """
+    Waits for many videos to become available using `uris`-filtered list
+    requests instead of one `get_video` per video per loop.
+
+    Each video has its own polling interval: it starts at `min_interval`,
+    grows by `backoff` each poll where its upload/transcode stage hasn't
+    moved (up to `max_interval`) and drops back to `min_interval` as soon as
+    it does. Videos due for a poll at the same time share a request. A poll
+    failing with a transient error (rate limiting, a dropped connection, a
+    5xx) is tried again at the videos' next tick; an error raised by
+    `callback` is logged and doesn't affect the other videos.
+
+    Polling stops, failing the futures still pending, when the deadline
+    current at `start()` ends or is cancelled.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        vclient,
+        uris: Iterable[str],
+        min_interval: float = 5,
+        max_interval: float = 60,
+        backoff: float = 1.5,
+        timeout: Optional[float] = None,  # noqa: UP007
+        callback: Optional[Callable[[str, dict], None]] = None,  # noqa: UP007
+    ):
+        self.vclient = vclient
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.callback = callback
+        self.pending = {uri: _Pending(min_interval) for uri in dict.fromkeys(uris)}
+        self.futures = {uri: state.future for uri, state in self.pending.items()}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None  # noqa: UP007
+
+    def start(self) -> dict[str, Future]:
+        """Start polling in a background thread, return a future per URI."""
+        self._thread = threading.Thread(target=deadline.bind(self.run), daemon=True)
+        self._thread.start()
+        return self.futures
+
+    def cancel(self) -> None:
+        """Stop polling, futures still pending are cancelled."""
+        self._stop.set()
+
+    def run(self) -> None:
+        scope = deadline.current()
+        if scope is not None:
+            # Wake up as soon as the caller gives up
+            scope.add_callback(self._stop.set)
+        try:
+            self._poll_until_done(scope)
+        except Exception as error:  # noqa: BLE001
+            self._fail_pending(error)
+            return
+        for state in self.pending.values():
+            state.future.cancel()
+
+    def _poll_until_done(self, scope: Optional[deadline.Deadline]) -> None:  # noqa: UP007
+        timeout_at = None if self.timeout is None else time.monotonic() + self.timeout
+        while self.pending and not self._stop.is_set():
+            now = time.monotonic()
+            if timeout_at is not None and now >= timeout_at:
+                self._fail_pending(TimeoutError("Timed out waiting for videos"))
+                return
+            due = [uri for uri, state in self.pending.items() if state.next_poll <= now]
+            if due:
+                self.poll(due)
+            if not self.pending:
+                return
+            self._stop.wait(self._time_to_next_poll(timeout_at, scope))
+            if scope is not None:
+                scope.check()
+
+    def _time_to_next_poll(
+        self,
+        timeout_at: Optional[float],  # noqa: UP007
+        scope: Optional[deadline.Deadline],  # noqa: UP007
+    ) -> float:
+        wake = min(state.next_poll for state in self.pending.values())
+        if timeout_at is not None:
+            wake = min(wake, timeout_at)
+        if scope is not None and scope.remaining() is not None:
+            wake = min(wake, time.monotonic() + scope.remaining())
+        return max(0.0, wake - time.monotonic())
+
+    def poll(self, uris: list[str]) -> None:
+        """Fetch the current state of `uris`, 100 per list request."""
+        try:
+            # A cached answer would hide the change we are waiting for
+            videos = self.vclient.get_videos_by_uris(
+                uris, fields=WAIT_FIELDS, cache=False
+            )
+        except (*TRANSIENT_ERRORS, HTTPError) as error:
+            if not self._is_transient(error):
+                raise
+            logger.warning("Polling %d videos failed, retrying: %s", len(uris), error)
+            now = time.monotonic()
+            for uri in uris:
+                self.pending[uri].next_poll = now + self.pending[uri].interval
+            return
+
+        now = time.monotonic()
+        for uri in uris:
+            state = self.pending[uri]
+            video = videos.get(uri)
+            if video is None:
+                state.misses += 1
+                if state.misses >= MAX_MISSES:
+                    self._resolve(uri, error=VideoNotFoundError(uri))
+                else:
+                    state.next_poll = now + state.interval
+                continue
+
+            state.misses = 0
+            status = video.get("status")
+            if status == VideoStatus.AVAILABLE:
+                self._resolve(uri, video=video)
+            elif status in ERROR_STATUSES:
+                msg = f"Transcoding/Uploading error: {uri}"
+                self._resolve(uri, error=TranscodingError(msg))
+            else:
+                self._reschedule(state, video, now)
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        if isinstance(error, TRANSIENT_ERRORS):
+            return True
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        return isinstance(error, HTTPError) and status in RETRY_STATUSES
+
+    def _reschedule(self, state: _Pending, video: dict, now: float) -> None:
+        stage = (
+            video.get("status"),
+            (video.get("upload") or {}).get("status"),
+            (video.get("transcode") or {}).get("status"),
+        )
+        if stage != state.stage:
+            state.interval = self.min_interval
+        else:
+            state.interval = min(self.max_interval, state.interval * self.backoff)
+        state.stage = stage
+        state.next_poll = now + state.interval
+
+    def _resolve(
+        self,
+        uri: str,
+        video: Optional[dict] = None,  # noqa: UP007
+        error: Optional[Exception] = None,  # noqa: UP007
+    ) -> None:
+        state = self.pending.pop(uri)
+        if error is not None:
+            state.future.set_exception(error)
+            return
+        state.future.set_result(video)
+        if self.callback is not None:
+            try:
+                self.callback(uri, video)
+            except Exception:
+                logger.exception("Availability callback failed for %s", uri)
+
+    def _fail_pending(self, error: Exception) -> None:
+        for uri in list(self.pending):
+            self._resolve(uri, error=error)
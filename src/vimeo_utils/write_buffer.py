@@ -0,0 +1,183 @@
+import concurrent.futures
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future
+from typing import Optional
+
+
+def deep_merge(base: dict, update: dict) -> dict:
+    """Merge `update` into a copy of `base`, recursing into nested dicts."""
+    merged = dict(base)
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class _Pending:
+    """The merged payload for one resource and the callers waiting on it."""
+
+    def __init__(self):
+        self.data: dict = {}
+        self.futures: list[Future] = []
+        self.since = time.monotonic()
+
+
+class WriteBuffer:
+    """
+    A write-behind buffer for PATCHes. Payloads sent to the same resource
+    are deep-merged and go out as a single request, cutting the number of
+    writes counted against the rate limit.
+
+    A resource is flushed once its first pending write is `max_delay`
+    seconds old; everything is flushed once `max_pending` resources are
+    waiting, on `flush()` and on `close()`. Each caller gets a future of the
+    response (or of the error) of the request its payload went out in.
+
+    Writes to one resource go out in order: while its PATCH is in flight,
+    later payloads are held (and merged) until that request has resolved.
+
+    Reads are not buffered: a GET made before the flush sees the old values.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 50,
+        max_delay: float = 0.5,
+        max_workers: Optional[int] = None,  # noqa: UP007
+    ):
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self.max_workers = max_workers
+        self.vclient = None
+        self.requests_saved = 0
+        self._pending: dict[str, _Pending] = {}
+        # URIs with a PATCH on the wire, their next batch waits for it
+        self._in_flight: set[str] = set()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None  # noqa: UP007
+
+    def start(self, vclient) -> None:
+        """Bind to the client whose requests carry the flushed writes."""
+        self.vclient = vclient
+        self.max_workers = self.max_workers or vclient.scheduler.max_concurrency
+        self._thread = threading.Thread(
+            target=self._run, name="vimeo-write-buffer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, uri: str, data: dict) -> Future:
+        """Queue a PATCH of `data` to `uri`, merged with any pending one."""
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                msg = "Write buffer is closed"
+                raise RuntimeError(msg)
+            pending = self._pending.get(uri)
+            if pending is None:
+                pending = self._pending[uri] = _Pending()
+            else:
+                self.requests_saved += 1
+            pending.data = deep_merge(pending.data, data)
+            pending.futures.append(future)
+            full = len(self._pending) >= self.max_pending
+            self._condition.notify_all()
+        if full:
+            self.flush()
+        return future
+
+    def flush(self, uri: Optional[str] = None) -> None:  # noqa: UP007
+        """Send the pending writes (or only those for `uri`) and wait for them."""
+        with self._condition:
+            uris = set(self._pending) if uri is None else {uri}
+        while True:
+            with self._condition:
+                waiting = uris.intersection(self._pending)
+                if not waiting:
+                    return
+                batch = self._take(waiting)
+                if not batch:
+                    # Only writes held behind a PATCH in flight, wait for it
+                    self._condition.wait()
+                    continue
+            self._send(batch)
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Flush what is left and stop the background flusher."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    # Held writes are woken up when their PATCH in flight ends
+                    ready = {
+                        uri: pending.since
+                        for uri, pending in self._pending.items()
+                        if uri not in self._in_flight
+                    }
+                    due = [
+                        uri
+                        for uri, since in ready.items()
+                        if now - since >= self.max_delay
+                    ]
+                    if due:
+                        break
+                    oldest = min(ready.values(), default=None)
+                    wait = None if oldest is None else oldest + self.max_delay - now
+                    self._condition.wait(wait)
+                if self._closed:
+                    return
+                batch = self._take(due)
+            self._send(batch)
+
+    def _take(self, uris: Iterable[str]) -> dict[str, _Pending]:
+        """Claim the pending writes of `uris` which have no PATCH in flight."""
+        batch = {
+            uri: self._pending.pop(uri)
+            for uri in list(uris)
+            if uri in self._pending and uri not in self._in_flight
+        }
+        self._in_flight.update(batch)
+        return batch
+
+    def _send(self, batch: dict[str, _Pending]) -> None:
+        if not batch:
+            return
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(batch))
+            ) as executor:
+                for uri, pending in batch.items():
+                    executor.submit(self._patch, uri, pending)
+        finally:
+            with self._condition:
+                self._in_flight.difference_update(batch)
+                self._condition.notify_all()
+
+    def _patch(self, uri: str, pending: _Pending) -> None:
+        try:
+            response = self.vclient.request(
+                "patch", uri, data=pending.data, idempotent=True
+            )
+            response.raise_for_status()
+        except Exception as error:  # noqa: BLE001 - handed to every caller
+            for future in pending.futures:
+                future.set_exception(error)
+        else:
+            for future in pending.futures:
+                future.set_result(response)
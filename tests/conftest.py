@@ -5,6 +5,9 @@ import vimeo
 from dotenv import load_dotenv
 from vimeo_utils.client import VimeoAPIClient
 
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
 load_dotenv()
 
 
@@ -81,3 +84,13 @@ def video_uri_no_wait(vclient, video_params):
 
     # Teardown: Delete the project using its uri
     vclient.delete_video(video_uri)
+
+
+@pytest.fixture()
+def fake_client():
+    return FakeVimeoClient(videos=make_library(250))
+
+
+@pytest.fixture()
+def fake_vclient(fake_client) -> VimeoAPIClient:
+    return VimeoAPIClient(fake_client)
@@ -0,0 +1,300 @@
+import hashlib
+import io
+import json
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from vimeo.exceptions import APIRateLimitExceededFailure
+
+
+def make_response(status_code=200, body=None, headers=None, url=""):
+    """Build a `requests.Response` the way `vimeo.VimeoClient` would return it."""
+    response = Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers = CaseInsensitiveDict(headers or {})
+    content = b"" if body is None else json.dumps(body).encode()
+    response.raw = io.BytesIO(content)
+    response.encoding = "utf-8"
+    return response
+
+
+class FakeVimeoClient:
+    """
+    An in-memory stand-in for `vimeo.VimeoClient` serving a library of videos
+    and projects. Every call is recorded in `calls`.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self, videos=None, projects=None, latency=0.0, rate_limit=None, tus=None
+    ):
+        self.videos = {video["uri"]: video for video in (videos or [])}
+        self.projects = {project["uri"]: project for project in (projects or [])}
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limit_reset = time.time() + 60
+        self.tus = tus
+        # path -> list of status codes (or exceptions) to answer with first
+        self.failures = {}
+        # uri -> list of statuses a video goes through, one per read
+        self.status_script = {}
+        self.calls = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    # --------------------------------------------------------------------------
+    # HTTP verbs
+    # --------------------------------------------------------------------------
+
+    def get(self, url, **kwargs):
+        return self._call("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._call("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._call("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self._call("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._call("DELETE", url, **kwargs)
+
+    def _call(self, method, url, params=None, data=None, **kwargs):
+        parsed = urlparse(url)
+        params = dict(params or {})
+        params.update({k: v[-1] for k, v in parse_qs(parsed.query).items()})
+        with self.lock:
+            self.calls.append((method, parsed.path, params))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            response = self.inject_failure(parsed.path, url)
+            if response is None:
+                response = self.handle(method, parsed.path, params, data)
+            if method == "GET" and response.status_code == 200:  # noqa: PLR2004
+                etag = f'"{hashlib.md5(response.content).hexdigest()}"'  # noqa: S324
+                response.headers["ETag"] = etag
+                if kwargs.get("headers", {}).get("If-None-Match") == etag:
+                    response = make_response(304, url=url)
+            if self.rate_limit is not None:
+                with self.lock:
+                    self.rate_limit -= 1
+                    response.headers["X-RateLimit-Remaining"] = str(self.rate_limit)
+                response.headers["X-RateLimit-Reset"] = str(self.rate_limit_reset)
+            for hook in kwargs.get("hooks", {}).values():
+                hook(response)
+            if response.status_code == 429:  # noqa: PLR2004
+                # pyvimeo raises rather than returning the response
+                raise APIRateLimitExceededFailure(response, "Too many API requests")
+            return response
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def inject_failure(self, path, url):
+        failures = self.failures.get(path)
+        if not failures:
+            return None
+        failure = failures.pop(0)
+        if isinstance(failure, Exception):
+            raise failure
+        if isinstance(failure, Response):
+            return failure
+        return make_response(failure, {"error": "Injected"}, url=url)
+
+    # --------------------------------------------------------------------------
+    # Routing
+    # --------------------------------------------------------------------------
+
+    def read_video(self, uri):
+        video = self.videos[uri]
+        script = self.status_script.get(uri)
+        if script:
+            video["status"] = script.pop(0) if len(script) > 1 else script[0]
+        return video
+
+    def handle(self, method, path, params, data):  # noqa: PLR0911
+        if path == "/videos" and method == "GET":
+            uris = params.get("uris", "").split(",")
+            items = [self.read_video(uri) for uri in uris if uri in self.videos]
+            return self.paginate(path, items, params)
+        if re.fullmatch(r"/(me|users/\d+)/videos", path):
+            if method == "POST":
+                return self.create_video(data)
+            return self.paginate(path, list(self.videos.values()), params)
+        match = re.fullmatch(r"/(me|users/\d+)/folders/(\d+)/videos", path)
+        if match and method == "GET":
+            items = [
+                video
+                for video in self.videos.values()
+                if video.get("folder") == match.group(2)
+            ]
+            return self.paginate(path, items, params)
+        if re.fullmatch(r"/(me|users/\d+)/projects", path) and method == "GET":
+            return self.paginate(path, list(self.projects.values()), params)
+        if re.fullmatch(r"/videos/\d+", path):
+            return self.handle_video(method, path, params, data)
+        return make_response(204 if method in {"PUT", "DELETE"} else 200, {})
+
+    def handle_video(self, method, path, params, data):
+        video = self.videos.get(path)
+        if video is None:
+            return make_response(404, {"error": "Not found"}, url=path)
+        if method == "GET":
+            video = self.read_video(path)
+            return make_response(200, self.project_fields(video, params))
+        if method == "PATCH":
+            video.update(data or {})
+            return make_response(200, video)
+        if method == "DELETE":
+            del self.videos[path]
+            return make_response(204)
+        return make_response(204 if method == "PUT" else 200, {})
+
+    def create_video(self, data):
+        uri = f"/videos/{100000 + len(self.videos)}"
+        video = {
+            "uri": uri,
+            "name": data.get("name", "Untitled"),
+            "status": "uploading",
+            "upload": {
+                "approach": "tus",
+                "size": data["upload"]["size"],
+                "upload_link": self.tus.create(data["upload"]["size"]),
+            },
+        }
+        self.videos[uri] = video
+        return make_response(201, video)
+
+    def paginate(self, path, items, params):
+        if params.get("sort"):
+            items = sorted(
+                items,
+                key=lambda item: item.get(params["sort"]) or "",
+                reverse=params.get("direction") == "desc",
+            )
+        page = int(params.get("page", 1))
+        per_page = int(params.get("per_page", 25))
+        last = max(1, -(-len(items) // per_page))
+        start = (page - 1) * per_page
+        data = [
+            self.project_fields(item, params)
+            for item in items[start : start + per_page]
+        ]
+        body = {
+            "total": len(items),
+            "page": page,
+            "per_page": per_page,
+            "paging": {
+                "next": f"{path}?page={page + 1}" if page < last else None,
+                "previous": f"{path}?page={page - 1}" if page > 1 else None,
+                "first": f"{path}?page=1",
+                "last": f"{path}?page={last}",
+            },
+            "data": data,
+        }
+        return make_response(200, body, url=path)
+
+    @staticmethod
+    def project_fields(item, params):
+        fields = params.get("fields")
+        if not fields:
+            return dict(item)
+        wanted = {field.split(".")[0] for field in fields.split(",")}
+        return {key: value for key, value in item.items() if key in wanted}
+
+
+def make_library(count, **extra):
+    return [
+        {
+            "uri": f"/videos/{i}",
+            "name": f"Video {i}",
+            "created_time": "2024-05-13T00:00:00+00:00",
+            "status": "available",
+            **extra,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+class TusServer:
+    """
+    A minimal local tus server (HEAD/PATCH) to upload against. `drop_after`
+    makes the next PATCH store only that many bytes and drop the connection.
+    """
+
+    def __init__(self):
+        self.uploads = {}
+        self.sizes = {}
+        self.patches = []
+        self.drop_after = None
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_HEAD(self):  # noqa: N802
+                upload = server.uploads.get(self.path)
+                if upload is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Upload-Offset", str(len(upload)))
+                self.send_header("Upload-Length", str(server.sizes[self.path]))
+                self.end_headers()
+
+            def do_PATCH(self):  # noqa: N802
+                upload = server.uploads.get(self.path)
+                length = int(self.headers["Content-Length"])
+                body = self.rfile.read(length)
+                offset = int(self.headers["Upload-Offset"])
+                if upload is None or offset != len(upload):
+                    self.send_response(409)
+                    self.end_headers()
+                    return
+                server.patches.append((self.path, offset, length))
+                if server.drop_after is not None:
+                    upload.extend(body[: server.drop_after])
+                    server.drop_after = None
+                    self.close_connection = True
+                    self.connection.shutdown(socket.SHUT_RDWR)
+                    return
+                upload.extend(body)
+                self.send_response(204)
+                self.send_header("Upload-Offset", str(len(upload)))
+                self.end_headers()
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, args=(0.01,), daemon=True
+        )
+
+    def create(self, size):
+        path = f"/upload/{len(self.uploads) + 1}"
+        self.uploads[path] = bytearray()
+        self.sizes[path] = size
+        return f"{self.url}{path}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
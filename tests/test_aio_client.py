@@ -0,0 +1,209 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+import vimeo
+from aiohttp import web
+from requests import HTTPError
+from vimeo_utils.aio import AsyncVimeoAPIClient
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.exceptions import TranscodingError
+from vimeo_utils.fields import VIDEO_FIELDS
+from vimeo_utils.fields import FieldPresets
+
+TOTAL_VIDEOS = 250
+PER_PAGE = 100
+
+
+def build_app(statuses=None):
+    statuses = statuses or {}
+    state = {"in_flight": 0, "max_in_flight": 0, "calls": 0}
+
+    async def videos(request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        page = int(request.query.get("page", 1))
+        last = -(-TOTAL_VIDEOS // PER_PAGE)
+        start = (page - 1) * PER_PAGE
+        data = [
+            {"uri": f"/videos/{i}", "name": f"Video {i}"}
+            for i in range(start, min(start + PER_PAGE, TOTAL_VIDEOS))
+        ]
+        paging = {
+            "next": f"/me/videos?page={page + 1}" if page < last else None,
+            "last": f"/me/videos?page={last}",
+        }
+        return web.json_response(
+            {"total": TOTAL_VIDEOS, "paging": paging, "data": data}
+        )
+
+    async def video(request):
+        state["calls"] += 1
+        video_id = request.match_info["video_id"]
+        if video_id == "404":
+            return web.json_response({"error": "Not found"}, status=404)
+        sequence = statuses.get(video_id, [VideoStatus.AVAILABLE])
+        status = sequence[min(state["calls"] - 1, len(sequence) - 1)]
+        return web.json_response(
+            {
+                "uri": f"/videos/{video_id}",
+                "status": status,
+                "fields": request.query.get("fields"),
+            }
+        )
+
+    async def edit(request):
+        body = await request.json()
+        return web.json_response({"uri": request.path, **body})
+
+    async def by_uris(request):
+        state["calls"] += 1
+        uris = request.query["uris"].split(",")
+        data = [
+            {"uri": uri, "download": [{"quality": "sd", "link": f"{uri}.mp4"}]}
+            for uri in uris
+            if uri != "/videos/404"
+        ]
+        return web.json_response({"total": len(data), "data": data})
+
+    app = web.Application()
+    app.router.add_get("/videos", by_uris)
+    app.router.add_get("/me/videos", videos)
+    app.router.add_get("/videos/{video_id}", video)
+    app.router.add_patch("/videos/{video_id}", edit)
+    return app, state
+
+
+async def run_with_client(app, coro_fn, **kwargs):
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+    try:
+        client = vimeo.VimeoClient(token="token")
+        async with AsyncVimeoAPIClient(
+            client, api_root=f"http://127.0.0.1:{port}", **kwargs
+        ) as vclient:
+            return await coro_fn(vclient)
+    finally:
+        await runner.cleanup()
+
+
+def test_get_video():
+    app, _ = build_app()
+    response = asyncio.run(
+        run_with_client(app, lambda vclient: vclient.get_video("/videos/1"))
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["uri"] == "/videos/1"
+
+
+def test_get_video_fields_come_from_presets():
+    app, _ = build_app()
+
+    async def both(vclient):
+        default = await vclient.get_video("/videos/1")
+        tiny = await vclient.get_video("/videos/1", fields="tiny")
+        return default.json()["fields"], tiny.json()["fields"]
+
+    presets = FieldPresets({"tiny": ["uri"]})
+    default, tiny = asyncio.run(run_with_client(app, both, field_presets=presets))
+    assert default == ",".join(VIDEO_FIELDS)
+    assert tiny == "uri"
+
+
+def test_needs_an_access_token():
+    with pytest.raises(ValueError, match="access token"):
+        AsyncVimeoAPIClient(vimeo.VimeoClient(key="key", secret="secret"))
+
+
+def test_get_video_raises_for_status():
+    app, _ = build_app()
+    with pytest.raises(HTTPError):
+        asyncio.run(
+            run_with_client(app, lambda vclient: vclient.get_video("/videos/404"))
+        )
+
+
+def test_edit_video():
+    app, _ = build_app()
+    response = asyncio.run(
+        run_with_client(
+            app, lambda vclient: vclient.edit_video("/videos/1", {"name": "Edit"})
+        )
+    )
+    assert response.json()["name"] == "Edit"
+
+
+def test_get_all_videos_bounded_concurrency():
+    app, state = build_app()
+    videos = asyncio.run(
+        run_with_client(
+            app, lambda vclient: vclient.get_all_videos(), max_concurrency=2
+        )
+    )
+    assert len(videos) == TOTAL_VIDEOS
+    assert len({video["uri"] for video in videos}) == TOTAL_VIDEOS
+    assert state["max_in_flight"] <= 2  # noqa: PLR2004
+
+
+def test_iter_all_videos_streams_in_order():
+    app, state = build_app()
+
+    async def collect(vclient):
+        return [video async for video in vclient.iter_all_videos()]
+
+    videos = asyncio.run(run_with_client(app, collect, max_concurrency=2))
+    assert [video["uri"] for video in videos] == [
+        f"/videos/{i}" for i in range(TOTAL_VIDEOS)
+    ]
+    assert state["max_in_flight"] <= 2  # noqa: PLR2004
+
+
+def test_iter_pages_stops_early():
+    app, _ = build_app()
+
+    async def first_page(vclient):
+        async for page in vclient.iter_pages("/me/videos", prefetch=1):
+            return page
+        return None
+
+    page = asyncio.run(run_with_client(app, first_page))
+    assert len(page) == PER_PAGE
+
+
+def test_block_until_available():
+    app, state = build_app(
+        {"1": [VideoStatus.UPLOADING, VideoStatus.TRANSCODING, VideoStatus.AVAILABLE]}
+    )
+    asyncio.run(
+        run_with_client(
+            app, lambda vclient: vclient.block_until_available("/videos/1", interval=0)
+        )
+    )
+    assert state["calls"] == 3  # noqa: PLR2004
+
+
+def test_block_until_available_error():
+    app, _ = build_app({"1": [VideoStatus.TRANSCODING_ERROR]})
+    with pytest.raises(TranscodingError):
+        asyncio.run(
+            run_with_client(
+                app,
+                lambda vclient: vclient.block_until_available("/videos/1", interval=0),
+            )
+        )
+
+
+def test_get_download_links():
+    app, state = build_app()
+    uris = [f"/videos/{i}" for i in range(150)] + ["/videos/404"]
+    links = asyncio.run(
+        run_with_client(app, lambda vclient: vclient.get_download_links(uris))
+    )
+    assert len(links) == 150  # noqa: PLR2004
+    assert links["/videos/7"] == "/videos/7.mp4"
+    assert state["calls"] == 2  # noqa: PLR2004
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+from requests import HTTPError
+from vimeo_utils.bulk import BulkExecutor
+from vimeo_utils.bulk import BulkOperation
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.retry import RetryPolicy
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
+
+@pytest.fixture()
+def fake():
+    return FakeVimeoClient(videos=make_library(50), latency=0.01)
+
+
+@pytest.fixture()
+def vclient(fake):
+    return VimeoAPIClient(fake, retry_policy=RetryPolicy(max_retries=0))
+
+
+def edits(count):
+    return (
+        BulkOperation("edit_video", f"/videos/{i}", {"name": f"Renamed {i}"})
+        for i in range(1, count + 1)
+    )
+
+
+def test_unsupported_method():
+    with pytest.raises(ValueError, match="Unsupported"):
+        BulkOperation("get_video", "/videos/1")
+
+
+def test_runs_every_operation(vclient, fake):
+    results = list(vclient.bulk(edits(50), max_workers=4))
+    assert len(results) == 50  # noqa: PLR2004
+    assert all(result.ok for result in results)
+    assert all(video["name"].startswith("Renamed") for video in fake.videos.values())
+    assert fake.max_in_flight <= 4  # noqa: PLR2004
+
+
+def test_failures_do_not_abort_the_run(vclient, fake):
+    fake.failures["/videos/3"] = [500]
+    results = list(vclient.bulk(edits(5)))
+    failed = [result for result in results if not result.ok]
+    assert len(results) == 5  # noqa: PLR2004
+    assert [result.operation.args[0] for result in failed] == ["/videos/3"]
+    assert isinstance(failed[0].error, HTTPError)
+
+
+def test_mixed_operations(vclient, fake):
+    operations = [
+        BulkOperation("move_to_project", 1, "/videos/1"),
+        BulkOperation("add_domain_to_whitelist", "/videos/1", "example.com"),
+        BulkOperation("edit_embed_preset", "/videos/1", 123),
+    ]
+    assert all(result.ok for result in vclient.bulk(operations))
+    assert {path for method, path, _ in fake.calls if method == "PUT"} == {
+        "/me/projects/1/videos/1",
+        "/videos/1/privacy/domains/example.com",
+        "/videos/1/presets/123",
+    }
+
+
+def test_summary_report(vclient, fake, tmp_path):
+    report = tmp_path / "report.json"
+    fake.failures["/videos/2"] = [500]
+    list(vclient.bulk(edits(10), report_path=report))
+    summary = json.loads(report.read_text())
+    assert summary["succeeded"] == 9  # noqa: PLR2004
+    assert summary["failed"] == 1
+    assert summary["errors"] == {"HTTPError": 1}
+    assert summary["operations_per_second"] > 0
+
+
+def test_resumes_from_checkpoint(vclient, fake, tmp_path):
+    checkpoint = tmp_path / "checkpoint.txt"
+    fake.failures["/videos/4"] = [500]
+    results = vclient.bulk(edits(10), max_workers=1, checkpoint_path=checkpoint)
+    for _ in range(5):
+        next(results)
+    results.close()
+
+    fake.calls.clear()
+    executor = BulkExecutor(vclient, checkpoint_path=checkpoint)
+    results = list(executor.run(edits(10)))
+    # Four succeeded before we stopped, /videos/4 failed so it runs again
+    assert executor.summary["skipped"] == 4  # noqa: PLR2004
+    assert len(results) == 6  # noqa: PLR2004
+    assert all(result.ok for result in results)
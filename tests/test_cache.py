@@ -0,0 +1,120 @@
+import pytest
+from requests import HTTPError
+from vimeo_utils.cache import ResponseCache
+from vimeo_utils.cache import resource_type
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.waiter import WAIT_FIELDS
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
+
+@pytest.fixture()
+def fake():
+    return FakeVimeoClient(
+        videos=make_library(5),
+        projects=[{"uri": "/users/1/projects/1", "name": "Project"}],
+    )
+
+
+@pytest.fixture()
+def cache():
+    return ResponseCache()
+
+
+@pytest.fixture()
+def vclient(fake, cache):
+    return VimeoAPIClient(fake, cache=cache)
+
+
+def test_resource_type():
+    assert resource_type("/videos/1") == "videos"
+    assert resource_type("/me/videos?page=2") == "videos"
+    assert resource_type("/me/projects/5") == "projects"
+    assert resource_type("/users/1/projects/5/videos/9") == "videos"
+    assert resource_type("/me") == "users"
+    assert resource_type("/users/123") == "users"
+
+
+def test_hits_skip_the_network(vclient, fake, cache):
+    first = vclient.get_video("/videos/1")
+    second = vclient.get_video("/videos/1")
+    assert second.json() == first.json()
+    assert len(fake.calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_fields_are_part_of_the_key(vclient, fake):
+    vclient.get_video("/videos/1", fields=["uri"])
+    vclient.get_video("/videos/1", fields=["name"])
+    assert len(fake.calls) == 2  # noqa: PLR2004
+
+
+def test_expired_entries_are_revalidated(fake):
+    cache = ResponseCache(ttls={"videos": 0})
+    vclient = VimeoAPIClient(fake, cache=cache)
+    first = vclient.get_video("/videos/1")
+    second = vclient.get_video("/videos/1")
+    assert second is first
+    assert cache.stats()["revalidations"] == 1
+    assert len(fake.calls) == 2  # noqa: PLR2004
+
+
+def test_writes_invalidate(vclient, fake, cache):
+    vclient.get_video("/videos/1")
+    vclient.get_all_videos()
+    vclient.edit_video("/videos/1", {"name": "Edit"})
+    assert cache.stats()["entries"] == 0
+    assert vclient.get_video("/videos/1").json()["name"] == "Edit"
+
+
+def test_move_to_project_invalidates_video_and_project(vclient, cache):
+    vclient.get_video("/videos/1")
+    vclient.get_video("/videos/2")
+    vclient.get_project(1)
+    vclient.move_to_project(1, "/videos/1")
+    remaining = {key[0] for key in cache._entries}  # noqa: SLF001
+    assert remaining == {"/videos/2"}
+
+
+def test_lru_eviction_by_entries(fake):
+    cache = ResponseCache(max_entries=2)
+    vclient = VimeoAPIClient(fake, cache=cache)
+    for uri in ("/videos/1", "/videos/2", "/videos/1", "/videos/3"):
+        vclient.get_video(uri)
+    remaining = {key[0] for key in cache._entries}  # noqa: SLF001
+    assert remaining == {"/videos/1", "/videos/3"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_eviction_by_bytes(fake):
+    size = len(VimeoAPIClient(fake).get_video("/videos/1").content)
+    cache = ResponseCache(max_bytes=size * 2)
+    vclient = VimeoAPIClient(fake, cache=cache)
+    for uri in ("/videos/1", "/videos/2", "/videos/3"):
+        vclient.get_video(uri)
+    assert cache.stats()["entries"] == 2  # noqa: PLR2004
+    assert cache.stats()["bytes"] <= size * 2
+
+
+def test_errors_are_not_cached(vclient, fake, cache):
+    fake.failures["/videos/1"] = [404]
+    with pytest.raises(HTTPError):
+        vclient.get_video("/videos/1")
+    assert cache.stats()["entries"] == 0
+
+
+def test_polling_bypasses_the_cache(vclient, fake):
+    fake.status_script["/videos/1"] = [
+        *[VideoStatus.TRANSCODING] * 3,
+        VideoStatus.AVAILABLE,
+    ]
+    # Both reads are cached for a minute...
+    vclient.get_videos_by_uris(["/videos/1"], fields=WAIT_FIELDS)
+    assert not vclient.is_available("/videos/1")
+    # ...but polling still sees the video change
+    futures = vclient.wait_until_available(["/videos/1"], min_interval=0.01)
+    video = futures["/videos/1"].result(timeout=2)
+    assert video["status"] == VideoStatus.AVAILABLE
+    assert vclient.is_available("/videos/1")
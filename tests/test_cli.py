@@ -0,0 +1,114 @@
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import vimeo_utils
+from vimeo_utils.cli import main
+from vimeo_utils.mock_server import MockVimeoServer
+
+SIZE = 100_000
+
+
+@pytest.fixture()
+def server():
+    with MockVimeoServer(videos=120, projects=3, download_size=SIZE) as server:
+        yield server
+
+
+def run(server, capsys, *argv, stdin=None, monkeypatch=None):
+    if stdin is not None:
+        monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    code = main(["--token", "t", "--api-root", server.url, *argv])
+    lines = capsys.readouterr().out.splitlines()
+    return code, [json.loads(line) for line in lines]
+
+
+def test_list_videos(server, capsys):
+    code, videos = run(server, capsys, "list-videos", "--fields", "uri,status")
+    assert code == 0
+    assert len(videos) == 120  # noqa: PLR2004
+    assert set(videos[0]) == {"uri", "status"}
+
+
+def test_list_projects(server, capsys):
+    code, projects = run(server, capsys, "list-projects")
+    assert code == 0
+    assert sorted(p["name"] for p in projects) == [f"Project {i}" for i in (1, 2, 3)]
+
+
+def test_wait_reads_stdin(server, capsys, monkeypatch):
+    uri = server.add_video(status="transcoding")
+    code, results = run(
+        server,
+        capsys,
+        "wait",
+        "--interval",
+        "0.01",
+        stdin=f"{uri}\n/videos/1\n\n",
+        monkeypatch=monkeypatch,
+    )
+    assert code == 0
+    assert sorted(r["uri"] for r in results) == sorted([uri, "/videos/1"])
+    assert all(r["ok"] and r["status"] == "available" for r in results)
+
+
+def test_bulk_edit(server, capsys, monkeypatch):
+    stdin = '/videos/1\n{"uri": "/videos/2", "data": {"name": "Two"}}\n/videos/999\n'
+    code, results = run(
+        server,
+        capsys,
+        "bulk-edit",
+        "--data",
+        '{"description": "Edited"}',
+        stdin=stdin,
+        monkeypatch=monkeypatch,
+    )
+    assert code == 1
+    by_uri = {r["uri"]: r for r in results}
+    assert by_uri["/videos/1"]["ok"]
+    assert not by_uri["/videos/999"]["ok"]
+    assert server.videos["/videos/2"]["name"] == "Two"
+    assert server.videos["/videos/2"]["description"] == "Edited"
+
+
+def test_upload(server, capsys, tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"x" * 1000)
+    code, results = run(server, capsys, "upload", str(path), "--data", '{"name": "C"}')
+    assert code == 0
+    assert results[0]["file"] == str(path)
+    assert server.videos[results[0]["uri"]]["name"] == "C"
+
+
+def test_download(server, capsys, tmp_path):
+    code, results = run(server, capsys, "download", "/videos/1", "-o", str(tmp_path))
+    assert code == 0
+    assert results == [
+        {"uri": "/videos/1", "ok": True, "path": str(tmp_path / "1.mp4")}
+    ]
+    assert (tmp_path / "1.mp4").stat().st_size == SIZE
+
+
+def test_startup_is_lazy():
+    src = str(Path(vimeo_utils.__file__).parents[1])
+    code = "import sys, vimeo_utils.cli; print('vimeo' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": src},
+    )
+    assert output.stdout.strip() == "False"
+
+
+def test_export(server, capsys, tmp_path):
+    path = tmp_path / "videos.ndjson"
+    code, results = run(server, capsys, "export", str(path))
+    assert code == 0
+    assert results[0]["rows"] == 120  # noqa: PLR2004
+    assert len(path.read_text().splitlines()) == 120  # noqa: PLR2004
@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+from vimeo_utils import deadline
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.exceptions import DeadlineExceededError
+from vimeo_utils.exceptions import OperationCancelledError
+from vimeo_utils.mock_server import MockVimeoServer
+from vimeo_utils.retry import RetryPolicy
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
+
+def test_deadline_caps_timeouts_and_nests():
+    with deadline.deadline(10) as outer:
+        assert deadline.current() is outer
+        assert deadline.capped((5, 60))[1] <= 10  # noqa: PLR2004
+        with deadline.deadline(60) as inner:
+            assert inner.remaining() <= 10  # noqa: PLR2004
+            outer.cancel()
+            assert inner.cancelled
+            with pytest.raises(OperationCancelledError):
+                deadline.check()
+    assert deadline.current() is None
+    assert deadline.capped(30) == 30  # noqa: PLR2004
+
+
+def test_sleep_ends_when_cancelled():
+    with deadline.deadline() as scope:
+        threading.Timer(0.05, scope.cancel).start()
+        start = time.monotonic()
+        with pytest.raises(OperationCancelledError):
+            deadline.sleep(10)
+    assert time.monotonic() - start < 1
+
+
+def test_requests_stop_at_the_deadline():
+    fake = FakeVimeoClient(videos=make_library(1))
+    fake.failures["/videos/1"] = [503] * 10
+    vclient = VimeoAPIClient(
+        fake, retry_policy=RetryPolicy(max_retries=10, backoff_factor=5, jitter=False)
+    )
+    seen = []
+    get = fake.get
+    fake.get = lambda url, **kwargs: (
+        seen.append(kwargs["timeout"]) or get(url, **kwargs)
+    )
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError), vclient.deadline(0.2):
+        vclient.get_video("/videos/1")
+    assert time.monotonic() - start < 1
+    assert max(seen[0]) <= 0.2  # noqa: PLR2004
+    assert len(seen) == 1  # backoff was cut short
+
+
+def test_block_until_available_honours_the_deadline():
+    with MockVimeoServer(videos=0, transcode_polls=10**6) as server:
+        vclient = VimeoAPIClient(server.client())
+        uri = server.add_video(status="transcoding")
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError), vclient.deadline(0.3):
+            vclient.block_until_available(uri, interval=60)
+        assert time.monotonic() - start < 2  # noqa: PLR2004
+
+
+def test_cancel_stops_pagination_workers():
+    fake = FakeVimeoClient(videos=make_library(2000), latency=0.05)
+    vclient = VimeoAPIClient(fake)
+    with vclient.deadline() as scope:
+        threading.Timer(0.1, scope.cancel).start()
+        with pytest.raises(OperationCancelledError):
+            vclient.get_all_videos(per_page=10)
+    calls = len(fake.calls)
+    time.sleep(0.2)
+    # Nothing more is fetched once the call has returned
+    assert len(fake.calls) == calls
+    assert calls < 200  # noqa: PLR2004
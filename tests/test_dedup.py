@@ -0,0 +1,101 @@
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+from vimeo_utils.cache import ResponseCache
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.dedup import UploadIndex
+from vimeo_utils.dedup import hash_file
+from vimeo_utils.mock_server import MockVimeoServer
+
+
+@pytest.fixture()
+def server():
+    with MockVimeoServer(videos=0) as server:
+        yield server
+
+
+@pytest.fixture()
+def vclient(server):
+    return VimeoAPIClient(server.client())
+
+
+@pytest.fixture()
+def index(tmp_path):
+    index = UploadIndex(tmp_path / "uploads.db")
+    yield index
+    index.close()
+
+
+@pytest.fixture()
+def files(tmp_path):
+    content = os.urandom(100_000)
+    paths = []
+    for name, data in [("a.mp4", content), ("copy.mp4", content), ("b.mp4", b"b")]:
+        path = tmp_path / name
+        path.write_bytes(data)
+        paths.append(str(path))
+    return paths
+
+
+def creates(server):
+    return [path for method, path, _ in server.log if method == "POST"]
+
+
+def test_hash_file(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(b"x" * 100)
+    assert hash_file(path, chunk_size=7) == hashlib.sha256(b"x" * 100).hexdigest()
+    path.write_bytes(b"")
+    assert hash_file(path) == hashlib.sha256(b"").hexdigest()
+
+
+def test_identical_files_are_uploaded_once(vclient, server, index, files):
+    futures = vclient.upload_videos(files, {"name": "Clip"}, max_workers=3, dedup=index)
+    uris = {path: future.result(10) for path, future in futures.items()}
+    assert uris[files[0]] == uris[files[1]]
+    assert uris[files[0]] != uris[files[2]]
+    assert len(creates(server)) == 2  # noqa: PLR2004
+
+    # A later run uploads nothing
+    again = vclient.upload_videos(files, dedup=index)
+    assert {path: future.result(10) for path, future in again.items()} == uris
+    assert len(creates(server)) == 2  # noqa: PLR2004
+    assert index.hits >= 2  # noqa: PLR2004
+
+
+def test_dead_videos_are_uploaded_again(vclient, server, index, files):
+    first = vclient.upload_videos(files[:1], dedup=index)[files[0]].result(10)
+    server.videos[first]["status"] = VideoStatus.TRANSCODING_ERROR
+    second = vclient.upload_videos(files[:1], dedup=index)[files[0]].result(10)
+    assert second != first
+
+    vclient.delete_video(second)
+    third = vclient.upload_videos(files[:1], dedup=index)[files[0]].result(10)
+    assert third not in (first, second)
+    assert index.lookup(index.file_hash(files[0])) == third
+
+
+def test_liveness_is_not_read_from_the_cache(server, index, files):
+    vclient = VimeoAPIClient(server.client(), cache=ResponseCache())
+    first = vclient.upload_videos(files[:1], dedup=index)[files[0]].result(10)
+    vclient.get_video(first, fields=["uri", "status"])
+    # Deleted elsewhere, the cached copy doesn't know
+    del server.videos[first]
+    second = vclient.upload_videos(files[:1], dedup=index)[files[0]].result(10)
+    assert second != first
+
+
+def test_changed_files_are_hashed_again(index, files):
+    digest = index.file_hash(files[2])
+    with Path(files[2]).open("ab") as fh:
+        fh.write(b"more")
+    assert index.file_hash(files[2]) != digest
+
+
+def test_upload_video(vclient, server, index, files):
+    uri = vclient.upload_video(files[0], {"name": "One"}, dedup=index)
+    assert vclient.upload_video(files[1], {"name": "One"}, dedup=index) == uri
+    assert len(creates(server)) == 1
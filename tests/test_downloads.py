@@ -0,0 +1,139 @@
+import hashlib
+import time
+
+import pytest
+import requests
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.downloads import BandwidthLimiter
+from vimeo_utils.downloads import DownloadManager
+from vimeo_utils.exceptions import DownloadError
+from vimeo_utils.mock_server import MockVimeoServer
+
+SIZE = 300_000
+PART_SIZE = 64 * 1024
+
+
+@pytest.fixture()
+def server():
+    with MockVimeoServer(videos=5, download_size=SIZE) as server:
+        yield server
+
+
+@pytest.fixture()
+def vclient(server):
+    return VimeoAPIClient(server.client())
+
+
+def expected_content(server, uri):
+    link = server.videos[uri]["download"][0]["link"]
+    return requests.get(link, timeout=5).content
+
+
+def test_download_video(vclient, server, tmp_path):
+    events = []
+    path = vclient.download_video(
+        "/videos/1",
+        tmp_path / "1.mp4",
+        part_size=PART_SIZE,
+        connections=3,
+        callback=events.append,
+    )
+    assert (tmp_path / "1.mp4").read_bytes() == expected_content(server, "/videos/1")
+    assert path == str(tmp_path / "1.mp4")
+    assert not (tmp_path / "1.mp4.part").exists()
+    assert not (tmp_path / "1.mp4.part.json").exists()
+    assert len(events) == 6  # noqa: PLR2004 - five ranges, then done
+    assert events[-1].done
+    assert events[-1].percent == 100  # noqa: PLR2004
+
+
+def test_download_queue(vclient, server, tmp_path):
+    videos = {uri: tmp_path / f"{uri.rsplit('/', 1)[-1]}.mp4" for uri in server.videos}
+    futures = vclient.download_videos(videos, part_size=PART_SIZE, max_workers=2)
+    for uri, future in futures.items():
+        assert future.result(10) == str(videos[uri])
+        assert videos[uri].read_bytes() == expected_content(server, uri)
+
+
+class FlakySession(requests.Session):
+    """Fails every range request after the first `allowed`."""
+
+    def __init__(self, allowed):
+        super().__init__()
+        self.allowed = allowed
+        self.ranges = []
+
+    def get(self, url, **kwargs):
+        self.ranges.append(kwargs["headers"]["Range"])
+        if len(self.ranges) > self.allowed:
+            msg = "Injected"
+            raise requests.ConnectionError(msg)
+        return super().get(url, **kwargs)
+
+
+def test_resumes_missing_ranges(vclient, server, tmp_path):
+    link = server.videos["/videos/1"]["download"][0]["link"]
+    path = tmp_path / "1.mp4"
+    flaky = FlakySession(allowed=2)
+    manager = DownloadManager(
+        vclient, part_size=PART_SIZE, connections=1, retries=0, session=flaky
+    )
+    with pytest.raises(requests.ConnectionError):
+        manager.download_file(link, path)
+    assert (tmp_path / "1.mp4.part.json").exists()
+
+    session = FlakySession(allowed=100)
+    manager = DownloadManager(vclient, part_size=PART_SIZE, session=session)
+    manager.download_file(link, path)
+    assert path.read_bytes() == expected_content(server, "/videos/1")
+    # Only the three ranges the first run didn't finish
+    assert len(session.ranges) == 3  # noqa: PLR2004
+
+
+def test_verifies_checksum(vclient, server, tmp_path):
+    content = expected_content(server, "/videos/1")
+    link = server.videos["/videos/1"]["download"][0]["link"]
+    manager = DownloadManager(vclient, part_size=PART_SIZE)
+
+    md5 = hashlib.md5(content).hexdigest()  # noqa: S324
+    manager.download_file(link, tmp_path / "ok.mp4", md5=md5)
+
+    with pytest.raises(DownloadError, match="Checksum"):
+        manager.download_file(link, tmp_path / "bad.mp4", md5="0" * 32)
+    assert not (tmp_path / "bad.mp4").exists()
+    assert not (tmp_path / "bad.mp4.part").exists()
+
+
+def test_verifies_size(vclient, server, tmp_path):
+    link = server.videos["/videos/1"]["download"][0]["link"]
+    manager = DownloadManager(vclient, part_size=PART_SIZE)
+    with pytest.raises(DownloadError):
+        manager.download_file(link, tmp_path / "1.mp4", size=SIZE + 1)
+
+
+class UnsizedSession(requests.Session):
+    """A CDN which doesn't say how long the file is or accept ranges."""
+
+    def head(self, url, **kwargs):
+        response = super().head(url, **kwargs)
+        response.headers.pop("Content-Length", None)
+        response.headers.pop("Accept-Ranges", None)
+        return response
+
+
+def test_unknown_size_is_streamed(vclient, server, tmp_path):
+    content = expected_content(server, "/videos/1")
+    link = server.videos["/videos/1"]["download"][0]["link"]
+    manager = DownloadManager(vclient, session=UnsizedSession())
+    md5 = hashlib.md5(content).hexdigest()  # noqa: S324
+    manager.download_file(link, tmp_path / "1.mp4", md5=md5)
+    assert (tmp_path / "1.mp4").read_bytes() == content
+
+
+def test_bandwidth_limiter():
+    limiter = BandwidthLimiter(1_000_000)
+    start = time.monotonic()
+    for _ in range(15):
+        limiter.consume(100_000)
+    # The first second's worth is burst, the rest is paced
+    assert time.monotonic() - start >= 0.45  # noqa: PLR2004
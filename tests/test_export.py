@@ -0,0 +1,120 @@
+import csv
+import gzip
+import json
+
+import pytest
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.export import Exporter
+from vimeo_utils.mock_server import MockVimeoServer
+
+FIELDS = ["uri", "name", "upload.size"]
+
+
+@pytest.fixture()
+def server():
+    with MockVimeoServer(videos=250) as server:
+        yield server
+
+
+@pytest.fixture()
+def vclient(server):
+    return VimeoAPIClient(server.client())
+
+
+def read_ndjson(path):
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt") as fh:
+        return [json.loads(line) for line in fh]
+
+
+def test_export_ndjson(vclient, tmp_path):
+    path = tmp_path / "videos.ndjson"
+    summary = vclient.export_videos(str(path), fields=FIELDS)
+    assert summary["rows"] == 250  # noqa: PLR2004
+    assert summary["format"] == "ndjson"
+    videos = read_ndjson(path)
+    assert len({video["uri"] for video in videos}) == 250  # noqa: PLR2004
+
+
+def test_export_csv_gzip(vclient, tmp_path):
+    path = tmp_path / "videos.csv.gz"
+    summary = vclient.export_videos(str(path), fields=FIELDS)
+    assert summary["format"] == "csv"
+    with gzip.open(path, "rt", newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert len(rows) == 250  # noqa: PLR2004
+    assert list(rows[0]) == FIELDS
+    assert rows[0]["upload.size"]
+
+
+def test_export_resumes_from_checkpoint(vclient, server, tmp_path, monkeypatch):
+    path = tmp_path / "videos.ndjson.gz"
+    checkpoint = tmp_path / "export.json"
+    encode = Exporter._encode  # noqa: SLF001
+    calls = []
+
+    def failing_encode(self, items, header):
+        calls.append(len(items))
+        if len(calls) == 2:  # noqa: PLR2004
+            raise ConnectionError
+        return encode(self, items, header)
+
+    monkeypatch.setattr(Exporter, "_encode", failing_encode)
+    with pytest.raises(ConnectionError):
+        vclient.export_videos(str(path), fields=FIELDS, checkpoint_path=checkpoint)
+    assert json.loads(checkpoint.read_text())["page"] == 1
+
+    monkeypatch.setattr(Exporter, "_encode", encode)
+    server.log.clear()
+    summary = vclient.export_videos(
+        str(path), fields=FIELDS, checkpoint_path=checkpoint
+    )
+    assert summary["resumed_from_page"] == 1
+    assert summary["rows"] == 250  # noqa: PLR2004
+    assert not checkpoint.exists()
+    # Page 1 isn't fetched again
+    assert len(server.log) == 2  # noqa: PLR2004
+    videos = read_ndjson(path)
+    assert len(videos) == len({video["uri"] for video in videos}) == 250  # noqa: PLR2004
+
+
+def test_changed_export_starts_over(vclient, tmp_path):
+    path = tmp_path / "videos.ndjson"
+    checkpoint = tmp_path / "export.json"
+    checkpoint.write_text(
+        json.dumps({"key": {"fields": ["uri"]}, "page": 2, "offset": 10, "rows": 200})
+    )
+    summary = vclient.export_videos(
+        str(path), fields=FIELDS, checkpoint_path=checkpoint
+    )
+    assert summary["resumed_from_page"] == 0
+    assert len(read_ndjson(path)) == 250  # noqa: PLR2004
+
+
+def test_compression_must_suit_the_format(vclient, tmp_path):
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        Exporter(vclient, tmp_path / "v.csv", FIELDS, compression="zstd")
+    with pytest.raises(ValueError, match="aren't gzipped"):
+        Exporter(vclient, tmp_path / "v.parquet.gz", FIELDS)
+    exporter = Exporter(vclient, tmp_path / "v.parquet", FIELDS, compression="zstd")
+    assert exporter.compression == "zstd"
+
+
+def test_empty_parquet_export(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "videos.parquet"
+    with MockVimeoServer(videos=0) as server:
+        summary = VimeoAPIClient(server.client()).export_videos(path, fields=FIELDS)
+    assert summary["rows"] == 0
+    table = pq.read_table(path)
+    assert table.num_rows == 0
+    assert table.schema.names == FIELDS
+
+
+def test_parquet_cannot_resume(vclient, tmp_path):
+    with pytest.raises(ValueError, match="resumed"):
+        Exporter(
+            vclient, tmp_path / "v.parquet", FIELDS, checkpoint_path=tmp_path / "c"
+        )
+    with pytest.raises(ValueError, match="format"):
+        Exporter(vclient, tmp_path / "v.xml", FIELDS, format="xml")
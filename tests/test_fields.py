@@ -0,0 +1,73 @@
+import pytest
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.fields import FieldPresets
+from vimeo_utils.fields import FieldUsage
+from vimeo_utils.mock_server import MockVimeoServer
+
+
+@pytest.fixture()
+def server():
+    with MockVimeoServer(videos=3) as server:
+        yield server
+
+
+@pytest.fixture()
+def usage():
+    return FieldUsage()
+
+
+@pytest.fixture()
+def vclient(server, usage):
+    return VimeoAPIClient(server.client(), field_usage=usage)
+
+
+def test_presets():
+    presets = FieldPresets({"thumb": ["uri", "pictures"]})
+    assert presets.resolve("video", "thumb") == ("thumb", ["uri", "pictures"])
+    assert presets.resolve("video", ["uri"]) == ("video", ["uri"])
+    assert "status" in presets.resolve("video")[1]
+    with pytest.raises(ValueError, match="Unknown field preset"):
+        presets.get("missing")
+
+
+def test_methods_use_presets(vclient):
+    vclient.field_presets.register("video", ["uri", "status"])
+    vclient.field_presets.register("tiny", ["uri"])
+    assert set(vclient.get_video("/videos/1").json()) == {"uri", "status"}
+    assert set(vclient.get_video("/videos/1", fields="tiny").json()) == {"uri"}
+    assert all(set(v) == {"uri"} for v in vclient.get_all_videos(fields="tiny"))
+
+
+def test_batch_and_project_methods_use_presets(vclient):
+    vclient.field_presets.register("tiny", ["uri"])
+    videos = vclient.get_videos_by_uris(["/videos/1", "/videos/2"], fields="tiny")
+    assert all(set(video) == {"uri"} for video in videos.values())
+    vclient.field_presets.register("video_list", ["uri", "name"])
+    videos = vclient.get_videos_by_uris(["/videos/1"])
+    assert set(videos["/videos/1"]) == {"uri", "name"}
+    vclient.field_presets.register("project", ["uri"])
+    assert set(vclient.create_project("New").json()) == {"uri"}
+
+
+def test_learning_suggests_fields_read(vclient, usage):
+    video = vclient.get_video("/videos/1").json()
+    assert video["status"] == "available"
+    assert video["upload"]["status"] == "complete"
+    assert video.get("missing") is None
+    privacy = video["privacy"]  # passed on whole
+    assert privacy
+    assert usage.suggest("video") == ["missing", "privacy", "status", "upload.status"]
+
+    user = vclient.get_user().json()
+    assert dict(user.items())
+    assert "name" in usage.suggest("user")
+
+
+def test_bytes_per_projection(vclient, usage):
+    vclient.get_video("/videos/1").json()
+    vclient.get_video("/videos/2", fields=["uri"]).json()
+    stats = {(s["preset"], s["fields"]): s for s in usage.stats()}
+    full = next(s for (preset, f), s in stats.items() if f != "uri")
+    assert stats[("video", "uri")]["calls"] == 1
+    assert stats[("video", "uri")]["bytes_per_call"] < full["bytes_per_call"]
+    assert full["parse_seconds"] > 0
@@ -0,0 +1,121 @@
+import contextlib
+
+import pytest
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.instrumentation import Histogram
+from vimeo_utils.instrumentation import Instrumentation
+from vimeo_utils.instrumentation import endpoint_template
+from vimeo_utils.retry import RetryPolicy
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
+
+@pytest.fixture()
+def fake():
+    return FakeVimeoClient(videos=make_library(250), rate_limit=1000)
+
+
+@pytest.fixture()
+def instrumentation():
+    return Instrumentation()
+
+
+@pytest.fixture()
+def vclient(fake, instrumentation):
+    return VimeoAPIClient(
+        fake,
+        retry_policy=RetryPolicy(backoff_factor=0, jitter=False),
+        instrumentation=instrumentation,
+    )
+
+
+@pytest.mark.parametrize(
+    ("uri", "expected"),
+    [
+        ("/videos/123", "/videos/{id}"),
+        ("/users/1/projects/2/videos?page=3", "/users/{id}/projects/{id}/videos"),
+        ("https://api.vimeo.com/me/videos", "/me/videos"),
+    ],
+)
+def test_endpoint_template(uri, expected):
+    assert endpoint_template(uri) == expected
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(0.1, 1))
+    for value in (0.05, 0.5, 0.5, 5):
+        histogram.observe(value)
+    assert histogram.cumulative() == [("0.1", 1), ("1", 3), ("+Inf", 4)]
+    assert histogram.quantile(0.5) == 1
+    assert histogram.count == 4  # noqa: PLR2004
+
+
+def test_hooks_see_each_call(vclient, fake, instrumentation):
+    seen = []
+    instrumentation.add_pre_hook(lambda info: seen.append(("pre", info.endpoint)))
+    instrumentation.add_post_hook(
+        lambda info: seen.append(("post", info.status, info.retries))
+    )
+    fake.failures["/videos/1"] = [503]
+
+    vclient.get_video("/videos/1")
+
+    assert seen == [("pre", "/videos/{id}"), ("post", 200, 1)]
+
+
+def test_records_metrics(vclient, instrumentation):
+    vclient.get_all_videos()
+    vclient.edit_video("/videos/1", {"name": "New"})
+
+    stats = instrumentation.stats()
+    endpoints = {(e["method"], e["endpoint"]): e for e in stats["endpoints"]}
+    assert endpoints[("GET", "/me/videos")]["requests"] == 3  # noqa: PLR2004
+    assert endpoints[("GET", "/me/videos")]["bytes"] > 0
+    assert endpoints[("PATCH", "/videos/{id}")]["requests"] == 1
+    assert stats["spans"]["get_all_videos"]["count"] == 1
+    assert stats["rate_limit_remaining"] == 996  # noqa: PLR2004
+
+
+def test_errors_are_counted(vclient, fake, instrumentation):
+    fake.failures["/videos/1"] = [404]
+    with pytest.raises(Exception, match="404"):
+        vclient.get_video("/videos/1")
+    assert instrumentation.requests[("GET", "/videos/{id}", "404")] == 1
+
+
+def test_export_prometheus(vclient, instrumentation):
+    vclient.get_video("/videos/1")
+    text = instrumentation.export_prometheus()
+    assert "# TYPE vimeo_requests_total counter" in text
+    assert (
+        'vimeo_requests_total{method="GET",endpoint="/videos/{id}",status="200"} 1'
+        in text
+    )
+    assert (
+        'vimeo_request_duration_seconds_bucket{method="GET",endpoint="/videos/{id}",le="+Inf"} 1'
+        in text
+    )
+    assert "vimeo_rate_limit_remaining 999" in text
+
+
+def test_tracer_spans(fake):
+    class Tracer:
+        def __init__(self):
+            self.spans = []
+
+        def start_as_current_span(self, name, attributes=None):
+            self.spans.append((name, attributes))
+            return contextlib.nullcontext()
+
+    tracer = Tracer()
+    vclient = VimeoAPIClient(fake, instrumentation=Instrumentation(tracer=tracer))
+    vclient.get_all_videos()
+    assert tracer.spans == [("get_all_videos", {})]
+
+
+def test_disabled_by_default(fake):
+    vclient = VimeoAPIClient(fake)
+    assert vclient.instrumentation is None
+    with vclient.span("anything"):
+        vclient.get_video("/videos/1")
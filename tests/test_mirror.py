@@ -0,0 +1,105 @@
+import pytest
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.mirror import LibraryMirror
+
+from tests.fakes import FakeVimeoClient
+
+
+def make_videos(count):
+    return [
+        {
+            "uri": f"/videos/{i}",
+            "name": f"Video {i}",
+            "status": "available",
+            "created_time": "2024-05-13T00:00:00+00:00",
+            "modified_time": f"2024-05-13T00:{i // 60:02d}:{i % 60:02d}+00:00",
+            "parent_folder": {"uri": "/users/1/projects/1" if i % 2 else None},
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.fixture()
+def fake():
+    projects = [
+        {"uri": "/users/1/projects/1", "name": "Odd"},
+        {"uri": "/users/1/projects/2", "name": "Empty"},
+    ]
+    return FakeVimeoClient(videos=make_videos(250), projects=projects)
+
+
+@pytest.fixture()
+def mirror(fake, tmp_path):
+    mirror = LibraryMirror(VimeoAPIClient(fake), tmp_path / "library.db")
+    yield mirror
+    mirror.close()
+
+
+def test_full_load(mirror):
+    stats = mirror.sync()
+    assert stats == {"updated": 250, "deleted": 0, "projects": 2}
+    assert mirror.count_videos() == 250  # noqa: PLR2004
+    assert mirror.get_state("videos_modified_time") == "2024-05-13T00:04:10+00:00"
+
+
+def test_incremental_sync_fetches_only_changes(mirror, fake):
+    mirror.sync()
+    fake.videos["/videos/7"].update(
+        name="Renamed", modified_time="2024-06-01T00:00:00+00:00"
+    )
+    fake.calls.clear()
+
+    stats = mirror.sync()
+
+    assert stats["updated"] == 1
+    assert stats["deleted"] == 0
+    assert mirror.get_video("/videos/7")["name"] == "Renamed"
+    video_reads = [call for call in fake.calls if call[1] == "/me/videos"]
+    assert len(video_reads) <= 3  # noqa: PLR2004
+    assert video_reads[0][2]["sort"] == "modified_time"
+
+
+def test_incremental_sync_sees_edits_in_the_checkpoint_second(mirror, fake):
+    mirror.sync()
+    # Edited after the last sync, within the second it was checkpointed at
+    fake.videos["/videos/250"]["name"] = "Same second"
+
+    stats = mirror.sync()
+
+    assert stats["updated"] == 1
+    assert mirror.get_video("/videos/250")["name"] == "Same second"
+    assert mirror.sync()["updated"] == 0
+
+
+def test_incremental_sync_reconciles_deletions(mirror, fake):
+    mirror.sync()
+    del fake.videos["/videos/3"]
+    del fake.videos["/videos/200"]
+
+    stats = mirror.sync()
+
+    assert stats["deleted"] == 2  # noqa: PLR2004
+    assert mirror.get_video("/videos/3") is None
+    assert mirror.count_videos() == 248  # noqa: PLR2004
+
+
+def test_mirror_persists_between_instances(mirror, fake, tmp_path):
+    mirror.sync()
+    mirror.close()
+    reopened = LibraryMirror(VimeoAPIClient(fake), tmp_path / "library.db")
+    fake.calls.clear()
+    assert reopened.count_videos() == 250  # noqa: PLR2004
+    assert fake.calls == []
+    reopened.close()
+
+
+def test_queries(mirror, fake):
+    fake.videos["/videos/5"]["status"] = "transcoding"
+    mirror.sync()
+    assert [video["uri"] for video in mirror.videos_by_status("transcoding")] == [
+        "/videos/5"
+    ]
+    assert len(mirror.search_videos("video 1")) == 111  # noqa: PLR2004
+    assert len(mirror.videos_in_project("/users/1/projects/1")) == 125  # noqa: PLR2004
+    assert mirror.get_project("/users/1/projects/2")["name"] == "Empty"
+    assert [project["name"] for project in mirror.find_projects("odd")] == ["Odd"]
@@ -0,0 +1,111 @@
+import pytest
+from vimeo.exceptions import APIRateLimitExceededFailure
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.mock_server import MockVimeoServer
+from vimeo_utils.mock_server import project_fields
+from vimeo_utils.retry import RetryPolicy
+
+
+@pytest.fixture()
+def server():
+    with MockVimeoServer(videos=250, projects=5, transcode_polls=2) as server:
+        yield server
+
+
+@pytest.fixture()
+def vclient(server):
+    return VimeoAPIClient(server.client())
+
+
+def test_project_fields():
+    item = {"uri": "/videos/1", "upload": {"status": "complete", "size": 3}}
+    assert project_fields(item, "uri,upload.status,missing.key") == {
+        "uri": "/videos/1",
+        "upload": {"status": "complete"},
+    }
+
+
+def test_get_all_videos(vclient):
+    videos = vclient.get_all_videos(fields=["uri", "name"])
+    assert len(videos) == 250  # noqa: PLR2004
+    assert set(videos[0]) == {"uri", "name"}
+
+
+def test_videos_from_project(vclient, server):
+    project_id = next(iter(server.projects)).rsplit("/", 1)[-1]
+    videos = vclient.get_videos_from_project(project_id)
+    assert len(videos) == 50  # noqa: PLR2004
+
+
+def test_edit_and_move(vclient, server):
+    vclient.edit_video("/videos/10", {"name": "Renamed"})
+    assert server.videos["/videos/10"]["name"] == "Renamed"
+    project_id = next(iter(server.projects)).rsplit("/", 1)[-1]
+    vclient.move_to_project(project_id, "/videos/10")
+    assert server.videos["/videos/10"]["parent_folder"]["uri"].endswith(project_id)
+
+
+def test_transcode_transitions(vclient, server):
+    uri = server.add_video(status=VideoStatus.TRANSCODING)
+    assert vclient.get_status(uri) == VideoStatus.TRANSCODING
+    assert vclient.get_status(uri) == VideoStatus.AVAILABLE
+    assert vclient.get_download_link(uri).startswith(server.url)
+
+
+def test_wait_until_available(vclient, server):
+    uris = [server.add_video(status=VideoStatus.TRANSCODING) for _ in range(5)]
+    futures = vclient.wait_until_available(uris, min_interval=0.01, timeout=10)
+    assert all(
+        future.result(10)["status"] == "available" for future in futures.values()
+    )
+
+
+def test_tus_upload(vclient, server, tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"x" * 3000)
+    futures = vclient.upload_videos([path], chunk_size=1000)
+    uri = futures[str(path)].result(10)
+    assert server.videos[uri]["upload"]["status"] == "complete"
+    assert server.videos[uri]["status"] == VideoStatus.TRANSCODING
+
+
+def test_pull_upload_creates_the_video(vclient, server):
+    response = vclient.request(
+        "post",
+        "/me/videos",
+        data={"name": "Pulled", "upload": {"approach": "pull", "link": "https://x"}},
+    )
+    assert response.status_code == 201  # noqa: PLR2004
+    uri = response.json()["uri"]
+    assert server.videos[uri]["name"] == "Pulled"
+    assert vclient.get_status(uri) == VideoStatus.TRANSCODING
+
+
+def test_rate_limit_headers_and_429(server):
+    server.rate_limit = server.remaining = 3
+    client = server.client()
+    for remaining in ("2", "1", "0"):
+        response = client.get("/videos/1")
+        assert response.headers["X-RateLimit-Remaining"] == remaining
+    with pytest.raises(APIRateLimitExceededFailure):
+        client.get("/videos/1")
+    assert server.throttled_count == 1
+
+
+def test_error_injection(server):
+    server.error_rate = 1.0
+    vclient = VimeoAPIClient(server.client(), retry_policy=RetryPolicy(max_retries=0))
+    with pytest.raises(Exception, match="503"):
+        vclient.get_video("/videos/1")
+    assert server.error_count == 1
+
+
+def test_ranged_download(server):
+    import requests
+
+    link = server.videos["/videos/1"]["download"][0]["link"]
+    full = requests.get(link, timeout=5).content
+    part = requests.get(link, headers={"Range": "bytes=10-19"}, timeout=5)
+    assert part.status_code == 206  # noqa: PLR2004
+    assert part.content == full[10:20]
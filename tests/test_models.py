@@ -0,0 +1,108 @@
+import array
+import json
+import tracemalloc
+
+import pytest
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.mock_server import MockVimeoServer
+from vimeo_utils.models import Columns
+from vimeo_utils.models import Project
+from vimeo_utils.models import User
+from vimeo_utils.models import Video
+from vimeo_utils.models import loads
+
+FIELDS = ["uri", "name", "duration", "status", "upload.status"]
+
+
+@pytest.fixture(scope="module")
+def vclient():
+    with MockVimeoServer(videos=250, projects=3) as server:
+        yield VimeoAPIClient(server.client())
+
+
+def test_records_hold_only_requested_fields():
+    video = Video.from_dict(
+        {"uri": "/videos/7", "name": "A", "upload": {"status": "complete"}},
+        ["uri", "upload.status"],
+    )
+    assert video.uri == "/videos/7"
+    assert video.upload_status == "complete"
+    assert video.id == 7  # noqa: PLR2004
+    assert not hasattr(video, "__dict__")
+    assert not hasattr(video, "name")
+    assert video.to_dict() == {"uri": "/videos/7", "upload.status": "complete"}
+    with pytest.raises(AttributeError):
+        video.uri = "/videos/8"
+    assert type(video) is Video.for_fields(["uri", "upload.status"])
+
+
+def test_from_response(vclient):
+    user = User.from_response(vclient.get_user(fields=["uri", "name"]))
+    assert set(user.fields) == {"uri", "name"}
+    assert isinstance(user, User)
+
+
+def test_loads():
+    assert loads(b'{"a": [1, 2.5, "x"]}') == {"a": [1, 2.5, "x"]}
+
+
+def test_get_all_videos_as_models(vclient):
+    videos = vclient.get_all_videos(fields=FIELDS, model=Video)
+    assert len(videos) == 250  # noqa: PLR2004
+    assert all(isinstance(video, Video) for video in videos)
+    assert {video.uri for video in videos} == {
+        video["uri"] for video in vclient.get_all_videos(fields=["uri"])
+    }
+    projects = vclient.get_all_projects(model=Project)
+    assert sorted(project.id for project in projects) == [1, 2, 3]
+
+
+def test_get_all_videos_columnar(vclient):
+    columns = vclient.get_all_videos(fields=FIELDS, columnar=True)
+    assert isinstance(columns, Columns)
+    assert len(columns) == 250  # noqa: PLR2004
+    assert isinstance(columns["duration"], array.array)
+    rows = {row["uri"]: row for row in columns}
+    for video in vclient.get_all_videos(fields=FIELDS):
+        assert rows[video["uri"]]["duration"] == video["duration"]
+        assert rows[video["uri"]]["upload.status"] == video["upload"]["status"]
+
+
+def test_compact_forms_use_less_memory():
+    payload = json.dumps(
+        [
+            {
+                "uri": f"/videos/{i}",
+                "name": f"Video {i}",
+                "duration": i,
+                "status": "available",
+                "upload": {"status": "complete"},
+            }
+            for i in range(5000)
+        ]
+    )
+
+    def allocated(build):
+        tracemalloc.start()
+        kept = build()  # noqa: F841
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size
+
+    # What is still held once the decoded page has been converted
+    dicts = allocated(lambda: loads(payload))
+    models = allocated(
+        lambda: [Video.from_dict(item, FIELDS) for item in loads(payload)]
+    )
+    columns = allocated(lambda: Columns(FIELDS).extend(loads(payload)).freeze())
+    assert models < dicts
+    assert columns < models
+
+
+def test_columns_share_repeated_strings():
+    # Decoded JSON holds a separate copy of each "available"
+    items = loads(json.dumps([{"status": "available"}] * 3))
+    assert items[0]["status"] is not items[1]["status"]
+    columns = Columns(["status"]).extend(items)
+    statuses = columns["status"]
+    assert statuses[0] is statuses[1] is statuses[2]
@@ -0,0 +1,53 @@
+import pytest
+from requests import HTTPError
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.pagination import Paginator
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
+
+@pytest.fixture()
+def fake():
+    return FakeVimeoClient(videos=make_library(95), latency=0.01)
+
+
+@pytest.fixture()
+def vclient(fake):
+    return VimeoAPIClient(fake)
+
+
+def test_reads_total_and_per_page(vclient):
+    paginator = vclient.paginate("/me/videos", per_page=10)
+    items = paginator.all()
+    assert len(items) == 95  # noqa: PLR2004
+    assert paginator.total == 95  # noqa: PLR2004
+    assert paginator.pages == 10  # noqa: PLR2004
+
+
+def test_ordered_pages(vclient):
+    pages = list(vclient.paginate("/me/videos", per_page=10).iter_pages())
+    assert [page[0]["uri"] for page in pages] == [
+        f"/videos/{i}" for i in range(1, 96, 10)
+    ]
+
+
+def test_bounded_concurrency(vclient, fake):
+    Paginator(vclient, "/me/videos", per_page=5, prefetch=3).all()
+    assert fake.max_in_flight <= 3  # noqa: PLR2004
+
+
+def test_params_and_fields_are_sent(vclient, fake):
+    vclient.paginate(
+        "/me/videos", params={"sort": "date"}, fields=["uri"], per_page=50
+    ).all()
+    assert all(
+        params["sort"] == "date" and params["fields"] == "uri"
+        for _, _, params in fake.calls
+    )
+
+
+def test_errors_surface(vclient, fake):
+    fake.failures["/me/videos"] = [404]
+    with pytest.raises(HTTPError):
+        vclient.paginate("/me/videos").all()
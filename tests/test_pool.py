@@ -0,0 +1,145 @@
+import threading
+
+import pytest
+from vimeo_utils import deadline
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.exceptions import DeadlineExceededError
+from vimeo_utils.exceptions import NoClientError
+from vimeo_utils.mock_server import MockVimeoServer
+from vimeo_utils.pool import VimeoClientPool
+
+
+@pytest.fixture()
+def servers():
+    with MockVimeoServer(videos=30, projects=2) as a:  # noqa: SIM117
+        with MockVimeoServer(videos=20, projects=1, user_id=2) as b:
+            yield a, b
+
+
+@pytest.fixture()
+def pool(servers):
+    a, b = servers
+    # Two tokens for the first account, one for the second
+    return VimeoClientPool(
+        [
+            VimeoAPIClient(a.client("a1")),
+            VimeoAPIClient(a.client("a2")),
+            VimeoAPIClient(b.client("b1")),
+        ]
+    )
+
+
+def test_accounts(pool):
+    accounts = pool.accounts()
+    assert {account: len(clients) for account, clients in accounts.items()} == {
+        "/users/1": 2,
+        "/users/2": 1,
+    }
+
+
+def test_crawls_every_account(pool, servers):
+    a, b = servers
+    videos = pool.get_all_videos(fields=["uri", "name"])
+    assert sorted(video["uri"] for video in videos) == sorted([*a.videos, *b.videos])
+    assert len(list(pool.iter_all_projects())) == 3  # noqa: PLR2004
+
+    # Owners were learned from the crawl, no lookups needed
+    requests = a.request_count + b.request_count
+    b_video = next(iter(b.videos))
+    pool.edit_video(b_video, {"name": "Edited"})
+    assert b.videos[b_video]["name"] == "Edited"
+    assert a.request_count + b.request_count == requests + 1
+
+
+def test_unknown_owners_are_resolved(pool, servers):
+    a, b = servers
+    b_video = next(iter(b.videos))
+    pool.edit_video(b_video, {"name": "Found"})
+    assert b.videos[b_video]["name"] == "Found"
+    assert pool.owner(b_video) == "/users/2"
+    with pytest.raises(NoClientError):
+        pool.get_video("/videos/999999999")
+
+
+def test_learned_owners_are_bounded(servers):
+    a, b = servers
+    pool = VimeoClientPool(
+        [VimeoAPIClient(a.client()), VimeoAPIClient(b.client())], max_owners=2
+    )
+    pool.accounts()
+    uris = list(b.videos)[:3]
+    for uri in uris:
+        pool.register(uri, "/users/2")
+    requests = a.request_count + b.request_count
+    assert pool.owner(uris[1]) == pool.owner(uris[2]) == "/users/2"
+    assert a.request_count + b.request_count == requests
+    # The oldest was forgotten and has to be looked up again
+    assert pool.owner(uris[0]) == "/users/2"
+    assert a.request_count + b.request_count > requests
+
+
+def test_fan_out_ends_with_the_deadline(pool):
+    release = threading.Event()
+
+    def crawl(client):
+        release.wait(5)
+        yield client
+
+    try:
+        with deadline.deadline(0.2), pytest.raises(DeadlineExceededError):
+            list(pool.fan_out(crawl))
+    finally:
+        release.set()
+
+
+def test_get_videos_by_uris_across_accounts(pool, servers):
+    a, b = servers
+    uris = [*list(b.videos)[:3], *list(a.videos)[:3], "/videos/999999999"]
+    videos = pool.get_videos_by_uris(uris, fields=["uri", "status"])
+    assert list(videos) == uris[:-1]
+    # Now known, so each account is asked only for its own videos
+    a.log.clear()
+    b.log.clear()
+    pool.get_videos_by_uris(uris[:-1])
+    assert len(a.log) == len(b.log) == 1
+
+
+def test_folder_and_video_settings_calls_go_to_the_owner(pool, servers):
+    a, b = servers
+    project = next(iter(b.projects))
+    video = next(iter(b.videos))
+    pool.edit_project(project, "Renamed")
+    assert b.projects[project]["name"] == "Renamed"
+    pool.move_to_project(project, video)
+    assert b.videos[video]["parent_folder"]["uri"] == project
+    child = pool.create_project("Child", parent_folder_uri=project).json()
+    assert b.projects[child["uri"]]["parent_folder"]["uri"] == project
+
+    assert pool.owner(video) == "/users/2"
+    a.log.clear()
+    pool.add_domain_to_whitelist(video, "example.com")
+    pool.edit_embed_preset(video, 7)
+    assert not a.log
+    assert [path for _, path, _ in list(b.log)[-2:]] == [
+        f"{video}/privacy/domains/example.com",
+        f"{video}/presets/7",
+    ]
+    with pytest.raises(NoClientError):
+        pool.create_project("Where")
+
+
+def test_reads_go_to_the_client_with_most_budget(pool):
+    first, second, _ = pool.clients
+    first.scheduler.update({"X-RateLimit-Remaining": "10"})
+    second.scheduler.update({"X-RateLimit-Remaining": "500"})
+    assert pool.reader("/users/1") is second
+    assert pool.client_for("/users/1/projects/1") is second
+
+
+def test_wait_until_available(pool, servers):
+    a, b = servers
+    uris = [a.add_video(status="transcoding"), b.add_video(status="transcoding")]
+    futures = pool.wait_until_available(uris, min_interval=0.01, timeout=10)
+    assert all(
+        future.result(10)["status"] == "available" for future in futures.values()
+    )
@@ -1,8 +1,12 @@
 from http import HTTPStatus
 
 import pytest
+from vimeo_utils.client import VimeoAPIClient
 from vimeo_utils.utils import get_project_id_from_uri
 
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
 
 @pytest.fixture(scope="module")
 def project_id(vclient):
@@ -36,13 +40,19 @@ def test_edit_project(vclient, project_id):
     assert response.json()["name"] == "Test edit"
 
 
-def test_get_all_projects(vclient):
-    response = vclient.get_all_projects()
+def test_get_projects(vclient):
+    response = vclient.get_projects()
     assert response.status_code == HTTPStatus.OK
     expected_keys = {"total", "page", "per_page", "paging", "data"}
     assert all(key in response.json() for key in expected_keys)
 
 
+def test_get_all_projects(vclient, project_id):
+    response = vclient.get_all_projects()
+    assert isinstance(response, list)
+    assert all({"uri", "name"}.issubset(project.keys()) for project in response)
+
+
 # def test_move_to_project(vimeo_client, project_id, video_uri):
 #     video_id = get_video_id_from_uri(video_uri)
 #     response = move_to_project(vimeo_client, project_id, video_id)
@@ -55,3 +65,25 @@ def test_get_all_projects(vclient):
 #     )
 #     expected_keys = {"total", "page", "per_page", "paging", "data"}
 #     assert all(key in response for key in expected_keys)
+
+
+def make_projects(count):
+    return [
+        {"uri": f"/users/1/projects/{i}", "name": f"Project {i}"}
+        for i in range(1, count + 1)
+    ]
+
+
+def test_get_all_projects_paginates():
+    fake = FakeVimeoClient(projects=make_projects(230))
+    projects = VimeoAPIClient(fake).get_all_projects(per_page=100)
+    assert len({project["uri"] for project in projects}) == 230  # noqa: PLR2004
+    assert len(fake.calls) == 3  # noqa: PLR2004
+
+
+def test_get_videos_from_project_paginates():
+    fake = FakeVimeoClient(videos=make_library(150, folder="7"))
+    fake.videos["/videos/999"] = {"uri": "/videos/999", "folder": "8"}
+    videos = VimeoAPIClient(fake).get_videos_from_project(7, per_page=50)
+    assert len(videos) == 150  # noqa: PLR2004
+    assert {path for _, path, _ in fake.calls} == {"/me/folders/7/videos"}
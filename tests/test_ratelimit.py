@@ -0,0 +1,170 @@
+import threading
+import time
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.mock_server import MockVimeoServer
+from vimeo_utils.ratelimit import FileBackend
+from vimeo_utils.ratelimit import RateLimitScheduler
+from vimeo_utils.ratelimit import parse_reset
+from vimeo_utils.retry import RetryPolicy
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+from tests.fakes import make_response
+
+
+def test_parse_reset():
+    assert parse_reset("1715623200") == 1715623200  # noqa: PLR2004
+    assert parse_reset("2024-05-13T18:00:00+00:00") == 1715623200  # noqa: PLR2004
+    assert parse_reset(None) is None
+    assert parse_reset("garbage") is None
+
+
+def test_burst_then_refill():
+    scheduler = RateLimitScheduler(rate=100, burst=5)
+    start = time.monotonic()
+    for _ in range(10):
+        scheduler.acquire()
+        scheduler.release()
+    # 5 from the burst, 5 refilled at 100/s
+    assert time.monotonic() - start >= 0.04  # noqa: PLR2004
+
+
+def test_update_spreads_remaining_budget():
+    scheduler = RateLimitScheduler(burst=1)
+    headers = CaseInsensitiveDict(
+        {
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Reset": str(time.time() + 100),
+        }
+    )
+    scheduler.update(headers, latency=1.0)
+    assert scheduler.remaining() == 10  # noqa: PLR2004
+    with scheduler.backend.transaction() as state:
+        rate = scheduler.refill_rate(state, time.time())
+        assert rate == pytest.approx(0.1, rel=1e-3)
+    # 0.1 req/s x 1s latency needs a single slot
+    assert scheduler.concurrency == 1
+
+
+def test_reserve_is_kept():
+    scheduler = RateLimitScheduler(reserve=10)
+    headers = CaseInsensitiveDict(
+        {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": str(time.time() + 100)}
+    )
+    scheduler.update(headers)
+    with scheduler.backend.transaction() as state:
+        assert scheduler.refill_rate(state, time.time()) == 0
+
+
+def test_throttle_blocks_until_reset():
+    scheduler = RateLimitScheduler()
+    scheduler.throttle(retry_after=0.1)
+    start = time.monotonic()
+    scheduler.acquire()
+    scheduler.release()
+    assert time.monotonic() - start >= 0.09  # noqa: PLR2004
+
+
+def test_concurrency_is_bounded():
+    scheduler = RateLimitScheduler(max_concurrency=2)
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def work():
+        with scheduler.slot():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) <= 2  # noqa: PLR2004
+
+
+def test_file_backend_is_shared(tmp_path):
+    path = tmp_path / "ratelimit.json"
+    first = RateLimitScheduler(backend=FileBackend(path))
+    second = RateLimitScheduler(backend=FileBackend(path))
+    first.update(
+        CaseInsensitiveDict(
+            {"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": str(time.time() + 60)}
+        )
+    )
+    assert second.remaining() == 42  # noqa: PLR2004
+    second.acquire()
+    second.release()
+    assert first.remaining() == 41  # noqa: PLR2004
+
+
+def test_reading_the_file_backend_leaves_it_alone(tmp_path):
+    path = tmp_path / "ratelimit.json"
+    scheduler = RateLimitScheduler(backend=FileBackend(path))
+    scheduler.update(CaseInsensitiveDict({"X-RateLimit-Remaining": "42"}))
+    written = path.stat().st_mtime_ns
+    time.sleep(0.01)
+    assert scheduler.remaining() == 42  # noqa: PLR2004
+    assert path.stat().st_mtime_ns == written
+
+
+def test_client_requests_go_through_scheduler():
+    fake = FakeVimeoClient(videos=make_library(10), rate_limit=100)
+    vclient = VimeoAPIClient(fake)
+    vclient.get_video("/videos/1")
+    vclient.get_all_videos()
+    assert vclient.scheduler.remaining() == fake.rate_limit
+
+
+def test_schedulers_can_be_shared_between_clients():
+    scheduler = RateLimitScheduler()
+    fake = FakeVimeoClient(videos=make_library(1), rate_limit=100)
+    VimeoAPIClient(fake, scheduler=scheduler).get_video("/videos/1")
+    VimeoAPIClient(fake, scheduler=scheduler).get_video("/videos/1")
+    assert scheduler.remaining() == 98  # noqa: PLR2004
+
+
+def test_burst_is_capped_at_remaining_budget():
+    scheduler = RateLimitScheduler(burst=10)
+    scheduler.update(
+        CaseInsensitiveDict(
+            {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(time.time() + 0.3)}
+        )
+    )
+    start = time.monotonic()
+    for _ in range(3):
+        scheduler.acquire()
+        scheduler.release()
+    # Two tokens were left, the third waits for the reset
+    assert time.monotonic() - start >= 0.25  # noqa: PLR2004
+
+
+def test_429_throttles_until_reported_reset():
+    fake = FakeVimeoClient(videos=make_library(1))
+    fake.failures["/videos/1"] = [
+        make_response(429, {"error": "Too many"}, headers={"Retry-After": "0.2"})
+    ]
+    policy = RetryPolicy(backoff_factor=0, jitter=False)
+    vclient = VimeoAPIClient(fake, retry_policy=policy)
+    start = time.monotonic()
+    assert vclient.get_video("/videos/1").ok
+    assert 0.15 <= time.monotonic() - start < 5  # noqa: PLR2004
+    assert vclient.retry_stats.as_dict()["retries_by_status"] == {429: 1}
+
+
+def test_rate_limited_server_waits_for_the_window():
+    with MockVimeoServer(videos=1, rate_limit=3, rate_limit_window=1) as server:
+        vclient = VimeoAPIClient(server.client())
+        start = time.monotonic()
+        for _ in range(4):
+            vclient.get_video("/videos/1")
+        assert time.monotonic() - start < 5  # noqa: PLR2004
+        assert not vclient.retry_stats.as_dict()["retries_by_status"]
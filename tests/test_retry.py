@@ -0,0 +1,156 @@
+import time
+
+import pytest
+from requests import HTTPError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.exceptions import CircuitOpenError
+from vimeo_utils.exceptions import DeadlineExceededError
+from vimeo_utils.retry import CircuitBreaker
+from vimeo_utils.retry import RetryPolicy
+from vimeo_utils.retry import parse_retry_after
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+from tests.fakes import make_response
+
+
+@pytest.fixture()
+def fake():
+    return FakeVimeoClient(videos=make_library(3))
+
+
+@pytest.fixture()
+def vclient(fake):
+    policy = RetryPolicy(max_retries=3, backoff_factor=0, jitter=False)
+    return VimeoAPIClient(fake, retry_policy=policy)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3  # noqa: PLR2004
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+    assert policy.backoff(0, retry_after=10) == 10  # noqa: PLR2004
+
+
+def test_backoff_jitter_stays_in_range():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+    assert all(0 <= policy.backoff(3) <= 5 for _ in range(100))  # noqa: PLR2004
+
+
+def test_retries_transient_errors(vclient, fake):
+    fake.failures["/videos/1"] = [503, 502]
+    response = vclient.get_video("/videos/1")
+    assert response.json()["uri"] == "/videos/1"
+    assert vclient.retry_stats.retries == 2  # noqa: PLR2004
+    assert vclient.retry_stats.retries_by_status == {503: 1, 502: 1}
+
+
+def test_retries_connection_errors(vclient, fake):
+    fake.failures["/videos/1"] = [RequestsConnectionError("reset")]
+    assert vclient.get_video("/videos/1").status_code == 200  # noqa: PLR2004
+    assert vclient.retry_stats.retries_by_status == {"connection": 1}
+
+
+def test_gives_up_after_max_retries(vclient, fake):
+    fake.failures["/videos/1"] = [500] * 10
+    with pytest.raises(HTTPError):
+        vclient.get_video("/videos/1")
+    assert vclient.retry_stats.retries == 3  # noqa: PLR2004
+
+
+def test_honors_retry_after(vclient, fake, mocker):
+    sleep = mocker.patch("vimeo_utils.client.time.sleep")
+    fake.failures["/videos/1"] = [make_response(503, headers={"Retry-After": "2"})]
+    vclient.get_video("/videos/1")
+    sleep.assert_called_once_with(2)
+
+
+def test_edits_are_retried_as_idempotent(vclient, fake):
+    fake.failures["/videos/1"] = [503]
+    assert vclient.edit_video("/videos/1", {"name": "Edit"}).json()["name"] == "Edit"
+
+
+def test_post_is_not_retried(vclient, fake):
+    fake.failures["/me/projects"] = [503]
+    with pytest.raises(HTTPError):
+        vclient.create_project("Test")
+    assert vclient.retry_stats.retries == 0
+
+
+def test_patch_is_not_retried_by_default(vclient, fake):
+    fake.failures["/videos/1"] = [503]
+    assert vclient.request("patch", "/videos/1", data={}).status_code == 503  # noqa: PLR2004
+
+
+def test_circuit_breaker_transitions():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    time.sleep(0.06)
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    time.sleep(0.06)
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_client_fails_fast_when_circuit_is_open(fake):
+    vclient = VimeoAPIClient(
+        fake,
+        retry_policy=RetryPolicy(max_retries=0),
+        circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+    )
+    fake.failures["/videos/1"] = [500, 500]
+    for _ in range(2):
+        with pytest.raises(HTTPError):
+            vclient.get_video("/videos/1")
+    with pytest.raises(CircuitOpenError):
+        vclient.get_video("/videos/1")
+    assert len(fake.calls) == 2  # noqa: PLR2004
+    assert vclient.retry_stats.rejected == 1
+
+
+def test_half_open_trial_always_resolves(fake):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    policy = RetryPolicy(max_retries=3, backoff_factor=0, jitter=False)
+    vclient = VimeoAPIClient(fake, retry_policy=policy, circuit_breaker=breaker)
+    # Raised as APIRateLimitExceededFailure, like pyvimeo does
+    fake.failures["/videos/1"] = [500, make_response(429, headers={"Retry-After": "0"})]
+    assert vclient.get_video("/videos/1").ok
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert vclient.retry_stats.as_dict()["retries_by_status"] == {500: 1, 429: 1}
+
+
+def test_half_open_trial_resolves_on_deadline(fake):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    vclient = VimeoAPIClient(
+        fake, retry_policy=RetryPolicy(max_retries=0), circuit_breaker=breaker
+    )
+    fake.failures["/videos/1"] = [500, DeadlineExceededError("Deadline exceeded")]
+    with pytest.raises(HTTPError):
+        vclient.get_video("/videos/1")
+    with pytest.raises(DeadlineExceededError):
+        vclient.get_video("/videos/1")
+    assert breaker.state == CircuitBreaker.OPEN
+    assert vclient.get_video("/videos/1").ok
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_429_backoff_honours_retry_after(vclient, fake):
+    fake.failures["/videos/1"] = [make_response(429, headers={"Retry-After": "0.1"})]
+    assert vclient.get_video("/videos/1").ok
+    stats = vclient.retry_stats.as_dict()
+    assert stats["retries_by_status"] == {429: 1}
+    assert stats["backoff_seconds"] >= 0.1  # noqa: PLR2004
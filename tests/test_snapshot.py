@@ -0,0 +1,93 @@
+import concurrent.futures
+
+import pytest
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.constants import TranscodeStatus
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.singleflight import SingleFlight
+from vimeo_utils.snapshot import VideoSnapshot
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
+DOWNLOADS = [
+    {"quality": "sd", "height": 360, "link": "https://example.com/360"},
+    {"quality": "sd", "height": 540, "link": "https://example.com/540"},
+    {"quality": "hd", "height": 720, "link": "https://example.com/720"},
+    {"quality": "hd", "height": 1080, "link": "https://example.com/1080"},
+]
+
+
+@pytest.fixture()
+def fake():
+    return FakeVimeoClient(
+        videos=make_library(
+            2,
+            is_playable=True,
+            transcode={"status": TranscodeStatus.COMPLETE},
+            upload={"status": "complete"},
+            download=DOWNLOADS,
+        ),
+        latency=0.05,
+    )
+
+
+def test_snapshot_properties():
+    snapshot = VideoSnapshot(
+        {
+            "uri": "/videos/1",
+            "status": VideoStatus.TRANSCODING_ERROR,
+            "transcode": {"status": TranscodeStatus.ERROR},
+            "download": DOWNLOADS[:2],
+        }
+    )
+    assert not snapshot.is_available
+    assert not snapshot.is_transcode_complete
+    assert not snapshot.is_playable
+    assert snapshot.is_error
+    assert snapshot.upload_status is None
+    assert snapshot.download_link == "https://example.com/540"
+
+
+def test_one_request_answers_every_predicate(fake):
+    vclient = VimeoAPIClient(fake)
+    snapshot = vclient.get_video_snapshot("/videos/1")
+    assert snapshot.is_available
+    assert snapshot.is_transcode_complete
+    assert snapshot.is_playable
+    assert snapshot.download_link == "https://example.com/1080"
+    assert len(fake.calls) == 1
+
+
+def test_predicates_use_snapshot(fake):
+    vclient = VimeoAPIClient(fake)
+    assert vclient.get_status("/videos/1") == VideoStatus.AVAILABLE
+    assert vclient.get_transcode_status("/videos/1") == TranscodeStatus.COMPLETE
+    assert vclient.is_available("/videos/1") is True
+    assert vclient.is_playable("/videos/1") is True
+    assert vclient.get_download_link("/videos/1") == "https://example.com/1080"
+
+
+def test_concurrent_callers_share_one_request(fake):
+    vclient = VimeoAPIClient(fake)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=12) as executor:
+        futures = [
+            executor.submit(vclient.get_video_snapshot, f"/videos/{i % 2 + 1}")
+            for i in range(12)
+        ]
+        snapshots = [future.result() for future in futures]
+    assert {snapshot.uri for snapshot in snapshots} == {"/videos/1", "/videos/2"}
+    assert len(fake.calls) == 2  # noqa: PLR2004
+
+
+def test_singleflight_shares_errors():
+    singleflight = SingleFlight()
+
+    def fail():
+        msg = "boom"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="boom"):
+        singleflight.do("key", fail)
+    # The key is released once the call finishes
+    assert singleflight.do("key", lambda: 1) == 1
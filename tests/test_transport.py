@@ -0,0 +1,77 @@
+import concurrent.futures
+
+import pytest
+from vimeo.exceptions import APIRateLimitExceededFailure
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.mock_server import MockVimeoServer
+from vimeo_utils.ratelimit import RateLimitScheduler
+from vimeo_utils.retry import RetryPolicy
+from vimeo_utils.transport import VimeoTransport
+
+from tests.fakes import FakeVimeoClient
+
+
+@pytest.fixture()
+def server():
+    with MockVimeoServer(videos=300) as server:
+        yield server
+
+
+def test_client_owns_a_transport(server):
+    vclient = VimeoAPIClient(
+        server.client(), scheduler=RateLimitScheduler(max_concurrency=8)
+    )
+    assert isinstance(vclient.transport, VimeoTransport)
+    assert vclient.transport.pool_size == 8  # noqa: PLR2004
+
+
+def test_other_clients_are_called_directly():
+    assert VimeoAPIClient(FakeVimeoClient()).transport is None
+
+
+def test_speaks_pyvimeo_dialect(server):
+    with VimeoAPIClient(server.client(token="secret")) as vclient:
+        vclient.edit_video("/videos/1", {"name": "Renamed"})
+    method, path, headers = server.log[-1]
+    assert (method, path) == ("PATCH", "/videos/1")
+    assert headers["Authorization"] == "Bearer secret"
+    assert headers["Accept"] == "application/vnd.vimeo.*;version=3.4"
+    assert "gzip" in headers["Accept-Encoding"]
+    assert headers["Content-Type"] == "application/json"
+    assert server.videos["/videos/1"]["name"] == "Renamed"
+
+
+def test_connections_are_reused(server):
+    with VimeoAPIClient(
+        server.client(), scheduler=RateLimitScheduler(max_concurrency=4)
+    ) as vclient:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(vclient.get_video, [f"/videos/{i}" for i in range(1, 41)])
+            )
+        stats = vclient.transport.stats()
+    assert stats["requests"] == 40  # noqa: PLR2004
+    assert stats["connections"] <= 4  # noqa: PLR2004
+    assert stats["reuse_ratio"] >= 0.9  # noqa: PLR2004
+
+
+def test_default_timeout_is_applied(server, monkeypatch):
+    vclient = VimeoAPIClient(server.client(), timeout=(2, 7))
+    seen = []
+    original = vclient.transport.session.request
+
+    def spy(*args, **kwargs):
+        seen.append(kwargs["timeout"])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(vclient.transport.session, "request", spy)
+    vclient.get_video("/videos/1")
+    vclient.get_videos()
+    assert seen == [(2, 7), 60]
+
+
+def test_rate_limited_raises_like_pyvimeo(server):
+    server.rate_limit = server.remaining = 0
+    vclient = VimeoAPIClient(server.client(), retry_policy=RetryPolicy(max_retries=0))
+    with pytest.raises(APIRateLimitExceededFailure):
+        vclient.get_video("/videos/1")
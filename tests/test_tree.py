@@ -0,0 +1,105 @@
+import pytest
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.mock_server import MockVimeoServer
+from vimeo_utils.tree import ProjectTree
+
+SIZE = 1000
+
+
+@pytest.fixture()
+def server():
+    with MockVimeoServer(videos=0, projects=0, download_size=SIZE) as server:
+        # photos (2 videos)
+        # └── 2024 (3)
+        #     ├── january (1)
+        #     └── february (0)
+        #         └── week-1 (4)
+        # archive (0)
+        photos = server.add_project("photos")
+        year = server.add_project("2024", photos)
+        january = server.add_project("january", year)
+        february = server.add_project("february", year)
+        week = server.add_project("week-1", february)
+        server.add_project("archive")
+        for project, count in [(photos, 2), (year, 3), (january, 1), (week, 4)]:
+            for _ in range(count):
+                server.add_video(project_uri=project)
+        yield server
+
+
+@pytest.fixture()
+def vclient(server):
+    return VimeoAPIClient(server.client())
+
+
+def test_walk_projects(vclient):
+    tree = vclient.walk_projects()
+    assert [root.name for root in sorted(tree.roots, key=lambda r: r.uri)] == [
+        "photos",
+        "archive",
+    ]
+    assert tree.total_video_count == 10  # noqa: PLR2004
+    assert tree.total_size == 10 * SIZE
+
+    photos = tree.get("/users/1/projects/1")
+    assert (photos.video_count, photos.total_video_count) == (2, 10)
+    year = photos.children[0]
+    assert (year.name, year.depth, year.parent) == ("2024", 1, photos.uri)
+    assert sorted(child.name for child in year.children) == ["february", "january"]
+    week = tree.get("/users/1/projects/5")
+    assert (week.depth, week.video_count, week.size) == (3, 4, 4 * SIZE)
+
+
+def test_max_depth(vclient):
+    tree = vclient.walk_projects(max_depth=1)
+    assert max(node.depth for node in tree.nodes.values()) == 1
+    assert tree.total_video_count == 5  # noqa: PLR2004
+
+
+def test_streams_videos_per_folder(vclient):
+    seen = {
+        node.name: [video["name"] for video in videos]
+        for node, videos in vclient.iter_walk_projects(
+            root_uri="/users/1/projects/2", video_fields=["name"]
+        )
+    }
+    # Breadth first: the root, then its children, then theirs
+    assert next(iter(seen)) == "2024"
+    assert list(seen)[-1] == "week-1"
+    assert sorted(seen) == ["2024", "february", "january", "week-1"]
+    assert len(seen["week-1"]) == 4  # noqa: PLR2004
+    assert all(name.startswith("Video") for name in seen["2024"])
+
+
+def test_cycles_are_visited_once(vclient, server):
+    # Make "photos" a child of "week-1"
+    photos = server.projects["/users/1/projects/1"]
+    photos["parent_folder"] = {"uri": "/users/1/projects/5", "name": "week-1"}
+    tree = vclient.walk_projects(root_uri="/users/1/projects/1")
+    assert sorted(tree.nodes) == [f"/users/1/projects/{i}" for i in range(1, 6)]
+
+
+def test_snapshot(vclient, server, tmp_path):
+    path = tmp_path / "tree.json"
+    tree = vclient.walk_projects(snapshot_path=path)
+    requests = server.request_count
+
+    cached = vclient.walk_projects(snapshot_path=path)
+    assert server.request_count == requests
+    assert cached.total_size == tree.total_size
+    assert sorted(cached.nodes) == sorted(tree.nodes)
+    assert isinstance(ProjectTree.load(path), ProjectTree)
+
+    vclient.walk_projects(snapshot_path=path, max_age=0)
+    assert server.request_count > requests
+
+
+def test_snapshot_of_another_crawl_is_not_reused(vclient, server, tmp_path):
+    path = tmp_path / "tree.json"
+    vclient.walk_projects(snapshot_path=path, max_depth=0)
+    requests = server.request_count
+
+    tree = vclient.walk_projects(snapshot_path=path)
+    assert server.request_count > requests
+    assert any(node.depth > 0 for node in tree.nodes.values())
+    assert ProjectTree.load(path).key == {"root_uri": None, "max_depth": None}
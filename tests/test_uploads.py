@@ -0,0 +1,118 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.uploads import UploadManager
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import TusServer
+
+CHUNK_SIZE = 64 * 1024
+
+
+@pytest.fixture()
+def tus():
+    with TusServer() as server:
+        yield server
+
+
+@pytest.fixture()
+def vclient(tus):
+    return VimeoAPIClient(FakeVimeoClient(tus=tus))
+
+
+@pytest.fixture()
+def files(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"video{i}.mp4"
+        path.write_bytes(os.urandom(CHUNK_SIZE * 3 + i))
+        paths.append(str(path))
+    return paths
+
+
+def uploaded_bytes(tus, vclient, uri):
+    link = vclient.client.videos[uri]["upload"]["upload_link"]
+    return bytes(tus.uploads[link.replace(tus.url, "")])
+
+
+def test_uploads_files_concurrently(vclient, tus, files):
+    events = []
+    futures = vclient.upload_videos(
+        files,
+        params={"name": "Test"},
+        max_workers=2,
+        chunk_size=CHUNK_SIZE,
+        callback=events.append,
+    )
+    for path, future in futures.items():
+        uri = future.result(timeout=10)
+        assert uploaded_bytes(tus, vclient, uri) == Path(path).read_bytes()
+
+    done = [event for event in events if event.done]
+    assert len(done) == len(files)
+    assert all(event.percent == 100 for event in done)  # noqa: PLR2004
+    assert all(event.bytes_per_second > 0 for event in done)
+    # The first file fits in three chunks, the others need a fourth
+    assert len(tus.patches) == 15  # noqa: PLR2004
+
+
+def test_retries_and_resumes_a_dropped_chunk(vclient, tus, files):
+    tus.drop_after = 1000
+    manager = UploadManager(vclient, chunk_size=CHUNK_SIZE, retry_delay=0)
+    uri = manager.upload_file(files[0])
+    assert uploaded_bytes(tus, vclient, uri) == Path(files[0]).read_bytes()
+    # The retry carried on from the 1000 bytes which made it
+    assert tus.patches[1][1] == 1000  # noqa: PLR2004
+
+
+def test_resumes_from_state_file_after_restart(vclient, tus, files, tmp_path):
+    state_path = tmp_path / "uploads.json"
+    manager = UploadManager(vclient, chunk_size=CHUNK_SIZE, state_path=state_path)
+    # The "process" dies while sending the second chunk
+    original = manager._send_chunk  # noqa: SLF001
+    calls = []
+
+    def crash_on_second_chunk(fh, link, offset):
+        calls.append(offset)
+        if len(calls) == 2:  # noqa: PLR2004
+            msg = "crash"
+            raise RuntimeError(msg)
+        return original(fh, link, offset)
+
+    manager._send_chunk = crash_on_second_chunk  # noqa: SLF001
+    with pytest.raises(RuntimeError):
+        manager.upload_file(files[0])
+    state = json.loads(state_path.read_text())
+    assert next(iter(state.values()))["offset"] == CHUNK_SIZE
+
+    restarted = UploadManager(vclient, chunk_size=CHUNK_SIZE, state_path=state_path)
+    uri = restarted.upload_file(files[0])
+    assert uploaded_bytes(tus, vclient, uri) == Path(files[0]).read_bytes()
+    # One video was created, and the first chunk was not sent again
+    assert len(tus.uploads) == 1
+    assert [offset for _, offset, _ in tus.patches].count(0) == 1
+    assert json.loads(state_path.read_text()) == {}
+
+
+def test_starts_over_when_upload_is_gone(vclient, tus, files, tmp_path):
+    state_path = tmp_path / "uploads.json"
+    stat = Path(files[0]).stat()
+    state_path.write_text(
+        json.dumps(
+            {
+                str(Path(files[0]).resolve()): {
+                    "uri": "/videos/1",
+                    "upload_link": f"{tus.url}/upload/missing",
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                    "offset": 10,
+                }
+            }
+        )
+    )
+    manager = UploadManager(vclient, chunk_size=CHUNK_SIZE, state_path=state_path)
+    uri = manager.upload_file(files[0])
+    assert uri != "/videos/1"
@@ -1,6 +1,8 @@
 from vimeo_utils.utils import build_user_uri
 from vimeo_utils.utils import extract_page_number
+from vimeo_utils.utils import get_page_count
 from vimeo_utils.utils import get_video_id_from_uri
+from vimeo_utils.utils import select_download_link
 
 
 def test_build_user_uri():
@@ -16,3 +18,20 @@ def test_extract_page_number():
 
 def test_get_video_id_from_uri():
     assert get_video_id_from_uri("/videos/1234567890") == "1234567890"
+
+
+def test_get_page_count():
+    assert get_page_count({"total": 250, "per_page": 100}) == 3  # noqa: PLR2004
+    assert get_page_count({"total": 0, "per_page": 100}) == 1
+    assert get_page_count({"paging": {"last": "/me/videos?page=7"}}) == 7  # noqa: PLR2004
+
+
+def test_select_download_link():
+    downloads = [
+        {"quality": "sd", "height": 540, "link": "sd-540"},
+        {"quality": "hd", "height": 720, "link": "hd-720"},
+        {"quality": "hd", "height": 1080, "link": "hd-1080"},
+    ]
+    assert select_download_link(downloads) == "hd-1080"
+    assert select_download_link(downloads[:1]) == "sd-540"
+    assert select_download_link([]) is None
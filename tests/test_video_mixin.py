@@ -97,3 +97,52 @@ def test_get_all_videos(vclient):
     assert all(isinstance(video, dict) for video in response)
     expected_keys = {"uri", "name", "created_time", "status"}
     assert all(expected_keys.issubset(video.keys()) for video in response)
+
+
+def test_iter_all_videos_ordered(fake_vclient):
+    videos = list(fake_vclient.iter_all_videos(per_page=50, prefetch=2))
+    assert [video["uri"] for video in videos] == [f"/videos/{i}" for i in range(1, 251)]
+
+
+def test_iter_all_videos_unordered(fake_vclient):
+    videos = list(fake_vclient.iter_all_videos(per_page=50, ordered=False))
+    assert len({video["uri"] for video in videos}) == 250  # noqa: PLR2004
+
+
+def test_iter_all_videos_fields(fake_vclient, fake_client):
+    videos = list(fake_vclient.iter_all_videos(fields=["uri"]))
+    assert all(set(video) == {"uri"} for video in videos)
+    assert all(params["fields"] == "uri" for _, _, params in fake_client.calls)
+
+
+def test_iter_all_videos_prefetch_window(fake_vclient, fake_client):
+    iterator = fake_vclient.iter_all_videos(per_page=10, prefetch=3)
+    next(iterator)
+    iterator.close()
+    # First page plus, at most, the prefetch window
+    assert len(fake_client.calls) <= 4  # noqa: PLR2004
+
+
+def test_get_all_videos_offline(fake_vclient):
+    videos = fake_vclient.get_all_videos()
+    assert len(videos) == 250  # noqa: PLR2004
+
+
+def test_get_videos_by_uris(fake_vclient, fake_client):
+    uris = [f"/videos/{i}" for i in range(250, 0, -1)] + ["/videos/9999"]
+    videos = fake_vclient.get_videos_by_uris(uris, fields=["name"])
+    assert list(videos) == uris[:-1]
+    assert videos["/videos/7"] == {"uri": "/videos/7", "name": "Video 7"}
+    # 251 URIs, three list requests
+    assert [path for _, path, _ in fake_client.calls] == ["/videos"] * 3
+
+
+def test_get_download_links(fake_vclient, fake_client):
+    fake_client.videos["/videos/1"]["download"] = [
+        {"quality": "sd", "height": 540, "link": "sd-540"},
+        {"quality": "hd", "height": 720, "link": "hd-720"},
+        {"quality": "hd", "height": 1080, "link": "hd-1080"},
+    ]
+    links = fake_vclient.get_download_links(["/videos/1", "/videos/2"])
+    assert links == {"/videos/1": "hd-1080", "/videos/2": None}
+    assert len(fake_client.calls) == 1
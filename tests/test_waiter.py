@@ -0,0 +1,116 @@
+import concurrent.futures
+
+import pytest
+import requests
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.constants import VideoStatus
+from vimeo_utils.exceptions import TranscodingError
+from vimeo_utils.exceptions import VideoNotFoundError
+from vimeo_utils.retry import RetryPolicy
+from vimeo_utils.waiter import AvailabilityWaiter
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
+
+@pytest.fixture()
+def fake():
+    return FakeVimeoClient(videos=make_library(250, status=VideoStatus.TRANSCODING))
+
+
+@pytest.fixture()
+def vclient(fake):
+    return VimeoAPIClient(fake)
+
+
+def test_waits_for_many_videos_with_list_requests(vclient, fake):
+    uris = [f"/videos/{i}" for i in range(1, 251)]
+    for uri in uris:
+        fake.status_script[uri] = [VideoStatus.TRANSCODING, VideoStatus.AVAILABLE]
+    ready = []
+    futures = vclient.wait_until_available(
+        uris, callback=lambda uri, _: ready.append(uri), min_interval=0.01
+    )
+    done, _ = concurrent.futures.wait(futures.values(), timeout=5)
+    assert len(done) == 250  # noqa: PLR2004
+    assert all(future.result()["status"] == VideoStatus.AVAILABLE for future in done)
+    assert sorted(ready) == sorted(uris)
+    # Two polls of three batches each, instead of 500 get_video calls
+    assert len(fake.calls) == 6  # noqa: PLR2004
+    assert all(path == "/videos" for _, path, _ in fake.calls)
+
+
+def test_errors_are_reported_per_video(vclient, fake):
+    fake.status_script["/videos/1"] = [VideoStatus.TRANSCODING_ERROR]
+    fake.status_script["/videos/2"] = [VideoStatus.AVAILABLE]
+    futures = vclient.wait_until_available(["/videos/1", "/videos/2"])
+    with pytest.raises(TranscodingError):
+        futures["/videos/1"].result(timeout=5)
+    assert futures["/videos/2"].result(timeout=5)["uri"] == "/videos/2"
+
+
+def test_callback_errors_stay_with_their_video(vclient, fake):
+    uris = ["/videos/1", "/videos/2", "/videos/3"]
+    for uri in uris:
+        fake.status_script[uri] = [VideoStatus.AVAILABLE]
+
+    def callback(uri, _):
+        if uri == "/videos/1":
+            raise RuntimeError(uri)
+
+    futures = vclient.wait_until_available(uris, callback=callback)
+    for uri in uris:
+        assert futures[uri].result(timeout=5)["uri"] == uri
+
+
+def test_transient_poll_errors_are_retried(fake):
+    vclient = VimeoAPIClient(fake, retry_policy=RetryPolicy(max_retries=0))
+    fake.failures["/videos"] = [503, requests.ConnectionError("Injected")]
+    fake.status_script["/videos/1"] = [VideoStatus.AVAILABLE]
+    futures = vclient.wait_until_available(["/videos/1"], min_interval=0.01)
+    assert futures["/videos/1"].result(timeout=5)["uri"] == "/videos/1"
+    assert len(fake.calls) == 3  # noqa: PLR2004
+
+
+def test_missing_videos_fail(vclient):
+    futures = vclient.wait_until_available(["/videos/999"], min_interval=0.01)
+    with pytest.raises(VideoNotFoundError):
+        futures["/videos/999"].result(timeout=5)
+
+
+def test_overall_timeout(vclient):
+    futures = vclient.wait_until_available(
+        ["/videos/1", "/videos/2"], timeout=0.05, min_interval=0.01
+    )
+    for future in futures.values():
+        with pytest.raises(TimeoutError):
+            future.result(timeout=5)
+
+
+def test_interval_backs_off_until_stage_changes(vclient, fake):
+    fake.status_script["/videos/1"] = [
+        VideoStatus.UPLOADING,
+        VideoStatus.UPLOADING,
+        VideoStatus.UPLOADING,
+        VideoStatus.TRANSCODING,
+    ]
+    waiter = AvailabilityWaiter(
+        vclient, ["/videos/1"], min_interval=1, max_interval=3, backoff=2
+    )
+    intervals = []
+    for _ in range(4):
+        waiter.poll(["/videos/1"])
+        intervals.append(waiter.pending["/videos/1"].interval)
+    assert intervals == [1, 2, 3, 1]
+
+
+def test_block_until_available(vclient, fake):
+    fake.status_script["/videos/1"] = [VideoStatus.UPLOADING, VideoStatus.AVAILABLE]
+    vclient.block_until_available("/videos/1", interval=0)
+    assert len(fake.calls) == 2  # noqa: PLR2004
+
+
+def test_block_until_available_error(vclient, fake):
+    fake.status_script["/videos/1"] = [VideoStatus.UPLOADING_ERROR]
+    with pytest.raises(TranscodingError):
+        vclient.block_until_available("/videos/1", interval=0)
@@ -0,0 +1,124 @@
+import time
+
+import pytest
+from requests import HTTPError
+from vimeo_utils.bulk import BulkOperation
+from vimeo_utils.client import VimeoAPIClient
+from vimeo_utils.mock_server import MockVimeoServer
+from vimeo_utils.retry import RetryPolicy
+from vimeo_utils.write_buffer import WriteBuffer
+from vimeo_utils.write_buffer import deep_merge
+
+from tests.fakes import FakeVimeoClient
+from tests.fakes import make_library
+
+
+@pytest.fixture()
+def server():
+    with MockVimeoServer(videos=20, projects=2) as server:
+        yield server
+
+
+def patches(server):
+    return [path for method, path, _ in server.log if method == "PATCH"]
+
+
+def test_deep_merge():
+    assert deep_merge(
+        {"name": "A", "privacy": {"view": "anybody"}},
+        {"privacy": {"embed": "whitelist"}, "name": "B"},
+    ) == {"name": "B", "privacy": {"view": "anybody", "embed": "whitelist"}}
+
+
+def test_edits_to_one_video_are_merged(server):
+    buffer = WriteBuffer(max_delay=60)
+    vclient = VimeoAPIClient(server.client(), write_buffer=buffer)
+    futures = [
+        vclient.edit_video("/videos/1", {"name": "Renamed"}),
+        vclient.edit_video("/videos/1", {"privacy": {"view": "unlisted"}}),
+        vclient.edit_video("/videos/1", {"privacy": {"embed": "whitelist"}}),
+        vclient.edit_video("/videos/2", {"name": "Other"}),
+        vclient.edit_project(1, "Folder"),
+    ]
+    assert patches(server) == []
+    vclient.flush()
+    assert sorted(patches(server)) == ["/me/projects/1", "/videos/1", "/videos/2"]
+    assert futures[0].result() is futures[2].result()
+    assert server.videos["/videos/1"]["name"] == "Renamed"
+    assert server.videos["/videos/1"]["privacy"] == {
+        "view": "unlisted",
+        "embed": "whitelist",
+    }
+    assert buffer.requests_saved == 2  # noqa: PLR2004
+    vclient.close()
+
+
+def test_flushes_after_max_delay(server):
+    vclient = VimeoAPIClient(server.client(), write_buffer=WriteBuffer(max_delay=0.05))
+    future = vclient.edit_video("/videos/1", {"name": "Later"})
+    assert future.result(5).status_code == 200  # noqa: PLR2004
+    time.sleep(0.1)
+    assert patches(server) == ["/videos/1"]
+    vclient.close()
+
+
+def test_flushes_when_full(server):
+    buffer = WriteBuffer(max_pending=5, max_delay=60)
+    vclient = VimeoAPIClient(server.client(), write_buffer=buffer)
+    for i in range(1, 8):
+        vclient.edit_video(f"/videos/{i}", {"name": "Full"})
+    assert len(patches(server)) == 5  # noqa: PLR2004
+    assert buffer.pending() == 2  # noqa: PLR2004
+    vclient.close()
+    assert len(patches(server)) == 7  # noqa: PLR2004
+    with pytest.raises(RuntimeError):
+        vclient.edit_video("/videos/1", {"name": "Closed"})
+
+
+def test_errors_reach_every_caller(server):
+    vclient = VimeoAPIClient(
+        server.client(),
+        retry_policy=RetryPolicy(max_retries=0),
+        write_buffer=WriteBuffer(max_delay=60),
+    )
+    futures = [
+        vclient.edit_video("/videos/999", {"name": "Missing"}),
+        vclient.edit_video("/videos/999", {"description": "Missing"}),
+    ]
+    ok = vclient.edit_video("/videos/1", {"name": "Fine"})
+    vclient.flush()
+    for future in futures:
+        with pytest.raises(HTTPError):
+            future.result()
+    assert ok.result().ok
+    vclient.close()
+
+
+def test_bulk_waits_for_buffered_writes(server):
+    vclient = VimeoAPIClient(server.client(), write_buffer=WriteBuffer(max_delay=0.05))
+    operations = [
+        BulkOperation("edit_video", "/videos/1", {"name": "Bulk"}),
+        BulkOperation("edit_video", "/videos/1", {"description": "Bulk"}),
+    ]
+    results = list(vclient.bulk(operations, max_workers=2))
+    assert all(result.ok and result.result.ok for result in results)
+    assert patches(server) == ["/videos/1"]
+    vclient.close()
+
+
+def test_writes_to_one_uri_are_sent_in_order():
+    fake = FakeVimeoClient(videos=make_library(1), latency=0.1)
+    vclient = VimeoAPIClient(fake, write_buffer=WriteBuffer(max_delay=0))
+    first = vclient.edit_video("/videos/1", {"name": "First"})
+    time.sleep(0.03)
+    # Held until the first PATCH has resolved, then merged into one
+    second = vclient.edit_video("/videos/1", {"name": "Second"})
+    third = vclient.edit_video("/videos/1", {"description": "Third"})
+    vclient.flush()
+    assert third.result() is second.result()
+    assert first.done()
+    assert fake.max_in_flight == 1
+    assert len(fake.calls) == 2  # noqa: PLR2004
+    assert fake.videos["/videos/1"]["name"] == "Second"
+    assert fake.videos["/videos/1"]["description"] == "Third"
+    vclient.close()